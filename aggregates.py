@@ -0,0 +1,107 @@
+"""
+Headcounts per department, per job title and per (department, job title) pair.
+
+Headcounts is kept up to date rather than recomputed: attach it to an
+EmployeeRepository and every add, update and delete adjusts three counters in
+O(1), so showing the figures never scans the roster. It can also be built in
+one pass over the columns of an EmployeeStore, or streamed from a CSV file
+with FileHandler.iter_columns() without building an Employee per row.
+"""
+
+from collections import Counter
+from typing import Iterable, Iterator
+
+from employee import Employee
+from employee_store import EmployeeStore
+from file_handler import ErrorCallback, FileHandler, FIELDNAMES
+
+DEPARTMENT_COLUMN = FIELDNAMES.index("department")
+JOB_TITLE_COLUMN = FIELDNAMES.index("job_title")
+
+
+class Headcounts:
+    """
+    Counts employees by department, job title, and both.
+
+        headcounts = Headcounts()
+        repository.attach(headcounts)
+        headcounts.departments["Engineering"]
+
+    Attributes:
+        departments (Counter[str]): Employees per department.
+        job_titles (Counter[str]): Employees per job title.
+        pairs (Counter[tuple[str, str]]): Employees per (department, job title).
+
+    Values that no employee has any more are removed, so every count is positive.
+    """
+
+    def __init__(self, employees: Iterable[Employee] = ()):
+        self.departments: Counter[str] = Counter()
+        self.job_titles: Counter[str] = Counter()
+        self.pairs: Counter[tuple[str, str]] = Counter()
+        for employee in employees:
+            self.add(employee)
+
+    @classmethod
+    def from_store(cls, store: EmployeeStore) -> "Headcounts":
+        """
+        Counts a whole store in one pass over its dictionary codes.
+        """
+        _, _, _, (departments, department_codes), (job_titles, job_title_codes) = store.columns()
+        headcounts = cls()
+        pairs = Counter(zip(department_codes, job_title_codes))
+        headcounts._add_pairs(((departments[department], job_titles[job_title]), count)
+                              for (department, job_title), count in pairs.items())
+        return headcounts
+
+    @classmethod
+    def from_file(cls, file_path: str, on_error: ErrorCallback | None = None) -> "Headcounts":
+        """
+        Counts the employees in a CSV or snapshot file.
+
+        The file is streamed a batch of columns at a time, and rows that
+        FileHandler.iter_employees() would skip are not counted.
+        """
+        headcounts = cls()
+        for columns in FileHandler.iter_columns(file_path, on_error=on_error):
+            headcounts._add_pairs(Counter(zip(columns[DEPARTMENT_COLUMN], columns[JOB_TITLE_COLUMN])).items())
+        return headcounts
+
+    def add(self, employee: Employee):
+        """
+        Counts a new employee.
+        """
+        self.departments[employee.department] += 1
+        self.job_titles[employee.job_title] += 1
+        self.pairs[employee.department, employee.job_title] += 1
+
+    def remove(self, employee: Employee):
+        """
+        Stops counting an employee, given the details they had.
+        """
+        for counter, key in ((self.departments, employee.department), (self.job_titles, employee.job_title),
+                             (self.pairs, (employee.department, employee.job_title))):
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+
+    def clear(self):
+        self.departments.clear()
+        self.job_titles.clear()
+        self.pairs.clear()
+
+    def total(self) -> int:
+        return self.departments.total()
+
+    def rows(self) -> Iterator[tuple[str, str, int]]:
+        """
+        Yields (department, job title, count) for every pair, sorted by name.
+        """
+        for (department, job_title), count in sorted(self.pairs.items()):
+            yield department, job_title, count
+
+    def _add_pairs(self, counts: Iterable[tuple[tuple[str, str], int]]):
+        for (department, job_title), count in counts:
+            self.departments[department] += count
+            self.job_titles[job_title] += count
+            self.pairs[department, job_title] += count
@@ -0,0 +1,363 @@
+"""
+Runs slow file operations on worker threads without blocking the Tkinter GUI.
+
+Tkinter widgets may only be touched from the main thread, so workers never call
+back into the GUI directly. Instead they post messages to a bounded queue, and
+the main loop drains that queue with widget.after(). The bound also applies
+back-pressure: a worker that gets too far ahead of the GUI waits instead of
+filling memory.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Callable
+
+from employee import Employee
+from employee_store import EmployeeStore
+from file_handler import FileHandler, WriteCancelled
+from file_watcher import DataFileWatcher
+from journal import EmployeeJournal
+
+# How often the main loop checks for new messages while a task runs.
+POLL_INTERVAL_MS = 50
+# Maximum number of messages handled per poll, so the GUI stays responsive.
+MAX_MESSAGES_PER_POLL = 10
+# Maximum number of undelivered messages before the worker waits.
+MAX_PENDING_MESSAGES = 20
+# Rows per loader batch. Every batch is this size; 500 rows parse in about a
+# millisecond, so the first rows appear almost immediately without a ramp-up.
+LOAD_BATCH_SIZE = 500
+
+
+class BackgroundTask:
+    """
+    Base class for work that runs on a thread and reports back on the Tk main loop.
+
+    Subclasses implement work() (runs on the worker thread, may call post())
+    and handle() (runs on the main thread, once per posted message).
+    """
+
+    def __init__(self, widget, on_done: Callable[[bool], None] | None = None,
+                 on_error: Callable[[Exception], None] | None = None):
+        """
+        Initialises the task.
+
+        Args:
+            widget: Any Tk widget; used to schedule polling with after().
+            on_done (Callable[[bool], None] | None): Called on the main thread when
+                the task finishes, with True if it was cancelled.
+            on_error (Callable[[Exception], None] | None): Called on the main thread
+                if the worker raised an exception.
+        """
+        self.widget = widget
+        self.on_done = on_done
+        self.on_error = on_error
+        self.started_at = 0.0
+        self.finished = False
+        self._queue = queue.Queue(maxsize=MAX_PENDING_MESSAGES)
+        self._cancel_event = threading.Event()
+        self._thread = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def start(self):
+        """
+        Starts the worker thread and begins polling for its messages.
+        """
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.widget.after(POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self):
+        """
+        Asks the worker to stop. Messages it has already posted are discarded.
+        """
+        self._cancel_event.set()
+
+    def wait(self):
+        """
+        Blocks until the worker thread has finished. Its final message is still
+        delivered by the main loop as usual.
+        """
+        if self._thread is not None:
+            self._thread.join()
+
+    def elapsed(self) -> float:
+        """
+        Returns the number of seconds since the task was started.
+        """
+        return time.perf_counter() - self.started_at
+
+    def post(self, *message):
+        """
+        Sends a message to the main thread. Called from the worker.
+
+        Blocks while the queue is full, unless the task is cancelled.
+        """
+        while not self.cancelled:
+            try:
+                self._queue.put(message, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def work(self):
+        """
+        Does the task's work on the worker thread.
+        """
+        raise NotImplementedError
+
+    def handle(self, *message):
+        """
+        Handles one message from the worker on the main thread.
+        """
+        raise NotImplementedError
+
+    def _run(self):
+        try:
+            self.work()
+        except Exception as e:
+            self._queue.put(("_error", e))
+        else:
+            self._queue.put(("_done",))
+
+    def _poll(self):
+        """
+        Drains pending messages on the main thread and reschedules itself.
+        """
+        for _ in range(MAX_MESSAGES_PER_POLL):
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                self.widget.after(POLL_INTERVAL_MS, self._poll)
+                return
+            if message[0] == "_done":
+                self.finished = True
+                if self.on_done is not None:
+                    self.on_done(self.cancelled)
+                return
+            if message[0] == "_error":
+                self.finished = True
+                if self.on_error is not None:
+                    self.on_error(message[1])
+                return
+            if not self.cancelled:
+                self.handle(*message)
+        # More messages may be waiting, so come back as soon as Tk is idle.
+        self.widget.after(1, self._poll)
+
+
+class BackgroundLoader(BackgroundTask):
+    """
+    Streams employees from a CSV file to the GUI in batches.
+
+    Attributes:
+        file_path (str): The file being loaded.
+        total_bytes (int): The size of the file when loading started.
+        bytes_read (int): Approximately how much of the file has been parsed.
+        rows_loaded (int): How many employees have been delivered to on_batch.
+        end_offset (int): Once the load has finished, the byte offset where
+            reading stopped; rows appended to the file later start there.
+    """
+
+    def __init__(self, widget, file_path: str, on_batch: Callable[[list[Employee]], None],
+                 batch_size: int = LOAD_BATCH_SIZE, **kwargs):
+        """
+        Initialises the loader.
+
+        Args:
+            widget: Any Tk widget; used to schedule polling with after().
+            file_path (str): The CSV file to load.
+            on_batch (Callable[[list[Employee]], None]): Called on the main thread
+                with each batch of employees.
+            batch_size (int): The number of employees per batch.
+            **kwargs: on_done and on_error, as for BackgroundTask.
+        """
+        super().__init__(widget, **kwargs)
+        self.file_path = file_path
+        self.on_batch = on_batch
+        self.batch_size = batch_size
+        self.total_bytes = 0
+        self.bytes_read = 0
+        self.rows_loaded = 0
+        self.end_offset = 0
+        self._worker_bytes_read = 0
+
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed()
+        return self.rows_loaded / elapsed if elapsed > 0 else 0.0
+
+    def percent_read(self) -> float:
+        if not self.total_bytes:
+            return 100.0
+        return min(100.0, 100.0 * self.bytes_read / self.total_bytes)
+
+    def work(self):
+        try:
+            self.total_bytes = os.path.getsize(self.file_path)
+        except OSError:
+            self.total_bytes = 0
+        batches = FileHandler.iter_employees(self.file_path, batch_size=self.batch_size,
+                                             on_progress=self._record_progress)
+        for batch in batches:
+            if self.cancelled:
+                batches.close()
+                return
+            self.post(batch, self._worker_bytes_read)
+        # At the end of the file the reported position is exact.
+        self.end_offset = self._worker_bytes_read
+
+    def handle(self, batch: list[Employee], bytes_read: int):
+        self.rows_loaded += len(batch)
+        self.bytes_read = bytes_read
+        self.on_batch(batch)
+
+    def _record_progress(self, bytes_read: int):
+        self._worker_bytes_read = bytes_read
+
+
+class BackgroundAppendReader(BackgroundTask):
+    """
+    Reads the rows appended to a watched CSV file and streams them to the GUI.
+
+    Attributes:
+        rows_loaded (int): How many employees have been delivered to on_batch.
+    """
+
+    def __init__(self, widget, watcher: DataFileWatcher, on_batch: Callable[[list[Employee]], None],
+                 batch_size: int = LOAD_BATCH_SIZE, **kwargs):
+        """
+        Initialises the reader.
+
+        Args:
+            widget: Any Tk widget; used to schedule polling with after().
+            watcher (DataFileWatcher): The watcher whose check() reported APPENDED.
+                It must not be used elsewhere until the task finishes.
+            on_batch (Callable[[list[Employee]], None]): Called on the main thread
+                with each batch of employees.
+            batch_size (int): The largest number of employees per batch.
+            **kwargs: on_done and on_error, as for BackgroundTask.
+        """
+        super().__init__(widget, **kwargs)
+        self.watcher = watcher
+        self.on_batch = on_batch
+        self.batch_size = batch_size
+        self.rows_loaded = 0
+
+    def work(self):
+        batches = self.watcher.read_appended(batch_size=self.batch_size)
+        for batch in batches:
+            if self.cancelled:
+                batches.close()
+                return
+            self.post(batch)
+
+    def handle(self, batch: list[Employee]):
+        self.rows_loaded += len(batch)
+        self.on_batch(batch)
+
+
+class BackgroundExporter(BackgroundTask):
+    """
+    Writes a snapshot of the roster to a CSV file on a worker thread.
+
+    The file is written with FileHandler.write_employees_atomic, so a cancelled
+    or failed export never leaves a partial file behind.
+
+    Attributes:
+        file_path (str): The destination file.
+        total_rows (int): The number of employees being exported.
+        rows_written (int): How many employees have been written so far.
+        completed (bool): Whether the file was replaced. Set on the worker
+                          thread, so a cancel that arrives after the file is in
+                          place still finds it True.
+        bytes_written (int): The size of the file written, once completed.
+    """
+
+    def __init__(self, widget, file_path: str, employees: EmployeeStore,
+                 on_progress: Callable[[], None] | None = None,
+                 precondition: Callable[[], bool] | None = None, **kwargs):
+        """
+        Initialises the exporter.
+
+        Args:
+            widget: Any Tk widget; used to schedule polling with after().
+            file_path (str): The CSV file to write.
+            employees (EmployeeStore): A snapshot of the employees to export. It
+                must not be changed while the export runs.
+            on_progress (Callable[[], None] | None): Called on the main thread
+                whenever rows_written changes.
+            precondition (Callable[[], bool] | None): Called on the worker thread
+                before each chunk and just before the file is replaced; if it
+                returns False the export is abandoned and the file left alone.
+            **kwargs: on_done and on_error, as for BackgroundTask.
+        """
+        super().__init__(widget, **kwargs)
+        self.file_path = file_path
+        self.employees = employees
+        self.on_progress = on_progress
+        self.precondition = precondition
+        self.total_rows = len(employees)
+        self.rows_written = 0
+        self.completed = False
+        self.bytes_written = 0
+
+    def percent_written(self) -> float:
+        if not self.total_rows:
+            return 100.0
+        return 100.0 * self.rows_written / self.total_rows
+
+    def work(self):
+        try:
+            FileHandler.write_employees_atomic(self.file_path, self.employees, on_progress=self.post,
+                                               should_cancel=self._should_stop, on_replace=self._record_size)
+        except WriteCancelled:
+            return
+        self.completed = True
+
+    def _should_stop(self) -> bool:
+        return self.cancelled or (self.precondition is not None and not self.precondition())
+
+    def _record_size(self, size: int):
+        self.bytes_written = size
+
+    def handle(self, rows_written: int):
+        self.rows_written = rows_written
+        if self.on_progress is not None:
+            self.on_progress()
+
+
+class BackgroundJournalWriter(BackgroundTask):
+    """
+    Appends a batch of pending changes to the journal on a worker thread.
+
+    Attributes:
+        records (list[list[str]]): The entries being written, from PendingChanges.take().
+        written (bool): Whether every entry is on disk. Set on the worker thread,
+                        so after wait() it is known before on_done runs.
+    """
+
+    def __init__(self, widget, journal: EmployeeJournal, records: list[list[str]], **kwargs):
+        """
+        Initialises the writer.
+
+        Args:
+            widget: Any Tk widget; used to schedule polling with after().
+            journal (EmployeeJournal): The journal to append to. Nothing else may
+                use it until the task finishes.
+            records (list[list[str]]): The entries to write.
+            **kwargs: on_done and on_error, as for BackgroundTask.
+        """
+        super().__init__(widget, **kwargs)
+        self.journal = journal
+        self.records = records
+        self.written = False
+
+    def work(self):
+        self.journal.append_records(self.records)
+        self.written = True
@@ -0,0 +1,11 @@
+"""
+Performance benchmarks for the Employee Management System.
+
+Run individual benchmarks from the repository root, for example:
+    python -m benchmarks.memory_benchmark --rows 1000000
+
+The suite times the main code paths at several roster sizes, saves the results
+as JSON and compares them with a baseline:
+    python -m benchmarks.suite run --output results.json
+    python -m benchmarks.suite compare baseline.json results.json
+"""
@@ -0,0 +1,62 @@
+"""
+Compares plain CSV with gzip, bz2 and lzma compressed CSV.
+
+Writes the same synthetic roster in each format with
+FileHandler.write_employees_atomic, reads it back with
+FileHandler.read_employees, and reports for each codec:
+
+    MiB          The size on disk, which is also the number of bytes a read
+                 transfers.
+    write s      Wall time of the write.
+    read s       Wall time of the read.
+    share read s The read time plus the time to move the file over a network
+                 share of --bandwidth MiB/s, since on a slow share the
+                 transfer dominates.
+
+Usage:
+    python -m benchmarks.compression_benchmark --rows 1000000 --bandwidth 10
+"""
+
+import argparse
+import os
+import tempfile
+
+from benchmarks.snapshot_benchmark import best_time
+from benchmarks.synthetic import generate_employees
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+
+FILE_NAMES = {
+    "plain": "employees.csv",
+    "gzip": "employees.csv.gz",
+    "bz2": "employees.csv.bz2",
+    "lzma": "employees.csv.xz",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="number of synthetic employees")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the best is reported")
+    parser.add_argument("--bandwidth", type=float, default=10.0,
+                        help="network share throughput in MiB/s, for the share read column")
+    args = parser.parse_args()
+
+    store = EmployeeStore(generate_employees(args.rows))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"{args.rows:,} rows; share bandwidth {args.bandwidth:g} MiB/s")
+        print(f"{'codec':<8}{'MiB':>10}{'ratio':>8}{'write s':>10}{'read s':>10}{'share read s':>14}")
+        plain_size = None
+        for codec, name in FILE_NAMES.items():
+            file_path = os.path.join(temp_dir, name)
+            write_seconds = best_time(lambda: FileHandler.write_employees_atomic(file_path, store), args.repeat)
+            read_seconds = best_time(lambda: FileHandler.read_employees(file_path), args.repeat)
+            size = os.path.getsize(file_path)
+            plain_size = plain_size or size
+            mebibytes = size / 2**20
+            print(f"{codec:<8}{mebibytes:>10.1f}{plain_size / size:>7.1f}x{write_seconds:>10.2f}"
+                  f"{read_seconds:>10.2f}{read_seconds + mebibytes / args.bandwidth:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares the memory used by different in-memory layouts of the roster.
+
+Layouts measured:
+    dict-list: a list of objects with a per-instance __dict__ (the original layout).
+    slots-list: a list of Employee objects using __slots__.
+    store: the columnar EmployeeStore.
+
+Usage:
+    python -m benchmarks.memory_benchmark --rows 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from benchmarks.synthetic import generate_employees
+from employee_store import EmployeeStore
+
+
+class DictEmployee:
+    """
+    Mirrors the original Employee class, which had a per-instance __dict__.
+    """
+    def __init__(self, employee_id, first_name, last_name, department, job_title):
+        self.employee_id = employee_id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.department = department
+        self.job_title = job_title
+
+
+def build_dict_list(rows: int) -> list:
+    return [DictEmployee(*emp.to_list()) for emp in generate_employees(rows)]
+
+
+def build_slots_list(rows: int) -> list:
+    return list(generate_employees(rows))
+
+
+def build_store(rows: int) -> EmployeeStore:
+    return EmployeeStore(generate_employees(rows))
+
+
+LAYOUTS = {
+    "dict-list": build_dict_list,
+    "slots-list": build_slots_list,
+    "store": build_store,
+}
+
+
+def measure(builder, rows: int) -> int:
+    """
+    Returns the number of bytes still allocated by the structure `builder` creates.
+    """
+    gc.collect()
+    tracemalloc.start()
+    data = builder(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="number of synthetic employees")
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'layout':<12}{'MiB':>10}{'bytes/row':>12}{'vs dict-list':>14}")
+    for name, builder in LAYOUTS.items():
+        used = measure(builder, args.rows)
+        baseline = baseline or used
+        print(f"{name:<12}{used / 2**20:>10.1f}{used / args.rows:>12.1f}{used / baseline:>13.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Measures how parallel CSV parsing scales with the number of worker processes.
+
+Writes a synthetic roster to a temporary CSV file, then times
+FileHandler.read_store (the sequential reader) and
+parallel_reader.read_store_parallel with 1, 2, ... up to --max-workers processes.
+
+Usage:
+    python -m benchmarks.parallel_benchmark --rows 1000000 --max-workers 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import generate_employees
+from file_handler import FileHandler
+from parallel_reader import read_store_parallel
+
+
+def time_once(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of synthetic employees")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="largest worker count to try (default: CPU count)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, "employees.csv")
+        FileHandler.write_employees_atomic(csv_path, generate_employees(args.rows))
+        print(f"{args.rows:,} rows, {os.path.getsize(csv_path) / 2**20:.1f} MiB, {os.cpu_count()} CPUs")
+
+        sequential = time_once(lambda: FileHandler.read_store(csv_path))
+        print(f"{'reader':<14}{'seconds':>10}{'rows/sec':>14}{'speedup':>10}")
+        print(f"{'sequential':<14}{sequential:>10.3f}{args.rows / sequential:>14,.0f}{1:>9.1f}x")
+        for workers in range(1, args.max_workers + 1):
+            seconds = time_once(lambda: read_store_parallel(csv_path, workers=workers))
+            print(f"{f'{workers} worker(s)':<14}{seconds:>10.3f}{args.rows / seconds:>14,.0f}"
+                  f"{sequential / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Measures the requests per second a local query server answers.
+
+Unless --url names a running instance, a synthetic roster of --rows employees
+is written to a temporary CSV file and served by "python -m cli serve" in a
+separate process, so the clients and the server do not share a GIL. Each
+scenario then runs for --duration seconds with --clients threads, each on
+its own kept-alive connection, and reports:
+
+    requests/s   Completed requests per second over all clients.
+    p50 ms       Median latency.
+    p99 ms       99th percentile latency.
+
+Scenarios:
+
+    lookup       /employees/<id> for random IDs.
+    page         /employees?department=<random>&offset=<random> pages of 100.
+    revalidate   The same page with If-None-Match, answered 304.
+    large page   /employees?limit=10000, which is streamed.
+
+The clients are Python threads, so on a fast machine they may saturate
+before the server does; raise --clients and compare against a second run
+to tell.
+
+Usage:
+    python -m benchmarks.server_benchmark --rows 1000000 --clients 16
+    python -m benchmarks.server_benchmark --url http://127.0.0.1:8765
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+from benchmarks.synthetic import DEPARTMENTS, write_roster
+
+STARTUP_TIMEOUT = 120.0
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def wait_until_serving(host: str, port: int, server: subprocess.Popen):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit(f"The server exited with status {server.returncode}.")
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    sys.exit("The server did not start in time.")
+
+
+def run_scenario(host: str, port: int, make_request, clients: int, duration: float) -> list[float]:
+    """
+    Sends requests from `clients` threads for `duration` seconds and returns
+    every request's latency in seconds.
+
+    make_request(rng) returns the (path, headers) of the next request.
+    """
+    latencies: list[list[float]] = [[] for _ in range(clients)]
+    deadline = time.perf_counter() + duration
+
+    def client(index: int):
+        rng = random.Random(index)
+        connection = http.client.HTTPConnection(host, port, timeout=30)
+        timings = latencies[index]
+        try:
+            while (start := time.perf_counter()) < deadline:
+                path, headers = make_request(rng)
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status not in (200, 304):
+                    raise RuntimeError(f"GET {path} answered {response.status}.")
+                timings.append(time.perf_counter() - start)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latency for timings in latencies for latency in timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="a running server to measure instead of starting one")
+    parser.add_argument("--rows", type=int, default=100_000, help="number of synthetic employees")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent client connections")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario")
+    args = parser.parse_args()
+
+    server = None
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.url:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        else:
+            csv_path = os.path.join(temp_dir, "employees.csv")
+            write_roster(csv_path, args.rows)
+            host, port = "127.0.0.1", free_port()
+            project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            server = subprocess.Popen([sys.executable, "-m", "cli", "serve", "--source", csv_path,
+                                       "--host", host, "--port", str(port)], cwd=project_dir)
+            wait_until_serving(host, port, server)
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            connection.request("GET", "/status")
+            status = json.loads(connection.getresponse().read())
+            connection.request("GET", "/departments")
+            departments = list(json.loads(connection.getresponse().read())["departments"]) or list(DEPARTMENTS)
+            connection.request("GET", "/employees?limit=1")
+            first_id = int(json.loads(connection.getresponse().read())["employees"][0]["employee_id"])
+            page_path = f"/employees?department={quote(departments[0])}"
+            connection.request("GET", page_path)
+            response = connection.getresponse()
+            response.read()
+            etag = response.getheader("ETag")
+            connection.close()
+            total = status["employees"]
+
+            scenarios = {
+                "lookup": lambda rng: (f"/employees/{first_id + rng.randrange(total)}", {}),
+                "page": lambda rng: (f"/employees?department={quote(rng.choice(departments))}"
+                                     f"&offset={rng.randrange(max(1, total // len(departments)))}", {}),
+                "revalidate": lambda rng: (page_path, {"If-None-Match": etag}),
+                "large page": lambda rng: ("/employees?limit=10000", {}),
+            }
+            print(f"{total:,} employees; {args.clients} clients; {args.duration:g} s per scenario")
+            print(f"{'scenario':<14}{'requests':>10}{'requests/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+            for name, make_request in scenarios.items():
+                latencies = run_scenario(host, port, make_request, args.clients, args.duration)
+                if not latencies:
+                    print(f"{name:<14}{0:>10}")
+                    continue
+                p50 = latencies[len(latencies) // 2] * 1000
+                p99 = latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1000
+                print(f"{name:<14}{len(latencies):>10,}{len(latencies) / args.duration:>12,.0f}"
+                      f"{p50:>10.2f}{p99:>10.2f}")
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares load times of the CSV and binary snapshot formats.
+
+Writes the same synthetic roster as CSV and as a snapshot, then times:
+    csv read_employees: FileHandler.read_employees on the CSV file.
+    csv read_store: FileHandler.read_store on the CSV file.
+    snap read_employees: FileHandler.read_employees on the snapshot.
+    snap read_store: FileHandler.read_store on the snapshot (the hot path).
+
+Usage:
+    python -m benchmarks.snapshot_benchmark --rows 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import generate_employees
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+
+
+def best_time(function, repeat: int) -> float:
+    """
+    Returns the fastest of `repeat` runs of function(), in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="number of synthetic employees")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the best is reported")
+    args = parser.parse_args()
+
+    store = EmployeeStore(generate_employees(args.rows))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, "employees.csv")
+        snap_path = os.path.join(temp_dir, "employees.snap")
+        FileHandler.write_employees(csv_path, store)
+        FileHandler.write_employees(snap_path, store)
+
+        cases = {
+            "csv read_employees": lambda: FileHandler.read_employees(csv_path),
+            "csv read_store": lambda: FileHandler.read_store(csv_path),
+            "snap read_employees": lambda: FileHandler.read_employees(snap_path),
+            "snap read_store": lambda: FileHandler.read_store(snap_path),
+        }
+        print(f"{args.rows:,} rows; csv {os.path.getsize(csv_path) / 2**20:.1f} MiB, "
+              f"snapshot {os.path.getsize(snap_path) / 2**20:.1f} MiB")
+        print(f"{'case':<22}{'seconds':>10}{'rows/sec':>14}{'speedup':>10}")
+        baseline = None
+        for name, function in cases.items():
+            seconds = best_time(function, args.repeat)
+            baseline = baseline or seconds
+            print(f"{name:<22}{seconds:>10.3f}{args.rows / seconds:>14,.0f}{baseline / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
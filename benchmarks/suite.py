@@ -0,0 +1,187 @@
+"""
+Times the main code paths on synthetic rosters and tracks regressions.
+
+For each roster size, a synthetic roster is written to a temporary CSV file
+and these cases are timed (the best of --repeat runs is kept):
+
+    read_employees     FileHandler.read_employees on the CSV file.
+    write_employees    FileHandler.write_employees to a new CSV file.
+    write_atomic       FileHandler.write_employees_atomic to a new CSV file.
+    duplicate_check    BatchValidator over the whole roster, which includes
+                       the duplicate-ID check.
+    repository_index   EmployeeRepository.from_store, which builds the ID index
+                       and rejects duplicate IDs.
+    refresh_virtual    EmployeeApp.refresh_treeview with the table in virtual
+                       mode (as the app runs it), with the Treeview mocked.
+    refresh_full       The same with every row inserted into the mocked Treeview.
+                       Skipped above --max-full-refresh rows.
+
+Results are written as JSON. "compare" reports the change of every case
+against a saved baseline and exits with status 1 if any case got slower by
+more than the threshold.
+
+Usage:
+    python -m benchmarks.suite run --sizes 10000 100000 1000000 --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Callable
+from unittest.mock import MagicMock
+
+from benchmarks.snapshot_benchmark import best_time
+from benchmarks.synthetic import write_roster
+from employee_repository import EmployeeRepository
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+from main import EmployeeApp
+from validator import BatchValidator
+from virtual_treeview import EmployeeTable, RowWindow
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+# Rows visible in the mocked virtual table, about one window's worth.
+VISIBLE_ROWS = 40
+
+
+def mocked_app(source, virtual: bool) -> SimpleNamespace:
+    """
+    Returns a stand-in for EmployeeApp whose table draws into a mocked Treeview,
+    so refresh_treeview can run without a display.
+    """
+    table = EmployeeTable.__new__(EmployeeTable)
+    table.source = source
+    table.virtual = virtual
+    table.window = RowWindow(size=VISIBLE_ROWS)
+    table.tree = MagicMock()
+    table.tree.get_children.return_value = ()
+    table.scrollbar = MagicMock()
+    return SimpleNamespace(table=table)
+
+
+def plain_columns(store: EmployeeStore) -> list[list[str]]:
+    """
+    Returns the store's columns with departments and job titles decoded.
+    """
+    employee_ids, first_names, last_names, departments, job_titles = store.columns()
+    return [employee_ids, first_names, last_names,
+            *([values[code] for code in codes] for values, codes in (departments, job_titles))]
+
+
+def cases_for(csv_path: str, output_path: str, store: EmployeeStore,
+              full_refresh: bool) -> dict[str, Callable[[], object]]:
+    """
+    Returns the benchmark cases for one roster, by name.
+    """
+    repository = EmployeeRepository.from_store(store.copy())
+    columns = plain_columns(store)
+    cases = {
+        "read_employees": lambda: FileHandler.read_employees(csv_path),
+        "write_employees": lambda: FileHandler.write_employees(output_path, store),
+        "write_atomic": lambda: FileHandler.write_employees_atomic(output_path, store),
+        "duplicate_check": lambda: BatchValidator().validate_columns(columns),
+        "repository_index": lambda: EmployeeRepository.from_store(store),
+        "refresh_virtual": lambda: EmployeeApp.refresh_treeview(mocked_app(repository, virtual=True)),
+    }
+    if full_refresh:
+        cases["refresh_full"] = lambda: EmployeeApp.refresh_treeview(mocked_app(repository, virtual=False))
+    return cases
+
+
+def run(sizes: list[int], repeat: int, max_full_refresh: int, only: list[str] | None = None) -> dict:
+    """
+    Runs every case for every size and returns the results document.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, "employees.csv")
+        output_path = os.path.join(temp_dir, "output.csv")
+        for size in sizes:
+            write_roster(csv_path, size)
+            store = FileHandler.read_store(csv_path)
+            for name, function in cases_for(csv_path, output_path, store, size <= max_full_refresh).items():
+                if only and name not in only:
+                    continue
+                seconds = best_time(function, repeat)
+                results[f"{name}@{size}"] = {"case": name, "rows": size, "seconds": seconds,
+                                             "rows_per_sec": size / seconds if seconds else None}
+                print(f"{name:<18}{size:>12,}{seconds:>10.4f}s{size / max(seconds, 1e-9):>16,.0f} rows/sec",
+                      flush=True)
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Prints how each case changed against the baseline and returns the keys
+    of the cases that slowed down by more than `threshold` (0.1 = 10%).
+    """
+    regressions = []
+    print(f"{'case':<26}{'baseline':>12}{'current':>12}{'change':>10}")
+    for key, result in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None:
+            print(f"{key:<26}{'-':>12}{result['seconds']:>11.4f}s{'new':>10}")
+            continue
+        change = result["seconds"] / before["seconds"] - 1 if before["seconds"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<26}{before['seconds']:>11.4f}s{result['seconds']:>11.4f}s{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time every case and write the results as JSON")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                            help="roster sizes, e.g. 10000 100000 1000000 10000000")
+    run_parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the best is kept")
+    run_parser.add_argument("--max-full-refresh", type=int, default=1_000_000,
+                            help="largest roster to time refresh_full on")
+    run_parser.add_argument("--only", nargs="+", help="run only these cases")
+    run_parser.add_argument("--output", default="benchmark_results.json", help="where to write the results")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline", help="results JSON to compare against")
+    compare_parser.add_argument("current", help="results JSON to check")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="slow-down that counts as a regression (0.1 = 10%%)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        document = run(args.sizes, args.repeat, args.max_full_refresh, args.only)
+        with open(args.output, mode='w', encoding='utf-8') as file:
+            json.dump(document, file, indent=2)
+        print(f"Results written to {args.output}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+    with open(args.current, encoding='utf-8') as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Generates synthetic employee rosters for benchmarks.
+
+Usage:
+    python -m benchmarks.synthetic roster.csv --rows 10000000
+"""
+
+import argparse
+import random
+from typing import Iterator
+
+from employee import Employee
+from file_handler import FileHandler
+
+FIRST_NAMES = ["James", "Alice", "Bob", "Charlie", "Diana", "Ethan", "Fiona",
+               "George", "Hannah", "Ian", "Jane", "Kevin", "Laura", "Mohammed",
+               "Nina", "Oliver", "Priya", "Quentin", "Rosa", "Samuel"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Miller", "Davis",
+              "Garcia", "Rodriguez", "Wilson", "Martinez", "Anderson", "Taylor",
+              "Thomas", "Moore", "Jackson", "Martin", "Lee", "Thompson"]
+DEPARTMENTS = {
+    "Engineering": ["Software Engineer", "Senior Software Engineer", "QA Tester"],
+    "HR": ["HR Manager", "Recruiter"],
+    "IT": ["IT Manager", "Systems Administrator"],
+    "Marketing": ["Marketing Specialist", "Content Creator"],
+    "Sales": ["Sales Representative", "Account Manager"],
+    "Finance": ["Accountant", "Financial Analyst"],
+}
+
+
+def generate_employees(count: int, seed: int = 42) -> Iterator[Employee]:
+    """
+    Yields `count` employees with unique sequential IDs and random details.
+
+    Args:
+        count (int): The number of employees to generate.
+        seed (int): Seed for the random generator, so runs are repeatable.
+
+    Returns:
+        Iterator[Employee]: The generated employees.
+    """
+    rng = random.Random(seed)
+    departments = list(DEPARTMENTS)
+    for i in range(count):
+        department = rng.choice(departments)
+        # Build new string objects for every row, like a CSV reader would.
+        yield Employee(
+            str(100000 + i),
+            "".join(rng.choice(FIRST_NAMES)),
+            "".join(rng.choice(LAST_NAMES)),
+            "".join(department),
+            "".join(rng.choice(DEPARTMENTS[department]))
+        )
+
+
+def write_roster(file_path: str, count: int, seed: int = 42) -> int:
+    """
+    Writes a synthetic roster of `count` employees to a CSV or snapshot file.
+
+    Rows are streamed, so rosters larger than memory can be generated.
+
+    Returns:
+        int: The number of employees written.
+    """
+    return FileHandler.write_employees_atomic(file_path, generate_employees(count, seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Writes a synthetic employee roster.")
+    parser.add_argument("output", help="the CSV (or .snap) file to write")
+    parser.add_argument("--rows", type=int, default=100_000, help="number of synthetic employees")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args()
+    written = write_roster(args.output, args.rows, args.seed)
+    print(f"Wrote {written:,} employees to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures the throughput of batch validation.
+
+Times validator.BatchValidator on synthetic rows, in batches, both for clean
+data and with one row in a hundred broken, then the cost validation adds to
+FileHandler.iter_employees on a CSV file.
+
+Usage:
+    python -m benchmarks.validation_benchmark --rows 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.snapshot_benchmark import best_time
+from benchmarks.synthetic import generate_employees
+from file_handler import FileHandler
+from validator import BatchValidator
+
+
+def validate_in_batches(rows: list[list[str]], batch_size: int):
+    validator = BatchValidator()
+    for start in range(0, len(rows), batch_size):
+        validator.validate(rows[start:start + batch_size])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of synthetic employees")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="rows per validate() call")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the best is reported")
+    args = parser.parse_args()
+
+    clean = [employee.to_list() for employee in generate_employees(args.rows)]
+    broken = [row.copy() for row in clean]
+    for index in range(0, args.rows, 100):
+        broken[index][index % 5] = ""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, "employees.csv")
+        FileHandler.write_employees_atomic(csv_path, generate_employees(args.rows))
+
+        cases = {
+            "validate clean rows": lambda: validate_in_batches(clean, args.batch_size),
+            "validate 1% bad rows": lambda: validate_in_batches(broken, args.batch_size),
+            "csv read, no validation": lambda: list(FileHandler.iter_employees(csv_path, batch_size=args.batch_size,
+                                                                               validate=False)),
+            "csv read, validated": lambda: list(FileHandler.iter_employees(csv_path, batch_size=args.batch_size)),
+        }
+        print(f"{args.rows:,} rows in batches of {args.batch_size:,}")
+        print(f"{'case':<26}{'seconds':>10}{'rows/sec':>14}")
+        for name, function in cases.items():
+            seconds = best_time(function, args.repeat)
+            print(f"{name:<26}{seconds:>10.3f}{args.rows / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
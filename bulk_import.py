@@ -0,0 +1,203 @@
+"""
+Merges several CSV extracts into employees.csv, removing duplicate employees.
+
+HR extracts overlap and each can be larger than memory, so the merge is an
+external merge sort:
+
+    1. Every source is streamed in runs of RUN_ROWS rows. Each run is sorted by
+       employee ID in memory and written to a temporary run file.
+    2. The run files are merged with heapq.merge, MERGE_FAN_IN at a time, until
+       one pass can merge them all.
+    3. The final pass groups rows with the same ID, keeps one of them according
+       to the conflict rule, and streams the result to the destination with
+       FileHandler.write_employees_atomic().
+
+Memory use is bounded by RUN_ROWS rows plus one buffered row per open run file,
+however many rows come in. Temporary files are created next to the
+destination, so they are on the same disk.
+
+Rows are ranked by where they were read: the destination's existing rows
+first, then each source in the order given, in file order. With LAST_WINS the
+highest-ranked row for an ID is kept; with FIRST_WINS the lowest. The merged
+file is written in employee ID order.
+
+Usage:
+    python -m bulk_import extract1.csv extract2.csv --into employees.csv --conflict last
+"""
+
+import argparse
+import csv
+import heapq
+import logging
+import os
+import tempfile
+from contextlib import ExitStack
+from itertools import groupby, islice
+from typing import Callable, Iterable, Iterator, NamedTuple, Sequence
+
+from employee import Employee
+from file_handler import FileHandler
+from sort_orders import id_sort_key
+from validator import BatchValidator
+
+LAST_WINS = "last"
+FIRST_WINS = "first"
+
+# Rows sorted in memory per run.
+RUN_ROWS = 200_000
+# Run files merged at once; more runs are merged in several passes.
+MERGE_FAN_IN = 64
+
+# Signature of the callback used to report rejected rows:
+# on_error(file_path, line_number, row, error)
+ImportErrorCallback = Callable[[str, int, dict, Exception], None]
+
+
+class MergeResult(NamedTuple):
+    """
+    What a bulk import did.
+
+    Attributes:
+        rows_read (int): Valid rows read from every input, including the destination.
+        rows_written (int): Employees in the merged file.
+        duplicates (int): Rows dropped because another row had the same ID.
+        rows_rejected (int): Rows skipped because they failed validation.
+    """
+    rows_read: int
+    rows_written: int
+    duplicates: int
+    rows_rejected: int
+
+
+def _log_rejected_row(file_path: str, line_number: int, row: dict, error: Exception):
+    logging.warning(f"Skipping row on line {line_number} of {file_path}: {error}")
+
+
+def _run_key(record: list[str]) -> tuple[int, str, int]:
+    """
+    Orders run records by employee ID, then by rank. A record is [rank, *fields].
+    """
+    return (*id_sort_key(record[1]), int(record[0]))
+
+
+def _write_run(directory: str, records: Iterable[list]) -> str:
+    """
+    Writes already sorted records to a new run file and returns its path.
+    """
+    descriptor, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with open(descriptor, mode='w', newline='', encoding='utf-8') as file:
+        csv.writer(file).writerows(records)
+    return path
+
+
+def _merge_runs(paths: list[str]) -> Iterator[list[str]]:
+    """
+    Yields the records of several run files in sorted order, then deletes the files.
+    """
+    with ExitStack() as stack:
+        readers = [csv.reader(stack.enter_context(open(path, mode='r', newline='', encoding='utf-8')))
+                   for path in paths]
+        yield from heapq.merge(*readers, key=_run_key)
+    for path in paths:
+        os.remove(path)
+
+
+def merge_csv_files(sources: Sequence[str], destination: str, conflict: str = LAST_WINS,
+                    include_destination: bool = True, on_error: ImportErrorCallback | None = None,
+                    run_rows: int | None = None) -> MergeResult:
+    """
+    Merges CSV files into the destination, keeping one row per employee ID.
+
+    Args:
+        sources (Sequence[str]): The CSV files to import, lowest rank first.
+        destination (str): The CSV file to write, e.g. employees.csv. It is
+                           replaced atomically once the merge is complete.
+        conflict (str): LAST_WINS or FIRST_WINS; decides which row survives
+                        when several share an ID.
+        include_destination (bool): If True, the destination's current rows
+                                    take part in the merge, ranked first.
+        on_error (ImportErrorCallback | None): Called for each row that fails
+                                               validation. Defaults to logging a warning.
+        run_rows (int | None): Rows per sorted run; defaults to RUN_ROWS.
+
+    Returns:
+        MergeResult: Counts of the rows read, written, deduplicated and rejected.
+
+    Raises:
+        ValueError: If conflict is not LAST_WINS or FIRST_WINS.
+        FileNotFoundError: If a source file does not exist.
+    """
+    if conflict not in (LAST_WINS, FIRST_WINS):
+        raise ValueError(f"conflict must be {LAST_WINS!r} or {FIRST_WINS!r}, not {conflict!r}.")
+    if on_error is None:
+        on_error = _log_rejected_row
+    for source in sources:
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"{source} does not exist.")
+    inputs = ([destination] if include_destination and os.path.exists(destination) else []) + list(sources)
+    run_rows = run_rows or RUN_ROWS
+
+    rejected = 0
+
+    def records() -> Iterator[list]:
+        rank = 0
+        for path in inputs:
+            def report(line_number: int, row: dict, error: Exception, path=path):
+                nonlocal rejected
+                rejected += 1
+                on_error(path, line_number, row, error)
+            # Repeated IDs are resolved by the conflict rule rather than
+            # rejected, and are not remembered, so memory stays bounded.
+            employees = FileHandler.iter_employees(path, on_error=report,
+                                                   validator=BatchValidator(check_duplicates=False))
+            for employee in employees:
+                yield [rank, *employee.to_list()]
+                rank += 1
+
+    directory = os.path.dirname(os.path.abspath(destination))
+    with tempfile.TemporaryDirectory(prefix=".merge-", dir=directory) as temp_dir:
+        runs = []
+        rows_read = 0
+        stream = records()
+        while run := list(islice(stream, run_rows)):
+            run.sort(key=lambda record: (*id_sort_key(record[1]), record[0]))
+            runs.append(_write_run(temp_dir, run))
+            rows_read += len(run)
+
+        while len(runs) > MERGE_FAN_IN:
+            runs = [_write_run(temp_dir, _merge_runs(runs[start:start + MERGE_FAN_IN]))
+                    for start in range(0, len(runs), MERGE_FAN_IN)]
+
+        duplicates = 0
+
+        def winners() -> Iterator[Employee]:
+            nonlocal duplicates
+            for _, group in groupby(_merge_runs(runs), key=lambda record: record[1]):
+                group = list(group)
+                duplicates += len(group) - 1
+                record = group[-1] if conflict == LAST_WINS else group[0]
+                yield Employee(*record[1:])
+
+        rows_written = FileHandler.write_employees_atomic(destination, winners())
+    return MergeResult(rows_read, rows_written, duplicates, rejected)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sources", nargs="+", help="CSV extracts to import, lowest rank first")
+    parser.add_argument("--into", required=True, help="the CSV file to merge into, e.g. employees.csv")
+    parser.add_argument("--conflict", choices=(LAST_WINS, FIRST_WINS), default=LAST_WINS,
+                        help="which row to keep when several share an employee ID")
+    parser.add_argument("--replace", action="store_true",
+                        help="ignore the destination's current rows instead of merging with them")
+    parser.add_argument("--run-rows", type=int, default=RUN_ROWS, help="rows sorted in memory at a time")
+    args = parser.parse_args(argv)
+
+    result = merge_csv_files(args.sources, args.into, conflict=args.conflict,
+                             include_destination=not args.replace, run_rows=args.run_rows)
+    print(f"Read {result.rows_read:,} rows, wrote {result.rows_written:,} employees to {args.into} "
+          f"({result.duplicates:,} duplicates removed, {result.rows_rejected:,} invalid rows skipped).")
+
+
+if __name__ == "__main__":
+    main()
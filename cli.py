@@ -0,0 +1,313 @@
+"""
+Command-line interface for batch jobs: import, export, partition, count,
+headcount and query, and serve, which answers queries over HTTP (see
+query_server.py).
+
+Unlike main.py this never imports tkinter, and each command imports only the
+modules it needs when it runs, so a command starts in tens of milliseconds.
+Results are streamed: rows are written to stdout as they are read, so the
+commands can sit in shell pipelines without holding the roster in memory.
+
+A source may also be a partitioned directory (see partitioned_store.py); a
+query for one department then reads only that department's shard. A source
+ending in .db, .sqlite or .sqlite3 is an SQLite database (see
+sqlite_backend.py), opened read-only.
+
+The commands work on the data file as stored. Changes the GUI has recorded in
+its journal but not yet compacted into the file are not included.
+
+Usage:
+    python -m cli count
+    python -m cli headcount --by department
+    python -m cli query --department Engineering --format tsv | sort
+    python -m cli query --id 1042 --index
+    python -m cli export backup.csv
+    python -m cli export - --source employees.snap | gzip > roster.csv.gz
+    python -m cli import extract1.csv extract2.csv --conflict first
+    python -m cli partition employees.d --from employees.csv
+    python -m cli query --source employees.d --department Sales
+    python -m cli query --source employees.db --id 1042
+    python -m cli serve --port 8765
+
+Warnings about skipped rows go to stderr.
+"""
+
+import argparse
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# The same data file the GUI uses.
+DATA_FILE = os.path.join(SCRIPT_DIR, "employees.csv")
+
+FORMATS = ("csv", "tsv", "jsonl")
+# Sources with these extensions are SQLite databases.
+DATABASE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+
+def _row_writer(output, output_format: str):
+    """
+    Returns a function that writes one employee row (a list of strings) to output.
+    """
+    if output_format == "jsonl":
+        import json
+        from file_handler import FIELDNAMES
+        return lambda row: output.write(json.dumps(dict(zip(FIELDNAMES, row))) + "\n")
+    import csv
+    writer = csv.writer(output, delimiter="\t" if output_format == "tsv" else ",", lineterminator="\n")
+    return writer.writerow
+
+
+def _batches(source: str, departments: list[str] | None = None):
+    """
+    Yields the employees of a file, or of a partitioned directory's chosen
+    departments, in batches that support len() and iteration.
+    """
+    if os.path.isdir(source):
+        from partitioned_store import PartitionedStorage
+        for _, store in PartitionedStorage(source).iter_shards(departments):
+            yield store
+        return
+    if _is_database(source):
+        # Like a missing CSV file, a missing database holds no employees.
+        if not os.path.exists(source):
+            return
+        from sqlite_backend import SQLiteHandler
+        with SQLiteHandler(source, read_only=True) as database:
+            yield from database.iter_employees(batch_size=10000)
+        return
+    from file_handler import FileHandler
+    if os.path.splitext(source)[1].lower() == ".snap":
+        yield FileHandler.read_store(source)
+        return
+    yield from FileHandler.iter_employees(source, batch_size=10000)
+
+
+def _is_database(source: str) -> bool:
+    return os.path.splitext(source)[1].lower() in DATABASE_EXTENSIONS
+
+
+def count(args) -> int:
+    """
+    Prints the number of employees in the data file.
+    """
+    print(sum(len(batch) for batch in _batches(args.source)))
+    return 0
+
+
+def headcount(args) -> int:
+    """
+    Prints employees per department, job title, or both, as CSV.
+    """
+    from aggregates import Headcounts
+    if os.path.isdir(args.source):
+        from partitioned_store import PartitionedStorage
+        headcounts = Headcounts.from_store(PartitionedStorage(args.source).load())
+    else:
+        headcounts = Headcounts.from_file(args.source)
+    write = _row_writer(sys.stdout, "csv")
+    if args.by == "pair":
+        write(["department", "job_title", "count"])
+        for department, job_title, count in headcounts.rows():
+            write([department, job_title, count])
+        return 0
+    counts = headcounts.departments if args.by == "department" else headcounts.job_titles
+    write([args.by, "count"])
+    for name in sorted(counts):
+        write([name, counts[name]])
+    return 0
+
+
+def query(args) -> int:
+    """
+    Streams the employees matching every given filter to stdout.
+    """
+    write = _row_writer(sys.stdout, args.format)
+    if args.header and args.format != "jsonl":
+        from file_handler import FIELDNAMES
+        write(FIELDNAMES)
+
+    if args.id is not None and args.source.lower().endswith(".csv"):
+        # A single ID is found through the offset index without parsing every row.
+        from csv_index import CsvOffsetIndex
+        from validator import BatchValidator
+        if not os.path.exists(args.source):
+            return 1
+        with CsvOffsetIndex(args.source, save=args.index) as index:
+            employee = index.get(args.id)
+        if employee is None:
+            return 1
+        # The index holds the first row with the ID whatever its contents; if
+        # that row would be skipped, the streaming path below reports it and
+        # finds any later valid row, as every other query does.
+        if BatchValidator(check_duplicates=False).validate([employee.to_list()]).ok:
+            if not _matches(employee, args):
+                return 1
+            write(employee.to_list())
+            return 0
+
+    if args.id is not None and _is_database(args.source):
+        # The primary key answers a single ID with one indexed query.
+        from sqlite_backend import SQLiteHandler
+        if not os.path.exists(args.source):
+            return 1
+        with SQLiteHandler(args.source, read_only=True) as database:
+            employee = database.get(args.id)
+        if employee is None or not _matches(employee, args):
+            return 1
+        write(employee.to_list())
+        return 0
+
+    prefixes = None
+    if args.search:
+        from search_index import SearchIndex, tokenize
+        prefixes = tokenize(args.search)
+        words_of = SearchIndex.words_of
+    found = 0
+    departments = None if args.department is None else [args.department]
+    for batch in _batches(args.source, departments):
+        for employee in batch:
+            if not _matches(employee, args):
+                continue
+            # The GUI search box's rule: every prefix starts some word.
+            if prefixes and not all(any(word.startswith(prefix) for word in words_of(employee))
+                                    for prefix in prefixes):
+                continue
+            write(employee.to_list())
+            found += 1
+            if args.limit is not None and found >= args.limit:
+                return 0
+    return 0 if found else 1
+
+
+def _matches(employee, args) -> bool:
+    return ((args.id is None or employee.employee_id == args.id)
+            and (args.department is None or employee.department == args.department)
+            and (args.job_title is None or employee.job_title == args.job_title))
+
+
+def export(args) -> int:
+    """
+    Copies the data file to a CSV or snapshot file, or as CSV to stdout.
+    """
+    from file_handler import FileHandler
+    employees = (employee for batch in _batches(args.source) for employee in batch)
+    if args.destination == "-":
+        write = _row_writer(sys.stdout, "csv")
+        from file_handler import FIELDNAMES
+        write(FIELDNAMES)
+        for employee in employees:
+            write(employee.to_list())
+        return 0
+    written = FileHandler.write_employees_atomic(args.destination, employees)
+    print(f"Exported {written:,} employees to {args.destination}", file=sys.stderr)
+    return 0
+
+
+def import_files(args) -> int:
+    """
+    Merges CSV extracts into the data file; see bulk_import.py.
+    """
+    from bulk_import import merge_csv_files
+    result = merge_csv_files(args.sources, args.into, conflict=args.conflict,
+                             include_destination=not args.replace)
+    print(f"Read {result.rows_read:,} rows, wrote {result.rows_written:,} employees to {args.into} "
+          f"({result.duplicates:,} duplicates removed, {result.rows_rejected:,} invalid rows skipped).",
+          file=sys.stderr)
+    return 0
+
+
+def partition(args) -> int:
+    """
+    Splits a single CSV or snapshot file into a partitioned directory.
+    """
+    from partitioned_store import PartitionedStorage
+    result = PartitionedStorage(args.directory, args.shard_extension).import_file(getattr(args, "from"))
+    print(f"Wrote {len(result.written)} shards, left {len(result.unchanged)} unchanged and removed "
+          f"{len(result.removed)} in {args.directory}", file=sys.stderr)
+    return 0
+
+
+def serve(args) -> int:
+    """
+    Serves the data file as JSON over HTTP until interrupted.
+    """
+    from query_server import serve as run_server
+    run_server(args.source, args.host, args.port, args.check_interval)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m cli", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    count_parser = commands.add_parser("count", help="print the number of employees")
+    count_parser.add_argument("source", nargs="?", default=DATA_FILE, help="CSV, snapshot or SQLite file, or partitioned directory")
+    count_parser.set_defaults(run=count)
+
+    headcount_parser = commands.add_parser("headcount", help="print employees per department or job title")
+    headcount_parser.add_argument("source", nargs="?", default=DATA_FILE, help="CSV, snapshot or SQLite file, or partitioned directory")
+    headcount_parser.add_argument("--by", choices=("department", "job_title", "pair"), default="pair",
+                                  help="what to count by; pair counts each department and job title")
+    headcount_parser.set_defaults(run=headcount)
+
+    query_parser = commands.add_parser("query", help="print matching employees; exits 1 if none match")
+    query_parser.add_argument("--source", default=DATA_FILE, help="CSV, snapshot or SQLite file, or partitioned directory")
+    query_parser.add_argument("--id", help="employee ID")
+    query_parser.add_argument("--index", action="store_true",
+                              help="keep the --id offset index in SOURCE.idx for faster repeated lookups")
+    query_parser.add_argument("--department", help="exact department")
+    query_parser.add_argument("--job-title", help="exact job title")
+    query_parser.add_argument("--search", help="word prefixes, as in the GUI search box")
+    query_parser.add_argument("--limit", type=int, help="stop after this many matches")
+    query_parser.add_argument("--format", choices=FORMATS, default="csv", help="output format")
+    query_parser.add_argument("--header", action="store_true", help="print a header row first")
+    query_parser.set_defaults(run=query)
+
+    export_parser = commands.add_parser("export", help="copy the data to a file, or to stdout with '-'")
+    export_parser.add_argument("destination", help="CSV or .snap file, or - for CSV on stdout")
+    export_parser.add_argument("--source", default=DATA_FILE, help="CSV, snapshot or SQLite file, or partitioned directory")
+    export_parser.set_defaults(run=export)
+
+    import_parser = commands.add_parser("import", help="merge CSV extracts into the data file")
+    import_parser.add_argument("sources", nargs="+", help="CSV extracts, lowest rank first")
+    import_parser.add_argument("--into", default=DATA_FILE, help="the CSV file to merge into")
+    import_parser.add_argument("--conflict", choices=("last", "first"), default="last",
+                               help="which row to keep when several share an employee ID")
+    import_parser.add_argument("--replace", action="store_true",
+                               help="ignore the current contents of --into")
+    import_parser.set_defaults(run=import_files)
+
+    partition_parser = commands.add_parser("partition", help="split a file into one shard per department")
+    partition_parser.add_argument("directory", help="the partitioned directory to write")
+    partition_parser.add_argument("--from", default=DATA_FILE, help="CSV or snapshot file to split")
+    partition_parser.add_argument("--shard-extension", default=".csv",
+                                  help="shard format, e.g. .csv, .csv.gz or .snap")
+    partition_parser.set_defaults(run=partition)
+
+    serve_parser = commands.add_parser("serve", help="answer queries as JSON over HTTP")
+    serve_parser.add_argument("--source", default=DATA_FILE, help="CSV or snapshot file")
+    # Omitted options are left as None for query_server.serve to fill in with
+    # its own defaults, so that module is only imported when the command runs.
+    serve_parser.add_argument("--host", help="address to listen on; the local host by default")
+    serve_parser.add_argument("--port", type=int, help="port to listen on; 0 picks a free one")
+    serve_parser.add_argument("--check-interval", type=float,
+                              help="seconds between checks of the file for changes")
+    serve_parser.set_defaults(run=serve)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. "| head"); stop quietly, as other tools do.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Reads and writes CSV files compressed with gzip, bz2 or lzma.
+
+On a slow network share the bytes moved cost more than the CPU time spent
+compressing them, so FileHandler accepts compressed CSV anywhere it accepts
+plain CSV. As with snapshots, the codec is chosen by the file's extension
+(".gz", ".bz2", ".xz" or ".lzma"); a ".csv" file is plain text, and a file
+with any other extension is identified by its first bytes when read.
+
+Both directions stream through the codec's file object, so a file is never
+decompressed or compressed in memory as a whole. The codec modules are only
+imported when a compressed file is used.
+"""
+
+import io
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, TextIO
+
+GZIP = "gzip"
+BZ2 = "bz2"
+LZMA = "lzma"
+
+EXTENSIONS = {".gz": GZIP, ".gzip": GZIP, ".bz2": BZ2, ".xz": LZMA, ".lzma": LZMA}
+# Leading bytes of each format. ".lzma" files are written in the xz format.
+MAGIC = {b"\x1f\x8b": GZIP, b"BZh": BZ2, b"\xfd7zXZ\x00": LZMA}
+MAGIC_BYTES = max(map(len, MAGIC))
+
+# gzip's default level 9 is several times slower than 6 for a slightly smaller file.
+GZIP_LEVEL = 6
+
+
+def codec_for_path(file_path: str) -> str | None:
+    """
+    Returns the codec named by a file's extension, or None for an uncompressed file.
+    """
+    return EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+def codec_for_header(header: bytes) -> str | None:
+    """
+    Returns the codec whose magic bytes start header, or None.
+    """
+    for magic, codec in MAGIC.items():
+        if header.startswith(magic):
+            return codec
+    return None
+
+
+def codec_for_file(file_path: str) -> str | None:
+    """
+    Returns the codec a file is compressed with, or None if it is plain text.
+    """
+    codec = codec_for_path(file_path)
+    if codec is not None or os.path.splitext(file_path)[1].lower() == ".csv":
+        return codec
+    try:
+        with open(file_path, mode='rb') as file:
+            return codec_for_header(file.read(MAGIC_BYTES))
+    except OSError:
+        return None
+
+
+def is_compressed(file_path: str) -> bool:
+    return codec_for_file(file_path) is not None
+
+
+def _codec_file(raw: BinaryIO, codec: str, mode: str) -> BinaryIO:
+    """
+    Wraps an open binary file in the codec's streaming file object.
+    """
+    if codec == GZIP:
+        import gzip
+        # An empty name keeps the (temporary) file name out of the gzip header.
+        return gzip.GzipFile(filename="", fileobj=raw, mode=mode, compresslevel=GZIP_LEVEL)
+    if codec == BZ2:
+        import bz2
+        return bz2.BZ2File(raw, mode=mode)
+    if codec == LZMA:
+        import lzma
+        return lzma.LZMAFile(raw, mode=mode)
+    raise ValueError(f"Unknown codec {codec!r}.")
+
+
+@contextmanager
+def open_text(file_path: str, mode: str = 'r', codec: str | None = None, buffering: int = -1,
+              sync: bool = False) -> Iterator[tuple[TextIO, BinaryIO]]:
+    """
+    Opens a CSV file for reading or writing as UTF-8 text, compressed or not.
+
+        with open_text("employees.csv.gz") as (file, raw):
+            reader = csv.reader(file)
+
+    Args:
+        file_path (str): The file to open.
+        mode (str): 'r' to read, or 'w' or 'x' to write.
+        codec (str | None): When writing, the codec to compress with; None
+                            writes plain text. Ignored when reading, where
+                            codec_for_file() decides.
+        buffering (int): The buffer size of the file on disk, as for open().
+        sync (bool): When writing, flush the file to disk with fsync before
+                     closing it.
+
+    Yields:
+        tuple[TextIO, BinaryIO]: The text stream (opened with newline='' as
+        the csv module expects), and the file on disk, whose tell() counts
+        stored bytes, e.g. for progress against the file's size.
+    """
+    if mode == 'r':
+        codec = codec_for_file(file_path)
+    if codec is None:
+        options = {} if buffering == -1 else {"buffering": buffering}
+        with open(file_path, mode=mode, newline='', encoding='utf-8', **options) as file:
+            yield file, file.buffer
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
+        return
+    with open(file_path, mode=mode + 'b', buffering=buffering) as raw:
+        text = io.TextIOWrapper(_codec_file(raw, codec, 'rb' if mode == 'r' else 'wb'),
+                                encoding='utf-8', newline='')
+        try:
+            yield text, raw
+            if sync:
+                # Closing the codec writes its trailer but leaves raw open.
+                text.close()
+                raw.flush()
+                os.fsync(raw.fileno())
+        finally:
+            text.close()
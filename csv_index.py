@@ -0,0 +1,248 @@
+"""
+Provides random access to employees.csv by employee ID, without loading the file.
+
+CsvOffsetIndex memory-maps the CSV file and keeps an index of
+employee_id -> byte offset of that employee's row. Looking an employee up then
+parses a single row. Unless told not to, the index is saved in a sidecar file
+next to the CSV ("<csv>.idx"); it is rebuilt whenever the CSV file's size or
+modification time no longer match the ones recorded in the sidecar.
+
+Sidecar layout (all integers little-endian):
+
+    magic        8 bytes  b"EMPIDX" followed by the format version
+    csv size     u64
+    csv mtime    u64, in nanoseconds
+    ID section   u64 byte length, then NUL-terminated UTF-8 employee IDs
+    offsets      one u64 per ID
+"""
+
+import csv
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator
+
+from employee import Employee
+from file_handler import FIELDNAMES
+from snapshot import decode_strings, encode_strings
+
+INDEX_MAGIC = b"EMPIDX\x00\x01"
+
+_HEADER = struct.Struct("<8sQQQ")
+
+
+def record_spans(data, start: int = 0, end: int | None = None) -> Iterator[tuple[int, int]]:
+    """
+    Yields the (start, end) byte offsets of each CSV record in a buffer.
+
+    A record normally ends at a newline, but a newline inside a quoted field is
+    part of the record, so quotes are counted to find the real boundary. `end`
+    is the offset just past the record's newline.
+
+    Args:
+        data: A bytes-like object that supports find(), such as an mmap.
+        start (int): The offset of the first record; must be a record boundary.
+        end (int | None): Stop at this offset; defaults to the end of data.
+
+    Returns:
+        Iterator[tuple[int, int]]: The span of every record, in file order.
+    """
+    if end is None:
+        end = len(data)
+    record_start = position = start
+    quotes = 0
+    while position < end:
+        newline = data.find(b"\n", position, end)
+        line_end = end if newline == -1 else newline + 1
+        quotes += data[position:line_end].count(b'"')
+        position = line_end
+        # An even number of quotes means every quoted field has been closed.
+        if quotes % 2 == 0:
+            yield record_start, line_end
+            record_start = line_end
+            quotes = 0
+    if record_start < end:
+        # An unterminated quote at the end of the data; return what is left.
+        yield record_start, end
+
+
+def parse_record(data: bytes) -> list[str]:
+    """
+    Parses the bytes of a single CSV record into its fields.
+    """
+    return next(csv.reader([data.decode('utf-8')]), [])
+
+
+class CsvOffsetIndex:
+    """
+    Looks up employees in a CSV file by ID, parsing only the requested row.
+
+    Use as a context manager, or call close() when finished:
+
+        with CsvOffsetIndex("employees.csv") as index:
+            employee = index.get("101")
+
+    Attributes:
+        csv_path (str): The CSV file being indexed.
+        index_path (str): The sidecar index file.
+    """
+
+    def __init__(self, csv_path: str, index_path: str | None = None, save: bool = True):
+        """
+        Initialises the index. Nothing is read until the first lookup.
+
+        Args:
+            csv_path (str): The CSV file to index.
+            index_path (str | None): Where to keep the index; defaults to "<csv_path>.idx".
+            save (bool): If False, an index built from the CSV file is kept in
+                         memory only; an up-to-date sidecar is still used.
+        """
+        self.csv_path = csv_path
+        self.index_path = index_path or f"{csv_path}.idx"
+        self.save = save
+        self._offsets: dict[str, int] = {}
+        self._columns: list[str] = []
+        self._file = None
+        self._map = None
+        self._stat_key = None
+
+    def get(self, employee_id: str) -> Employee | None:
+        """
+        Returns the employee with the given ID, or None if there is none.
+
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+        """
+        self.refresh()
+        offset = self._offsets.get(employee_id)
+        if offset is None:
+            return None
+        _, end = next(record_spans(self._map, offset))
+        values = dict(zip(self._columns, parse_record(self._map[offset:end])))
+        return Employee(*(values.get(field, "") for field in FIELDNAMES))
+
+    def refresh(self):
+        """
+        Makes sure the index matches the CSV file on disk, rebuilding it if
+        the file's size or modification time changed.
+        """
+        stat = os.stat(self.csv_path)
+        stat_key = (stat.st_size, stat.st_mtime_ns)
+        if stat_key == self._stat_key:
+            return
+        self._close_map()
+        self._file = open(self.csv_path, mode='rb')
+        if stat.st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""
+        header_end = self._read_header()
+        if not self._load_sidecar(stat_key):
+            self._build(header_end)
+            if self.save:
+                self._save_sidecar(stat_key)
+        self._stat_key = stat_key
+
+    def close(self):
+        """
+        Unmaps and closes the CSV file.
+        """
+        self._close_map()
+        self._stat_key = None
+
+    def __contains__(self, employee_id: str) -> bool:
+        self.refresh()
+        return employee_id in self._offsets
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._offsets)
+
+    def __enter__(self) -> "CsvOffsetIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _read_header(self) -> int:
+        """
+        Parses the header row and returns the offset of the first data row.
+        """
+        span = next(record_spans(self._map), (0, 0))
+        self._columns = parse_record(self._map[span[0]:span[1]])
+        return span[1]
+
+    def _build(self, start: int):
+        """
+        Scans the whole file and records the offset of every row.
+        """
+        self._offsets = {}
+        id_column = self._columns.index("employee_id") if "employee_id" in self._columns else None
+        if id_column is None:
+            logging.warning(f"{self.csv_path} has no employee_id column; nothing to index.")
+            return
+        for record_start, record_end in record_spans(self._map, start):
+            line = self._map[record_start:record_end]
+            if not line.strip():
+                continue
+            if id_column == 0 and not line.startswith(b'"'):
+                # Fast path: the ID is everything up to the first comma.
+                employee_id = line.split(b",", 1)[0].rstrip(b"\r\n").decode('utf-8')
+            else:
+                fields = parse_record(line)
+                if len(fields) <= id_column:
+                    continue
+                employee_id = fields[id_column]
+            # Like EmployeeRepository.load(), keep the first row for each ID.
+            self._offsets.setdefault(employee_id, record_start)
+
+    def _load_sidecar(self, stat_key: tuple[int, int]) -> bool:
+        """
+        Loads the sidecar index if it exists and matches the CSV file.
+        """
+        try:
+            with open(self.index_path, mode='rb') as file:
+                data = file.read()
+            magic, size, mtime_ns, id_bytes = _HEADER.unpack_from(data)
+            if magic != INDEX_MAGIC or (size, mtime_ns) != stat_key:
+                return False
+            ids = decode_strings(data[_HEADER.size:_HEADER.size + id_bytes])
+            offsets = array("Q")
+            offsets.frombytes(data[_HEADER.size + id_bytes:])
+            if sys.byteorder == "big":
+                offsets.byteswap()
+            if len(ids) != len(offsets):
+                return False
+        except (OSError, ValueError, struct.error):
+            return False
+        self._offsets = dict(zip(ids, offsets))
+        return True
+
+    def _save_sidecar(self, stat_key: tuple[int, int]):
+        """
+        Writes the index next to the CSV file. Failure only costs a rebuild next time.
+        """
+        temp_path = f"{self.index_path}.tmp"
+        try:
+            ids = encode_strings(list(self._offsets))
+            offsets = array("Q", self._offsets.values())
+            if sys.byteorder == "big":
+                offsets.byteswap()
+            with open(temp_path, mode='wb') as file:
+                file.write(_HEADER.pack(INDEX_MAGIC, *stat_key, len(ids)))
+                file.write(ids)
+                file.write(offsets.tobytes())
+            os.replace(temp_path, self.index_path)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not save the index for {self.csv_path}: {e}")
+
+    def _close_map(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -13,6 +13,10 @@ class Employee:
         department (str): The department where the employee works.
         job_title (str): The job title of the employee.
     """
+    # Using __slots__ removes the per-instance __dict__, which keeps large
+    # rosters of Employee objects considerably smaller in memory.
+    __slots__ = ("employee_id", "first_name", "last_name", "department", "job_title")
+
     def __init__(self, employee_id: str, first_name: str, last_name: str, department: str, job_title: str):
         """
         Initializes an Employee object.
@@ -0,0 +1,292 @@
+"""
+Defines the EmployeeStore class, a compact columnar container for employee records.
+
+Instead of keeping one Employee object per row, the store keeps one array per
+field. The department and job title columns hold only a few distinct values, so
+they are dictionary-encoded: each row stores a small integer code and the text
+is kept once in a lookup table.
+"""
+
+from array import array
+from typing import Iterable, Iterator
+
+from employee import Employee
+
+# Codes start as unsigned shorts and are widened if a column ever holds more
+# than this many distinct values.
+_MAX_SHORT_CODE = 0xFFFF
+
+
+class _EncodedColumn:
+    """
+    A dictionary-encoded column of strings.
+
+    Each distinct value is stored once in `values` and every row holds the
+    integer code of its value in `codes`.
+    """
+    __slots__ = ("codes", "values", "lookup")
+
+    def __init__(self):
+        self.codes = array("H")
+        self.values: list[str] = []
+        self.lookup: dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        """
+        Returns the code for a value, adding it to the lookup table if it is new.
+        """
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            if code > _MAX_SHORT_CODE and self.codes.typecode == "H":
+                self.codes = array("I", self.codes)
+            self.values.append(value)
+            self.lookup[value] = code
+        return code
+
+    def append(self, value: str):
+        # Encode first: encoding may swap self.codes for a wider array.
+        code = self.encode(value)
+        self.codes.append(code)
+
+    def get(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+    def set(self, index: int, value: str):
+        code = self.encode(value)
+        self.codes[index] = code
+
+
+class EmployeeStore:
+    """
+    A memory-efficient, columnar collection of employees.
+
+    The store behaves like a read-mostly sequence of Employee objects: it
+    supports len(), iteration, indexing and append(). Indexing builds a fresh
+    Employee from the columns, so the objects it hands out are views of the
+    stored data rather than the storage itself.
+    """
+
+    def __init__(self, employees: Iterable[Employee] = ()):
+        """
+        Initialises the store, optionally filling it with existing employees.
+
+        Args:
+            employees (Iterable[Employee]): Employees to add to the store.
+        """
+        self._employee_ids: list[str] = []
+        self._first_names: list[str] = []
+        self._last_names: list[str] = []
+        self._departments = _EncodedColumn()
+        self._job_titles = _EncodedColumn()
+        self.extend(employees)
+
+    def append(self, employee: Employee):
+        """
+        Adds an employee to the end of the store.
+
+        Args:
+            employee (Employee): The employee to add.
+        """
+        self._employee_ids.append(employee.employee_id)
+        self._first_names.append(employee.first_name)
+        self._last_names.append(employee.last_name)
+        self._departments.append(employee.department)
+        self._job_titles.append(employee.job_title)
+
+    def append_row(self, row: list[str]):
+        """
+        Adds an employee given as a list of field values, without building an
+        Employee object.
+
+        Args:
+            row (list[str]): The values in Employee.to_list() order.
+        """
+        employee_id, first_name, last_name, department, job_title = row
+        self._employee_ids.append(employee_id)
+        self._first_names.append(first_name)
+        self._last_names.append(last_name)
+        self._departments.append(department)
+        self._job_titles.append(job_title)
+
+    def extend_store(self, other: "EmployeeStore"):
+        """
+        Appends every row of another store, column by column.
+
+        The other store's department and job title codes are translated into
+        this store's codes with one lookup per distinct value, not per row.
+
+        Args:
+            other (EmployeeStore): The store to append.
+        """
+        self._employee_ids.extend(other._employee_ids)
+        self._first_names.extend(other._first_names)
+        self._last_names.extend(other._last_names)
+        for mine, theirs in ((self._departments, other._departments), (self._job_titles, other._job_titles)):
+            remap = [mine.encode(value) for value in theirs.values]
+            if remap == list(range(len(remap))):
+                # Both stores agree on every code, so the codes can be copied as they are.
+                mine.codes.extend(array(mine.codes.typecode, theirs.codes))
+            else:
+                mine.codes.extend(map(remap.__getitem__, theirs.codes))
+
+    def extend(self, employees: Iterable[Employee]):
+        """
+        Adds several employees to the end of the store.
+
+        Args:
+            employees (Iterable[Employee]): The employees to add.
+        """
+        for employee in employees:
+            self.append(employee)
+
+    @classmethod
+    def from_columns(cls, employee_ids: list[str], first_names: list[str], last_names: list[str],
+                     departments: tuple[list[str], array], job_titles: tuple[list[str], array]) -> "EmployeeStore":
+        """
+        Builds a store directly from column data, without going through Employee objects.
+
+        Args:
+            employee_ids (list[str]): The employee ID column.
+            first_names (list[str]): The first name column.
+            last_names (list[str]): The last name column.
+            departments (tuple[list[str], array]): The distinct department values
+                and one code per row indexing into them.
+            job_titles (tuple[list[str], array]): The same for job titles.
+
+        Returns:
+            EmployeeStore: A store that takes ownership of the given columns.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        lengths = {len(employee_ids), len(first_names), len(last_names), len(departments[1]), len(job_titles[1])}
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length.")
+        store = cls()
+        store._employee_ids = employee_ids
+        store._first_names = first_names
+        store._last_names = last_names
+        for column, (values, codes) in ((store._departments, departments), (store._job_titles, job_titles)):
+            column.values = values
+            column.codes = codes
+            column.lookup = {value: code for code, value in enumerate(values)}
+        return store
+
+    def columns(self) -> tuple[list[str], list[str], list[str], tuple[list[str], array], tuple[list[str], array]]:
+        """
+        Returns the store's columns in the form accepted by from_columns().
+
+        The returned objects are the store's own; do not modify them.
+        """
+        return (self._employee_ids, self._first_names, self._last_names,
+                (self._departments.values, self._departments.codes),
+                (self._job_titles.values, self._job_titles.codes))
+
+    def copy(self) -> "EmployeeStore":
+        """
+        Returns an independent copy of the store.
+
+        Copying the columns is much cheaper than copying Employee objects, which
+        makes this a convenient way to hand a stable snapshot to another thread.
+        """
+        clone = EmployeeStore()
+        clone._employee_ids = self._employee_ids.copy()
+        clone._first_names = self._first_names.copy()
+        clone._last_names = self._last_names.copy()
+        for source, target in ((self._departments, clone._departments), (self._job_titles, clone._job_titles)):
+            target.codes = array(source.codes.typecode, source.codes)
+            target.values = source.values.copy()
+            target.lookup = source.lookup.copy()
+        return clone
+
+    def swap_remove(self, index: int):
+        """
+        Removes a row in O(1) by moving the last row into its place.
+
+        This does not preserve order: the row that was last now lives at `index`.
+
+        Args:
+            index (int): The position of the row to remove.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        last = len(self) - 1
+        if index < 0:
+            index += len(self)
+        if not 0 <= index <= last:
+            raise IndexError("EmployeeStore index out of range")
+        for column in (self._employee_ids, self._first_names, self._last_names,
+                       self._departments.codes, self._job_titles.codes):
+            column[index] = column[last]
+            column.pop()
+
+    def row(self, index: int) -> list[str]:
+        """
+        Returns the fields of one row without building an Employee object.
+
+        Args:
+            index (int): The position of the row.
+
+        Returns:
+            list[str]: The same values as Employee.to_list() for that row.
+        """
+        return [
+            self._employee_ids[index],
+            self._first_names[index],
+            self._last_names[index],
+            self._departments.get(index),
+            self._job_titles.get(index)
+        ]
+
+    def rows(self) -> Iterator[list[str]]:
+        """
+        Iterates over all rows as lists of strings.
+
+        Returns:
+            Iterator[list[str]]: One list of field values per employee.
+        """
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def departments(self) -> list[str]:
+        """
+        Returns every distinct department seen by the store.
+        """
+        return list(self._departments.values)
+
+    def job_titles(self) -> list[str]:
+        """
+        Returns every distinct job title seen by the store.
+        """
+        return list(self._job_titles.values)
+
+    def __len__(self) -> int:
+        return len(self._employee_ids)
+
+    def __getitem__(self, index: int) -> Employee:
+        """
+        Returns the employee at the given position as an Employee object.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        return Employee(*self.row(index))
+
+    def __setitem__(self, index: int, employee: Employee):
+        """
+        Replaces the employee stored at the given position.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        self._employee_ids[index] = employee.employee_id
+        self._first_names[index] = employee.first_name
+        self._last_names[index] = employee.last_name
+        self._departments.set(index, employee.department)
+        self._job_titles.set(index, employee.job_title)
+
+    def __iter__(self) -> Iterator[Employee]:
+        for index in range(len(self)):
+            yield self[index]
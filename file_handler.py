@@ -1,10 +1,155 @@
 """
 Handles reading from and writing to CSV files for employee data.
+
+Files ending in ".snap", or starting with the snapshot magic bytes, are read and
+written in the binary snapshot format from snapshot.py instead. CSV remains the
+interchange format; the snapshot is the fast format for loading.
+
+CSV files may be compressed with gzip, bz2 or lzma (see compression.py): they
+are recognised by their first bytes when read and by their extension, such as
+"employees.csv.gz", when written.
 """
 
 import csv
+import io
 import logging
+import os
+from itertools import compress, islice
+from operator import attrgetter, itemgetter
+from typing import Callable, Iterable, Iterator
+import compression
+import snapshot
 from employee import Employee
+from employee_store import EmployeeStore
+from instrumentation import timed
+from validator import BatchValidator, ValidationError
+
+FIELDNAMES = ["employee_id", "first_name", "last_name", "department", "job_title"]
+
+# Signature of the callback used to report rows that could not be parsed:
+# on_error(line_number, row, error)
+ErrorCallback = Callable[[int, dict, Exception], None]
+
+# Signature of the callback used to report reading progress:
+# on_progress(bytes_read)
+ProgressCallback = Callable[[int], None]
+
+# When yielding single employees, progress is reported every this many rows.
+PROGRESS_INTERVAL_ROWS = 1000
+
+# Atomic writes hand this many rows at a time to csv.writer.writerows().
+WRITE_CHUNK_ROWS = 10000
+# Buffer size for atomic writes, so rows reach the disk in large blocks.
+WRITE_BUFFER_BYTES = 1 << 20
+
+
+class WriteCancelled(Exception):
+    """
+    Raised when an atomic write is cancelled before it completes.
+    """
+
+
+def _employee_from_row(row: dict) -> Employee:
+    """
+    Builds an Employee from a csv.DictReader row.
+
+    Raises:
+        KeyError: If a column is missing from the header or the row is too short.
+    """
+    values = [row[field] for field in FIELDNAMES]
+    for field, value in zip(FIELDNAMES, values):
+        if value is None:
+            raise KeyError(field)
+    return Employee(*values)
+
+
+def _validated_employees(rows: list[tuple[int, dict]], validator: BatchValidator | None,
+                         on_error: ErrorCallback) -> list[Employee]:
+    """
+    Turns (line_number, row) pairs into Employees, checking them as one batch.
+
+    Rows with missing columns and rows that fail validation are passed to
+    on_error and left out.
+    """
+    parsed = []
+    for line_number, row in rows:
+        try:
+            parsed.append((line_number, row, _employee_from_row(row)))
+        except KeyError as e:
+            on_error(line_number, row, e)
+    if validator is None:
+        return [employee for _, _, employee in parsed]
+    employees = [employee for _, _, employee in parsed]
+    report = validator.validate_columns([list(map(attrgetter(field), employees)) for field in FIELDNAMES],
+                                        [line_number for line_number, _, _ in parsed])
+    if report.ok:
+        return employees
+    invalid = report.invalid_rows()
+    for line_number, row, _ in parsed:
+        if line_number in invalid:
+            on_error(line_number, row, ValidationError(report.issues_for(line_number)))
+    return [employee for line_number, _, employee in parsed if line_number not in invalid]
+
+
+def _row_validator(validate: bool, validator: BatchValidator | None) -> BatchValidator | None:
+    """
+    Returns the validator a streaming read checks rows with, or None for no checks.
+    """
+    if not validate:
+        return None
+    return validator if validator is not None else BatchValidator(check_duplicates=False)
+
+
+def _temp_path_for(file_path: str) -> str:
+    """
+    Returns a unique hidden temporary path in the same directory as file_path,
+    so the finished file can be moved into place with an atomic os.replace().
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    # os.urandom rather than uuid, whose import alone slows CLI startup noticeably.
+    return os.path.join(directory, f".{name}.{os.urandom(16).hex()}.tmp")
+
+
+def _is_snapshot(file_path: str) -> bool:
+    """
+    Decides whether a path holds a binary snapshot rather than CSV.
+
+    The extension decides for ".snap" and ".csv" files; any other existing file
+    is identified by its first bytes.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == snapshot.SNAPSHOT_EXTENSION:
+        return True
+    if extension == ".csv":
+        return False
+    try:
+        with open(file_path, mode='rb') as file:
+            return snapshot.is_snapshot_header(file.read(len(snapshot.MAGIC)))
+    except OSError:
+        return False
+
+
+def _log_bad_row(line_number: int, row: dict, error: Exception):
+    """
+    The default error callback: logs the bad row and carries on.
+    """
+    if isinstance(error, KeyError):
+        logging.warning(f"Skipping row on line {line_number} due to missing column: {error}")
+    else:
+        logging.warning(f"Skipping row on line {line_number}: {error}")
+
+
+def _replace(temp_path: str, file_path: str, should_cancel: Callable[[], bool] | None,
+             on_replace: Callable[[int], None] | None):
+    """
+    Moves a finished temporary file over file_path, unless should_cancel() says not to.
+    """
+    if should_cancel is not None and should_cancel():
+        raise WriteCancelled(f"Writing {file_path} was cancelled.")
+    if on_replace is not None:
+        on_replace(os.path.getsize(temp_path))
+    os.replace(temp_path, file_path)
+
 
 class FileHandler:
     """
@@ -12,6 +157,147 @@ class FileHandler:
     """
 
     @staticmethod
+    def iter_employees(file_path: str, batch_size: int | None = None,
+                       on_error: ErrorCallback | None = None,
+                       on_progress: ProgressCallback | None = None,
+                       validate: bool = True,
+                       validator: BatchValidator | None = None) -> Iterator[Employee] | Iterator[list[Employee]]:
+        """
+        Lazily reads employee data from a CSV file, one row at a time.
+
+        Only the current row (or batch) is held in memory, so files larger than
+        RAM can be processed and callers can start work before the whole file
+        has been parsed.
+
+        Rows are checked in batches with validator.BatchValidator: rows with
+        blank fields or non-numeric IDs are reported through on_error and
+        skipped. IDs used by an earlier row are only checked when a validator
+        that checks duplicates is passed, since remembering every ID would make
+        memory use grow with the file.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            batch_size (int | None): If given, yield lists of up to this many
+                                     employees instead of single employees.
+            on_error (ErrorCallback | None): Called as on_error(line_number, row, error)
+                                             for every row that cannot be parsed.
+                                             Defaults to logging a warning.
+            on_progress (ProgressCallback | None): Called as on_progress(bytes_read)
+                                                   before each batch is yielded, or every
+                                                   PROGRESS_INTERVAL_ROWS rows without batching.
+                                                   The count is approximate because of read-ahead,
+                                                   and counts compressed bytes for compressed files.
+            validate (bool): If False, only rows with missing columns are skipped.
+            validator (BatchValidator | None): The validator to check rows with,
+                                               e.g. BatchValidator() to also skip
+                                               repeated IDs; by default one that
+                                               checks each row on its own.
+
+        Yields:
+            Employee | list[Employee]: Employees, or batches of employees.
+
+        Raises:
+            ValueError: If batch_size is not a positive integer.
+            Exception: For I/O errors or data format issues other than a missing file.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        if on_error is None:
+            on_error = _log_bad_row
+        if _is_snapshot(file_path):
+            yield from FileHandler._iter_snapshot(file_path, batch_size, on_progress)
+            return
+
+        validator = _row_validator(validate, validator)
+        # Rows are validated in chunks: a whole batch, or PROGRESS_INTERVAL_ROWS
+        # rows when yielding single employees.
+        chunk_rows = batch_size or PROGRESS_INTERVAL_ROWS
+        batch = []
+        try:
+            with compression.open_text(file_path) as (file, raw):
+                reader = csv.DictReader(file)
+                rows = iter(reader)
+                while True:
+                    pending = [(reader.line_num, row) for row in islice(rows, chunk_rows)]
+                    if not pending:
+                        break
+                    employees = _validated_employees(pending, validator, on_error)
+                    if batch_size is None:
+                        if on_progress is not None and len(pending) == chunk_rows:
+                            on_progress(raw.tell())
+                        yield from employees
+                        continue
+                    batch.extend(employees)
+                    while len(batch) >= batch_size:
+                        if on_progress is not None:
+                            on_progress(raw.tell())
+                        yield batch[:batch_size]
+                        batch = batch[batch_size:]
+                if on_progress is not None:
+                    on_progress(raw.tell())
+        except FileNotFoundError:
+            # This allows the application to start even if the file doesn't exist yet.
+            logging.info(f"The file {file_path} was not found. A new one will be created upon export.")
+            return
+        except Exception as e:
+            logging.error(f"An error occurred while reading the file: {e}")
+            raise
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _iter_snapshot(file_path: str, batch_size: int | None,
+                       on_progress: ProgressCallback | None) -> Iterator[Employee] | Iterator[list[Employee]]:
+        """
+        The iter_employees() implementation for snapshot files.
+        """
+        try:
+            store = FileHandler.read_store(file_path)
+        except FileNotFoundError:
+            logging.info(f"The file {file_path} was not found. A new one will be created upon export.")
+            return
+        total_bytes = os.path.getsize(file_path)
+        if batch_size is None:
+            if on_progress is not None:
+                on_progress(total_bytes)
+            yield from store
+            return
+        for start in range(0, len(store), batch_size):
+            if on_progress is not None:
+                on_progress(total_bytes * min(start + batch_size, len(store)) // len(store))
+            yield [store[index] for index in range(start, min(start + batch_size, len(store)))]
+
+    @staticmethod
+    @timed("FileHandler.read_store", rows=len)
+    def read_store(file_path: str) -> EmployeeStore:
+        """
+        Reads employee data into a columnar EmployeeStore.
+
+        This is the fastest way to load a whole file. Snapshots are decoded
+        column by column without building an Employee per row.
+
+        Args:
+            file_path (str): The path to a CSV or snapshot file.
+
+        Returns:
+            EmployeeStore: The employees in the file; empty if the CSV file does not exist.
+
+        Raises:
+            FileNotFoundError: If a snapshot file does not exist.
+            snapshot.SnapshotFormatError: If a snapshot file is corrupt.
+            Exception: For other potential I/O errors or data format issues.
+        """
+        if _is_snapshot(file_path):
+            try:
+                return snapshot.read_snapshot(file_path)
+            except Exception as e:
+                logging.error(f"An error occurred while reading the file: {e}")
+                raise
+        # The whole file is held in memory anyway, so repeated IDs are skipped too.
+        return EmployeeStore(FileHandler.iter_employees(file_path, validator=BatchValidator()))
+
+    @staticmethod
+    @timed("FileHandler.read_employees", rows=len)
     def read_employees(file_path: str) -> list[Employee]:
         """
         Reads employee data from a CSV file and returns a list of Employee objects.
@@ -20,42 +306,144 @@ class FileHandler:
             file_path (str): The path to the CSV file.
 
         Returns:
-            list[Employee]: A list of Employee objects.
+            list[Employee]: A list of Employee objects, or an empty list if the
+                            file does not exist.
         
         Raises:
-            FileNotFoundError: If the specified file_path does not exist.
             Exception: For other potential I/O errors or data format issues.
         """
-        employees = []
+        return list(FileHandler.iter_employees(file_path, validator=BatchValidator()))
+
+    @staticmethod
+    def iter_columns(file_path: str, batch_size: int = WRITE_CHUNK_ROWS,
+                     on_error: ErrorCallback | None = None,
+                     validate: bool = True,
+                     validator: BatchValidator | None = None) -> Iterator[list[list[str]]]:
+        """
+        Streams a CSV file as batches of columns, without building Employees.
+
+        This suits passes that only need some fields of every row, such as
+        counting employees per department. Rows are checked as in
+        iter_employees(), so the same rows are skipped.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            batch_size (int): The number of rows per batch.
+            on_error (ErrorCallback | None): As for iter_employees().
+            validate (bool): As for iter_employees().
+            validator (BatchValidator | None): As for iter_employees().
+
+        Yields:
+            list[list[str]]: One list per field, in FIELDNAMES order, holding
+                             the valid rows of a batch.
+
+        Raises:
+            ValueError: If batch_size is not a positive integer.
+            Exception: For I/O errors or data format issues other than a missing file.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        if on_error is None:
+            on_error = _log_bad_row
+        if _is_snapshot(file_path):
+            yield from FileHandler._iter_snapshot_columns(file_path, batch_size)
+            return
+        validator = _row_validator(validate, validator)
         try:
-            with open(file_path, mode='r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    try:
-                        employee = Employee(
-                            employee_id=row["employee_id"],
-                            first_name=row["first_name"],
-                            last_name=row["last_name"],
-                            department=row["department"],
-                            job_title=row["job_title"]
-                        )
-                        employees.append(employee)
-                    except KeyError as e:
-                        # Handle cases where a column is missing in a row
-                        logging.warning(f"Skipping row due to missing column: {e}")
+            with compression.open_text(file_path) as (file, _):
+                reader = csv.reader(file)
+                header = next(reader, [])
+                missing = [field for field in FIELDNAMES if field not in header]
+                positions = [header.index(field) for field in FIELDNAMES if field in header]
+                getters = [itemgetter(position) for position in positions]
+                # Shorter rows lack a field, which iter_employees() reports as a missing column.
+                width = max(positions, default=-1) + 1
+                while True:
+                    pending = [(reader.line_num, row) for row in islice(reader, batch_size)]
+                    if not pending:
+                        break
+                    rows = []
+                    row_numbers = []
+                    for line_number, row in pending:
+                        if len(row) >= width and not missing:
+                            rows.append(row)
+                            row_numbers.append(line_number)
+                        elif row:
+                            # Reported as iter_employees() reports them; blank lines are skipped.
+                            values = dict(zip(header, row))
+                            field = missing[0] if missing else next(
+                                field for field in FIELDNAMES if field not in values)
+                            on_error(line_number, values, KeyError(field))
+                    columns = [list(map(getter, rows)) for getter in getters]
+                    if validator is not None and rows:
+                        report = validator.validate_columns(columns, row_numbers)
+                        if not report.ok:
+                            invalid = report.invalid_rows()
+                            for line_number, row in zip(row_numbers, rows):
+                                if line_number in invalid:
+                                    on_error(line_number, dict(zip(header, row)),
+                                             ValidationError(report.issues_for(line_number)))
+                            keep = [line_number not in invalid for line_number in row_numbers]
+                            columns = [list(compress(column, keep)) for column in columns]
+                    if columns and columns[0]:
+                        yield columns
         except FileNotFoundError:
-            # This allows the application to start even if the file doesn't exist yet.
             logging.info(f"The file {file_path} was not found. A new one will be created upon export.")
-            return []
+            return
         except Exception as e:
             logging.error(f"An error occurred while reading the file: {e}")
             raise
-        return employees
 
     @staticmethod
+    def _iter_snapshot_columns(file_path: str, batch_size: int) -> Iterator[list[list[str]]]:
+        """
+        The iter_columns() implementation for snapshot files.
+        """
+        try:
+            store = FileHandler.read_store(file_path)
+        except FileNotFoundError:
+            logging.info(f"The file {file_path} was not found. A new one will be created upon export.")
+            return
+        employee_ids, first_names, last_names, departments, job_titles = store.columns()
+        for start in range(0, len(store), batch_size):
+            stop = start + batch_size
+            yield [employee_ids[start:stop], first_names[start:stop], last_names[start:stop],
+                   *([values[code] for code in codes[start:stop]] for values, codes in (departments, job_titles))]
+
+    @staticmethod
+    def parse_rows(text: str, fieldnames: list[str], first_line: int = 2,
+                   on_error: ErrorCallback | None = None,
+                   validate: bool = True,
+                   validator: BatchValidator | None = None) -> list[Employee]:
+        """
+        Parses CSV rows that come without a header, such as rows appended to a
+        file since it was last read. Rows are checked as in iter_employees().
+
+        Args:
+            text (str): Complete CSV records.
+            fieldnames (list[str]): The column names from the file's header.
+            first_line (int): The line number of the first row in the file,
+                              used when reporting bad rows.
+            on_error (ErrorCallback | None): As for iter_employees().
+            validate (bool): As for iter_employees().
+            validator (BatchValidator | None): As for iter_employees().
+
+        Returns:
+            list[Employee]: The valid employees, in order.
+        """
+        if on_error is None:
+            on_error = _log_bad_row
+        validator = _row_validator(validate, validator)
+        reader = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)
+        rows = [(first_line - 1 + reader.line_num, row) for row in reader]
+        return _validated_employees(rows, validator, on_error)
+
+    @staticmethod
+    @timed("FileHandler.write_employees")
     def write_employees(file_path: str, employees: list[Employee]):
         """
-        Writes a list of Employee objects to a CSV file.
+        Writes a list of Employee objects to a CSV file, or to a binary
+        snapshot if file_path names one.
 
         Args:
             file_path (str): The path to the CSV file to be written.
@@ -65,13 +453,90 @@ class FileHandler:
             Exception: For potential I/O errors.
         """
         try:
-            with open(file_path, mode='w', newline='', encoding='utf-8') as file:
+            if _is_snapshot(file_path):
+                with open(file_path, mode='wb') as file:
+                    snapshot.write_snapshot(file, employees)
+                return
+            with compression.open_text(file_path, 'w', codec=compression.codec_for_path(file_path)) as (file, _):
                 writer = csv.writer(file)
                 # Write header
-                writer.writerow(["employee_id", "first_name", "last_name", "department", "job_title"])
+                writer.writerow(FIELDNAMES)
                 # Write employee data
                 for employee in employees:
                     writer.writerow(employee.to_list())
         except Exception as e:
             logging.error(f"An error occurred while writing to the file: {e}")
             raise
+
+    @staticmethod
+    @timed("FileHandler.write_employees_atomic", rows=int)
+    def write_employees_atomic(file_path: str, employees: Iterable[Employee],
+                               on_progress: Callable[[int], None] | None = None,
+                               should_cancel: Callable[[], bool] | None = None,
+                               on_replace: Callable[[int], None] | None = None) -> int:
+        """
+        Writes employees to a CSV or snapshot file so that readers never see a partial file.
+
+        Rows are written in large chunks to a temporary file in the same directory,
+        which is flushed to disk and then moved over file_path with os.replace().
+        If the write fails or is cancelled, the temporary file is removed and
+        any existing file at file_path is left untouched.
+
+        Args:
+            file_path (str): The path to the CSV file to be written.
+            employees (Iterable[Employee]): The employees to write.
+            on_progress (Callable[[int], None] | None): Called with the number of
+                rows written so far after each chunk.
+            should_cancel (Callable[[], bool] | None): Checked before each chunk
+                and once more just before file_path is replaced; returning True
+                abandons the write.
+            on_replace (Callable[[int], None] | None): Called with the size in
+                bytes of the finished file just before it replaces file_path.
+
+        Returns:
+            int: The number of employees written.
+
+        Raises:
+            WriteCancelled: If should_cancel() returned True.
+            Exception: For potential I/O errors.
+        """
+        temp_path = _temp_path_for(file_path)
+        rows_written = 0
+        try:
+            if _is_snapshot(file_path):
+                if should_cancel is not None and should_cancel():
+                    raise WriteCancelled(f"Writing {file_path} was cancelled.")
+                store = employees if isinstance(employees, EmployeeStore) else EmployeeStore(employees)
+                with open(temp_path, mode='xb') as file:
+                    snapshot.write_snapshot(file, store)
+                    file.flush()
+                    os.fsync(file.fileno())
+                _replace(temp_path, file_path, should_cancel, on_replace)
+                if on_progress is not None:
+                    on_progress(len(store))
+                return len(store)
+            with compression.open_text(temp_path, 'x', codec=compression.codec_for_path(file_path),
+                                       buffering=WRITE_BUFFER_BYTES, sync=True) as (file, _):
+                writer = csv.writer(file)
+                writer.writerow(FIELDNAMES)
+                rows = (employee.to_list() for employee in employees)
+                while True:
+                    if should_cancel is not None and should_cancel():
+                        raise WriteCancelled(f"Writing {file_path} was cancelled.")
+                    chunk = list(islice(rows, WRITE_CHUNK_ROWS))
+                    if not chunk:
+                        break
+                    writer.writerows(chunk)
+                    rows_written += len(chunk)
+                    if on_progress is not None:
+                        on_progress(rows_written)
+            _replace(temp_path, file_path, should_cancel, on_replace)
+        except BaseException as e:
+            if isinstance(e, Exception) and not isinstance(e, WriteCancelled):
+                logging.error(f"An error occurred while writing to the file: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        return rows_written
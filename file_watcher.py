@@ -0,0 +1,215 @@
+"""
+Notices when employees.csv changes on disk and reads only the rows appended to it.
+
+Other systems append rows to the data file while the GUI is open. After a full
+load, DataFileWatcher remembers how far the file was read (the byte offset
+just past the last row), its inode, size and modification time, and the bytes
+just before that offset. check() compares these with the file on disk:
+
+    UNCHANGED   Nothing new to read.
+    APPENDED    The file grew and the bytes before the offset are still the
+                same, so read_appended() can parse from the offset onwards.
+    REWRITTEN   The file was replaced, truncated, or changed before the
+                offset, so the roster has to be read again from scratch.
+
+Only complete records are read: a row that a writer has not finished
+appending (no trailing newline yet) is left for the next check. Compressed
+files and binary snapshots cannot be read from an offset, so any change to
+one counts as a rewrite.
+"""
+
+import csv
+import logging
+import os
+from typing import Iterator
+
+import compression
+import snapshot
+from employee import Employee
+from file_handler import ErrorCallback, FileHandler
+from validator import BatchValidator
+
+UNCHANGED = "unchanged"
+APPENDED = "appended"
+REWRITTEN = "rewritten"
+
+# Bytes before the read offset compared to tell an append from a rewrite.
+FINGERPRINT_BYTES = 256
+# Appended data is read and parsed this many bytes at a time.
+APPEND_CHUNK_BYTES = 1 << 22
+
+
+def file_key(file_path: str) -> tuple[int, int, int] | None:
+    """
+    Returns a file's (inode, size, modification time), or None if it does not
+    exist. Any write to the file changes it.
+    """
+    try:
+        return DataFileWatcher._key_of(os.stat(file_path))
+    except FileNotFoundError:
+        return None
+
+
+def complete_records_end(data: bytes) -> int:
+    """
+    Returns the length of the longest prefix of data made of complete CSV
+    records, i.e. ending at a newline that is not inside a quoted field.
+
+    data must start at a record boundary.
+    """
+    end = data.rfind(b"\n") + 1
+    # An odd number of quotes before the newline means it is inside a field.
+    while end and data.count(b'"', 0, end) % 2:
+        end = data.rfind(b"\n", 0, end - 1) + 1
+    return end
+
+
+class DataFileWatcher:
+    """
+    Tracks how much of a CSV file has been read, and reads what is appended.
+
+        watcher = DataFileWatcher("employees.csv")
+        watcher.mark(offset)                  # after a full load
+        if watcher.check() == APPENDED:
+            for batch in watcher.read_appended():
+                repository.load(batch)
+
+    check() is cheap (a stat and a small read) and is meant to be polled.
+    read_appended() may run on a worker thread, as long as nothing else uses
+    the watcher until it finishes.
+
+    Attributes:
+        file_path (str): The CSV file watched.
+        offset (int): The byte offset just past the last row read.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.offset = 0
+        self.fieldnames: list[str] | None = None
+        self._stat_key: tuple[int, int, int] | None = None
+        self._inode: int | None = None
+        self._fingerprint = b""
+        # Newlines before offset; counted on the first append, for error reports.
+        self._lines: int | None = None
+
+    def mark(self, offset: int | None = None):
+        """
+        Records that the file has been read up to offset.
+
+        Args:
+            offset (int | None): Where the last full read stopped; defaults to
+                                 the current size of the file.
+        """
+        self._lines = None
+        try:
+            with open(self.file_path, mode='rb') as file:
+                stat = os.fstat(file.fileno())
+                self.offset = stat.st_size if offset is None else min(offset, stat.st_size)
+                self._remember(file, stat)
+                file.seek(0)
+                header = file.readline()
+        except FileNotFoundError:
+            self.offset = 0
+            self.fieldnames = None
+            self._stat_key = self._inode = None
+            self._fingerprint = b""
+            return
+        if not header or snapshot.is_snapshot_header(header) or compression.is_compressed(self.file_path):
+            # Without a header, check() reports any change as a rewrite.
+            self.fieldnames = None
+            return
+        self.fieldnames = next(csv.reader([header.decode('utf-8')]), None)
+
+    def check(self) -> str:
+        """
+        Compares the file on disk with what has been read.
+
+        Returns:
+            str: UNCHANGED, APPENDED or REWRITTEN.
+        """
+        try:
+            with open(self.file_path, mode='rb') as file:
+                stat = os.fstat(file.fileno())
+                if self._key_of(stat) == self._stat_key:
+                    return UNCHANGED
+                if (stat.st_ino != self._inode or stat.st_size < self.offset
+                        or not self.offset or not self.fieldnames
+                        or self._read_fingerprint(file) != self._fingerprint):
+                    return REWRITTEN
+                if stat.st_size == self.offset:
+                    # Touched but not changed where it matters.
+                    self._stat_key = self._key_of(stat)
+                    return UNCHANGED
+        except FileNotFoundError:
+            # Wait for the file to come back; it will then count as rewritten.
+            return UNCHANGED
+        return APPENDED
+
+    def read_appended(self, batch_size: int | None = None,
+                      on_error: ErrorCallback | None = None) -> Iterator[list[Employee]]:
+        """
+        Reads the complete rows appended since the offset, advancing the offset.
+
+        Rows are checked as in FileHandler.iter_employees(), except that IDs
+        already used are left for the repository to reject.
+
+        Args:
+            batch_size (int | None): The largest batch to yield; by default one
+                                     batch per APPEND_CHUNK_BYTES read.
+            on_error (ErrorCallback | None): As for FileHandler.iter_employees().
+
+        Yields:
+            list[Employee]: The appended employees, in file order.
+        """
+        validator = BatchValidator(check_duplicates=False)
+        with open(self.file_path, mode='rb') as file:
+            if self._lines is None:
+                self._lines = self._count_lines(file)
+            file.seek(self.offset)
+            pending = b""
+            while chunk := file.read(APPEND_CHUNK_BYTES):
+                data = pending + chunk
+                end = complete_records_end(data)
+                pending = data[end:]
+                if not end:
+                    continue
+                employees = FileHandler.parse_rows(data[:end].decode('utf-8'), self.fieldnames,
+                                                   first_line=self._lines + 1, on_error=on_error,
+                                                   validator=validator)
+                self.offset += end
+                self._lines += data.count(b"\n", 0, end)
+                step = batch_size or len(employees) or 1
+                for start in range(0, len(employees), step):
+                    yield employees[start:start + step]
+            stat = os.fstat(file.fileno())
+            self._remember(file, stat)
+            if stat.st_size == self.offset + len(pending):
+                # Everything on disk has been seen; an unfinished row will
+                # change the file's size when it is completed.
+                self._stat_key = self._key_of(stat)
+        if pending:
+            logging.info(f"Waiting for the last row of {self.file_path} to be completed.")
+
+    def _remember(self, file, stat: os.stat_result):
+        self._stat_key = self._key_of(stat) if stat.st_size == self.offset else None
+        self._inode = stat.st_ino
+        self._fingerprint = self._read_fingerprint(file)
+
+    def _read_fingerprint(self, file) -> bytes:
+        start = max(0, self.offset - FINGERPRINT_BYTES)
+        file.seek(start)
+        return file.read(self.offset - start)
+
+    def _count_lines(self, file) -> int:
+        file.seek(0)
+        lines = 0
+        remaining = self.offset
+        while remaining and (chunk := file.read(min(APPEND_CHUNK_BYTES, remaining))):
+            lines += chunk.count(b"\n")
+            remaining -= len(chunk)
+        return lines
+
+    @staticmethod
+    def _key_of(stat: os.stat_result) -> tuple[int, int, int]:
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,308 @@
+"""
+Lightweight timing spans, row counters and opt-in profiling.
+
+Slow operations are wrapped in named spans, either with the timed() decorator
+or the span() context manager. Each span name keeps a running count of calls,
+total, last and longest duration, and rows processed, so rows/sec can be shown
+in the status bar or the diagnostics window. Spans are meant for coarse steps
+(reading a file, refreshing the table), not for per-row work.
+
+Environment variables:
+
+    EMPLOYEE_APP_METRICS=0          Turns spans off. timed() then returns the
+                                    function unchanged and span() returns a
+                                    shared no-op span, so disabled
+                                    instrumentation costs nothing measurable.
+    EMPLOYEE_APP_PROFILE=cprofile   Profiles the GUI thread with cProfile.
+    EMPLOYEE_APP_PROFILE=tracemalloc
+                                    Records where memory is allocated.
+    EMPLOYEE_APP_PROFILE_FILE=path  Where the profile is written on exit. Defaults
+                                    to employee_app.prof (cProfile, readable with
+                                    pstats) or employee_app_memory.txt (tracemalloc).
+
+cProfile only sees the thread that started it, so background loads and exports
+appear in the spans but not in the cProfile output.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Callable
+
+METRICS_ENV = "EMPLOYEE_APP_METRICS"
+PROFILE_ENV = "EMPLOYEE_APP_PROFILE"
+PROFILE_FILE_ENV = "EMPLOYEE_APP_PROFILE_FILE"
+
+CPROFILE = "cprofile"
+TRACEMALLOC = "tracemalloc"
+DEFAULT_PROFILE_FILES = {CPROFILE: "employee_app.prof", TRACEMALLOC: "employee_app_memory.txt"}
+# Frames kept per allocation, and allocation sites written, by tracemalloc.
+TRACEMALLOC_FRAMES = 10
+TRACEMALLOC_TOP = 50
+
+ENABLED = os.environ.get(METRICS_ENV, "1") != "0"
+
+
+class SpanStats:
+    """
+    Accumulated timings for one span name.
+
+    Attributes:
+        calls (int): How many times the span completed.
+        total_seconds (float): Time spent in all calls.
+        last_seconds (float): Duration of the most recent call.
+        max_seconds (float): Duration of the longest call.
+        rows (int): Rows processed by the calls that reported a row count.
+        row_seconds (float): Time spent in the calls that reported a row count.
+    """
+    __slots__ = ("calls", "total_seconds", "last_seconds", "max_seconds", "rows", "row_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.last_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.row_seconds = 0.0
+
+    def add(self, seconds: float, rows: int | None = None):
+        self.calls += 1
+        self.total_seconds += seconds
+        self.last_seconds = seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if rows is not None:
+            self.rows += rows
+            self.row_seconds += seconds
+
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def rows_per_second(self) -> float | None:
+        """
+        Returns the throughput of the calls that reported rows, or None if none did.
+        """
+        if not self.row_seconds:
+            return None
+        return self.rows / self.row_seconds
+
+    def copy(self) -> "SpanStats":
+        clone = SpanStats()
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+
+class Metrics:
+    """
+    A thread-safe registry of SpanStats by span name.
+    """
+
+    def __init__(self):
+        self._stats: dict[str, SpanStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, rows: int | None = None):
+        """
+        Adds one completed call of a span.
+
+        Args:
+            name (str): The span name, e.g. "FileHandler.read_store".
+            seconds (float): How long the call took.
+            rows (int | None): How many rows it processed, if that is meaningful.
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = SpanStats()
+            stats.add(seconds, rows)
+
+    def get(self, name: str) -> SpanStats | None:
+        """
+        Returns a copy of the stats for one span, or None if it never ran.
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            return None if stats is None else stats.copy()
+
+    def snapshot(self) -> dict[str, SpanStats]:
+        """
+        Returns a copy of every span's stats, sorted by name.
+        """
+        with self._lock:
+            return {name: self._stats[name].copy() for name in sorted(self._stats)}
+
+    def reset(self):
+        """
+        Forgets every recorded call.
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> str:
+        """
+        Formats every span as a table, for logs and bug reports.
+        """
+        lines = [f"{'span':<36}{'calls':>7}{'last ms':>10}{'avg ms':>10}{'max ms':>10}{'rows/sec':>14}"]
+        for name, stats in self.snapshot().items():
+            rate = stats.rows_per_second()
+            lines.append(f"{name:<36}{stats.calls:>7}{stats.last_seconds * 1000:>10.1f}"
+                         f"{stats.average_seconds() * 1000:>10.1f}{stats.max_seconds * 1000:>10.1f}"
+                         f"{'' if rate is None else f'{rate:,.0f}':>14}")
+        return "\n".join(lines)
+
+
+metrics = Metrics()
+
+
+class _Span:
+    """
+    Times a with-block and records it in `metrics`. Set `rows` inside the
+    block to report how many rows it processed.
+    """
+    __slots__ = ("name", "rows", "_start")
+
+    def __init__(self, name: str, rows: int | None):
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            metrics.record(self.name, time.perf_counter() - self._start, self.rows)
+
+
+class _DisabledSpan:
+    """
+    The span returned while instrumentation is off; it records nothing.
+    """
+    rows = None
+
+    def __enter__(self) -> "_DisabledSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        pass
+
+    def __setattr__(self, name, value):
+        # Ignore `rows`, so callers need not check whether spans are enabled.
+        pass
+
+
+_DISABLED_SPAN = _DisabledSpan()
+
+
+def span(name: str, rows: int | None = None):
+    """
+    Returns a context manager that times its block as a span called `name`.
+
+        with span("refresh_treeview") as timing:
+            ...
+            timing.rows = len(rows)
+
+    When instrumentation is disabled this returns a shared no-op span.
+    """
+    if not ENABLED:
+        return _DISABLED_SPAN
+    return _Span(name, rows)
+
+
+def timed(name: str | None = None, rows: Callable[[object], int] | None = None):
+    """
+    Decorates a function so each successful call is recorded as a span.
+
+    Args:
+        name (str | None): The span name; defaults to the function's qualified name.
+        rows (Callable | None): Given the function's return value, returns the
+                                number of rows it processed, e.g. len.
+    """
+    def decorate(function):
+        if not ENABLED:
+            return function
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            metrics.record(label, time.perf_counter() - start, None if rows is None else rows(result))
+            return result
+        return wrapper
+    return decorate
+
+
+class _Profiling:
+    """
+    The profiler started by start_profiling(), if any.
+    """
+    mode: str | None = None
+    output: str | None = None
+    profiler = None
+
+
+def start_profiling(mode: str | None = None, output: str | None = None) -> str | None:
+    """
+    Starts cProfile or tracemalloc, as chosen by the arguments or the environment.
+
+    Args:
+        mode (str | None): CPROFILE or TRACEMALLOC; defaults to $EMPLOYEE_APP_PROFILE.
+        output (str | None): The file to write on stop_profiling(); defaults to
+                             $EMPLOYEE_APP_PROFILE_FILE or DEFAULT_PROFILE_FILES.
+
+    Returns:
+        str | None: The mode started, or None if profiling is off.
+
+    Raises:
+        ValueError: If the mode is not recognised.
+    """
+    mode = (mode or os.environ.get(PROFILE_ENV, "")).strip().lower() or None
+    if mode is None:
+        return None
+    if mode not in DEFAULT_PROFILE_FILES:
+        raise ValueError(f"Unknown profiling mode {mode!r}; use {CPROFILE!r} or {TRACEMALLOC!r}.")
+    stop_profiling()
+    _Profiling.mode = mode
+    _Profiling.output = output or os.environ.get(PROFILE_FILE_ENV) or DEFAULT_PROFILE_FILES[mode]
+    # The profilers are imported only when used, to keep startup fast.
+    if mode == CPROFILE:
+        import cProfile
+        _Profiling.profiler = cProfile.Profile()
+        _Profiling.profiler.enable()
+    else:
+        import tracemalloc
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    logging.info(f"Profiling with {mode}; results go to {_Profiling.output}")
+    return mode
+
+
+def stop_profiling() -> str | None:
+    """
+    Stops profiling and writes the results, along with the span report.
+
+    Returns:
+        str | None: The file written, or None if no profiler was running.
+    """
+    mode, output = _Profiling.mode, _Profiling.output
+    if mode is None:
+        return None
+    _Profiling.mode = _Profiling.output = None
+    if mode == CPROFILE:
+        profiler, _Profiling.profiler = _Profiling.profiler, None
+        profiler.disable()
+        profiler.dump_stats(output)
+    else:
+        import tracemalloc
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        top = snapshot.statistics("lineno")[:TRACEMALLOC_TOP]
+        with open(output, mode='w', encoding='utf-8') as file:
+            file.write(f"Top {len(top)} allocation sites by size\n\n")
+            for stat in top:
+                file.write(f"{stat}\n")
+            file.write(f"\nSpans\n\n{metrics.report()}\n")
+    logging.info(f"Profile written to {output}\n{metrics.report()}")
+    return output
@@ -0,0 +1,252 @@
+"""
+Defines the EmployeeJournal class, an append-only write-ahead log of roster changes.
+
+Rewriting the whole CSV file to save one new employee costs time proportional to
+the size of the roster. Instead, changes are appended to a journal file next to
+the CSV snapshot as small CSV rows, and flushed to disk with fsync before
+append_records() returns. Replay understands adds, updates and deletes:
+
+    add,101,Jane,Doe,Engineering,Developer
+    update,101,Jane,Doe,Marketing,Developer
+    delete,101
+
+The GUI does not append each change as it is made. It collects them in
+PendingChanges, which keeps only the latest change per employee, and writes
+them with append_records() after edits pause, so a burst of changes costs one
+write and one fsync.
+
+On startup the journal is replayed over the snapshot. Once it grows past a
+threshold it is compacted: begin_compaction() moves the journal aside, the
+caller writes the current roster as a new snapshot, and finish_compaction()
+discards the old journal.
+
+Compaction first moves the journal aside (to "<journal>.old") so new changes can
+keep being appended while the snapshot is written. Replay applies the rotated
+journal's entries as upserts or idempotent deletes, so replaying entries that
+are already part of the snapshot, e.g. after a crash mid-compaction, does no
+harm. In the current journal an add of an ID the roster already holds is
+refused unless it repeats that employee exactly: the employee in the snapshot
+is kept, as EmployeeRepository.load() keeps the first row with an ID.
+"""
+
+import csv
+import io
+import logging
+import os
+
+from employee import Employee
+from employee_repository import EmployeeRepository
+
+ADD = "add"
+UPDATE = "update"
+DELETE = "delete"
+
+# Compact once the journal holds this many entries.
+COMPACT_THRESHOLD = 1000
+
+
+class EmployeeJournal:
+    """
+    Appends roster changes to a journal file and replays them on startup.
+
+    Attributes:
+        snapshot_path (str): The CSV snapshot the journal applies to.
+        journal_path (str): The journal file.
+        compact_threshold (int): Entry count at which needs_compaction() is True.
+        entries (int): The number of entries in the journal files.
+    """
+
+    def __init__(self, snapshot_path: str, journal_path: str | None = None,
+                 compact_threshold: int = COMPACT_THRESHOLD):
+        """
+        Initialises the journal. No file is created until the first append.
+
+        Args:
+            snapshot_path (str): The path to the CSV snapshot.
+            journal_path (str | None): The path to the journal; defaults to
+                                       "<snapshot_path>.journal".
+            compact_threshold (int): See needs_compaction().
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or f"{snapshot_path}.journal"
+        self.compact_threshold = compact_threshold
+        self.entries = 0
+        self._file = None
+
+    @property
+    def rotated_path(self) -> str:
+        return f"{self.journal_path}.old"
+
+    def append_records(self, records: list[list[str]]):
+        """
+        Appends several entries with a single write and waits until they are on disk.
+
+        Args:
+            records (list[list[str]]): Entries as made by PendingChanges.take().
+        """
+        if not records:
+            return
+        if self._file is None:
+            self._file = open(self.journal_path, mode='a', newline='', encoding='utf-8')
+        csv.writer(self._file).writerows(records)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.entries += len(records)
+
+    def replay(self, repository: EmployeeRepository) -> int:
+        """
+        Applies every journal entry to a repository loaded from the snapshot.
+
+        Entries left by an unfinished compaction are applied first. A final entry
+        cut short by a crash is discarded and removed from the file.
+
+        Args:
+            repository (EmployeeRepository): The repository to update.
+
+        Returns:
+            int: The number of entries applied.
+        """
+        applied = 0
+        for path, upsert_adds in ((self.rotated_path, True), (self.journal_path, False)):
+            for line_number, record in self._read_records(path):
+                try:
+                    self._apply(repository, record, upsert_adds)
+                    applied += 1
+                except ValueError as e:
+                    logging.warning(f"Skipping journal entry on line {line_number} of {path}: {e}")
+        self.entries = applied
+        return applied
+
+    def needs_compaction(self) -> bool:
+        return self.entries >= self.compact_threshold
+
+    def begin_compaction(self):
+        """
+        Moves the current journal aside so a new snapshot can be written.
+
+        Changes recorded after this call go to a fresh journal. If an earlier
+        compaction never finished, its rotated journal is kept as it is.
+        """
+        self.close()
+        if os.path.exists(self.journal_path) and not os.path.exists(self.rotated_path):
+            os.replace(self.journal_path, self.rotated_path)
+        self.entries = 0
+
+    def finish_compaction(self):
+        """
+        Discards the rotated journal once the new snapshot is safely on disk.
+        """
+        try:
+            os.remove(self.rotated_path)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        """
+        Closes the journal file if it is open.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_records(self, path: str):
+        """
+        Yields (line_number, record) pairs from a journal file.
+
+        A trailing partial line (no final newline) is a torn write from a crash;
+        it is truncated away so the next append starts on a fresh line.
+        """
+        try:
+            with open(path, mode='rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            logging.warning(f"Discarding incomplete final entry in {path}")
+            with open(path, mode='r+b') as file:
+                file.truncate(end)
+            data = data[:end]
+        reader = csv.reader(io.StringIO(data.decode('utf-8'), newline=''))
+        for record in reader:
+            yield reader.line_num, record
+
+    @staticmethod
+    def _apply(repository: EmployeeRepository, record: list[str], upsert_adds: bool = False):
+        """
+        Applies a single entry. Updates are upserts and deletes of missing
+        employees are ignored. An add of an ID already in the repository is
+        refused unless it repeats that employee exactly or upsert_adds is True.
+
+        Raises:
+            ValueError: If the entry is malformed or adds an existing ID.
+        """
+        if record and record[0] in (ADD, UPDATE) and len(record) == 6:
+            employee = Employee(*record[1:])
+            existing = repository.get(employee.employee_id)
+            if existing is not None and record[0] == ADD and not upsert_adds:
+                if existing.to_list() != record[1:]:
+                    raise ValueError(f"employee ID {employee.employee_id} already exists")
+            elif existing is not None:
+                repository.update(employee)
+            else:
+                repository.add(employee)
+        elif record and record[0] == DELETE and len(record) == 2:
+            if record[1] in repository:
+                repository.delete(record[1])
+        else:
+            raise ValueError(f"unrecognised entry {record!r}")
+
+
+class PendingChanges:
+    """
+    Roster changes made in memory but not yet written to the journal.
+
+    Only the latest entry for each employee is kept, so a burst of changes
+    costs one entry per employee. The GUI only adds employees, and only once
+    the whole roster is loaded, so each entry adds an ID the roster lacks;
+    replay() and apply() refuse one that would replace an existing employee.
+
+        pending.add(employee)
+        journal.append_records(pending.take())
+    """
+
+    def __init__(self):
+        # employee_id -> the journal entry for the latest change
+        self._records: dict[str, list[str]] = {}
+
+    def add(self, employee: Employee):
+        self._records[employee.employee_id] = [ADD, *employee.to_list()]
+
+    def apply(self, repository: EmployeeRepository):
+        """
+        Applies the pending changes to a repository, e.g. one just reloaded from disk.
+
+        An add whose ID the repository now holds for a different employee is
+        logged and dropped, so it is never written to the journal.
+        """
+        for employee_id, record in list(self._records.items()):
+            try:
+                EmployeeJournal._apply(repository, record)
+            except ValueError as e:
+                logging.warning(f"Discarding unsaved change: {e}")
+                del self._records[employee_id]
+
+    def take(self) -> list[list[str]]:
+        """
+        Returns the pending entries and forgets them.
+        """
+        records = list(self._records.values())
+        self._records.clear()
+        return records
+
+    def restore(self, records: list[list[str]]):
+        """
+        Puts back entries from take() that could not be written, unless the
+        employee has changed again since.
+        """
+        for record in records:
+            self._records.setdefault(record[1], record)
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -7,18 +7,40 @@ It orchestrates the interactions between the user interface and the backend logi
 """
 
 import os
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+from aggregates import Headcounts
 from employee import Employee
-from file_handler import FileHandler
+from background_tasks import (BackgroundAppendReader, BackgroundExporter, BackgroundJournalWriter, BackgroundLoader,
+                              BackgroundTask)
+from employee_repository import EmployeeRepository
+from journal import EmployeeJournal, PendingChanges
+from file_handler import FIELDNAMES
+from file_watcher import APPENDED, REWRITTEN, UNCHANGED, DataFileWatcher, file_key
+import instrumentation
+from instrumentation import metrics, span, timed
+from search_index import SearchIndex
+from sort_orders import SortOrders
 from validator import is_valid_employee_id, is_present
+from virtual_treeview import EmployeeSubset, EmployeeTable
 
 # Define the path for the data file relative to the script's location
 # Get the directory where the script is located.
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Define the path for the data file relative to the script's directory.
 DATA_FILE = os.path.join(SCRIPT_DIR, "employees.csv")
+# How long typing must pause before the search box filters the table.
+SEARCH_DEBOUNCE_MS = 200
+# How often DATA_FILE is checked for rows appended by other programs.
+WATCH_INTERVAL_MS = 2000
+# The headcount panel is redrawn at most this often while rows arrive.
+SUMMARY_REFRESH_MS = 500
+# Changes are saved once edits pause for this long...
+AUTOSAVE_DELAY_MS = 1000
+# ...or at the latest this long after the first unsaved change.
+AUTOSAVE_MAX_DELAY_MS = 10000
 
 class EmployeeApp(tk.Tk):
     """
@@ -37,28 +59,69 @@ class EmployeeApp(tk.Tk):
         self.title("Employee Management System")
         self.geometry("900x600")
 
-        self.employees: list[Employee] = []
+        self.repository = EmployeeRepository()
+        self.search_index = SearchIndex()
+        self._search_job: str | None = None
+        self.headcounts = Headcounts()
+        self._summary_job: str | None = None
+        self.sort_orders = SortOrders(self.repository)
+        # Index into FIELDNAMES of the column the table is sorted by, if any.
+        self.sort_column: int | None = None
+        self.sort_descending = False
+        self.loader: BackgroundLoader | None = None
+        self.exporter: BackgroundExporter | None = None
+        # The load or export the Cancel button stops: the one started last.
+        self.foreground_task: BackgroundTask | None = None
+        # New employees are appended to a journal next to DATA_FILE instead of
+        # rewriting the whole file; see journal.py. Changes wait in `pending`
+        # until edits pause and are then written on a background thread.
+        self.journal = EmployeeJournal(DATA_FILE)
+        self.pending = PendingChanges()
+        self.journal_writer: BackgroundJournalWriter | None = None
+        self._autosave_job: str | None = None
+        self._autosave_deadline = 0.0
+        self.compactor: BackgroundExporter | None = None
+        self.fully_loaded = False
+        # Picks up rows other programs append to DATA_FILE without a full reload.
+        self.watcher = DataFileWatcher(DATA_FILE)
+        self.append_reader: BackgroundAppendReader | None = None
+        self._watch_job: str | None = None
 
         # --- Main Layout --- #
         main_frame = ttk.Frame(self, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # --- Employee Display Treeview --- #
-        tree_frame = ttk.Frame(main_frame)
-        tree_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-
-        columns = ("ID", "First Name", "Last Name", "Department", "Job Title")
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        # --- Search Box --- #
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X)
+        ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self._on_search_changed)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
 
-        for col in columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, width=150)
+        content = ttk.PanedWindow(main_frame, orient=tk.HORIZONTAL)
+        content.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # --- Employee Display Treeview --- #
+        # Virtual mode keeps only the visible rows as Tk items, so refreshing
+        # stays fast however large the roster gets.
+        columns = ("ID", "First Name", "Last Name", "Department", "Job Title")
+        self.table = EmployeeTable(content, columns, self.repository, virtual=True,
+                                   on_heading_click=self.sort_by)
+        content.add(self.table, weight=3)
+
+        # --- Headcount Summary --- #
+        # Departments, each expandable into its job titles. The counts are kept
+        # up to date as employees change, so redrawing never scans the roster.
+        summary_frame = ttk.LabelFrame(content, text="Headcount", padding="5")
+        content.add(summary_frame, weight=1)
+        self.summary = ttk.Treeview(summary_frame, columns=("count",), selectmode="none")
+        self.summary.heading("#0", text="Department / Job Title")
+        self.summary.heading("count", text="Employees")
+        self.summary.column("#0", width=180)
+        self.summary.column("count", width=80, anchor=tk.E)
+        self.summary.pack(fill=tk.BOTH, expand=True)
 
         # --- Input Form for New Employees --- #
         form_frame = ttk.LabelFrame(main_frame, text="Add New Employee", padding="10")
@@ -85,44 +148,407 @@ class EmployeeApp(tk.Tk):
         export_button = ttk.Button(button_frame, text="Export to CSV", command=self.export_to_csv)
         export_button.pack(side=tk.LEFT, padx=5)
 
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel_foreground_task,
+                                        state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
+        diagnostics_button = ttk.Button(button_frame, text="Diagnostics", command=self.show_diagnostics)
+        diagnostics_button.pack(side=tk.LEFT, padx=5)
+
+        # Shows the progress of a background load or export.
+        self.progress = ttk.Progressbar(button_frame, length=200, mode="determinate", maximum=100)
+        self.progress.pack(side=tk.RIGHT, padx=5)
+
         # --- Status Bar --- #
         self.status_var = tk.StringVar()
         status_bar = ttk.Label(self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W, padding="5")
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # --- Initial Data Load --- #
         self.load_employees()
 
     def load_employees(self):
         """
-        Loads employees from the CSV file and populates the treeview.
-        Handles potential errors like the file not being found.
+        Starts loading employees from the CSV file on a background thread.
+
+        The window stays responsive while the file is parsed: rows are added to
+        the treeview batch by batch and the status bar shows progress.
+        """
+        self.repository = EmployeeRepository()
+        self.search_index = SearchIndex()
+        self.repository.attach(self.search_index)
+        self.sort_orders = SortOrders(self.repository)
+        self.repository.attach(self.sort_orders)
+        self.headcounts = Headcounts()
+        self.repository.attach(self.headcounts)
+        self.fully_loaded = False
+        self.table.set_source(self.repository)
+        self.loader = BackgroundLoader(self, DATA_FILE, on_batch=self._on_load_batch,
+                                       on_done=self._on_load_done, on_error=self._on_load_error)
+        self.foreground_task = self.loader
+        self.cancel_button.configure(state=tk.NORMAL)
+        self.update_status(f"Loading employees from {DATA_FILE}...")
+        self.loader.start()
+
+    def cancel_foreground_task(self):
+        """
+        Stops the load or export started last, leaving any other task running.
+
+        A cancelled load keeps the rows loaded so far; a cancelled export leaves
+        the destination file untouched.
+        """
+        task = self.foreground_task
+        if task is not None and not task.finished:
+            task.cancel()
+
+    def cancel_background_tasks(self):
+        """
+        Stops any load, export or compaction that is in progress.
         """
+        for task in (self.loader, self.exporter, self.compactor):
+            if task is not None and not task.finished:
+                task.cancel()
+
+    def _task_finished(self):
+        """
+        Hands the cancel button to the load or export still running, or resets
+        it and the progress bar once neither is.
+        """
+        running = [task for task in (self.loader, self.exporter) if task is not None and not task.finished]
+        if running:
+            self.foreground_task = running[0]
+            return
+        self.foreground_task = None
+        self.cancel_button.configure(state=tk.DISABLED)
+        self.progress["value"] = 0
+
+    def _on_load_batch(self, batch: list[Employee]):
+        start = len(self.repository)
+        self.repository.load(batch)
+        if self.table.source is self.repository:
+            self.table.rows_appended(start)
+        self._schedule_summary()
+        self.progress["value"] = self.loader.percent_read()
+        self.update_status(f"Loading... {self.loader.rows_loaded:,} rows "
+                           f"({self.loader.percent_read():.0f}%, {self.loader.rows_per_second():,.0f} rows/sec)")
+
+    def _on_load_done(self, cancelled: bool):
+        self._task_finished()
+        if cancelled:
+            self.update_status(f"Load cancelled after {len(self.repository)} employees.")
+            return
+        # replay() reads the journal, so a write in progress must finish first.
+        writer = self.journal_writer
+        if writer is not None and not writer.finished:
+            writer.wait()
+            if not writer.written:
+                self.pending.restore(writer.records)
         try:
-            self.employees = FileHandler.read_employees(DATA_FILE)
-            self.refresh_treeview()
-            self.update_status(f"Loaded {len(self.employees)} employees from {DATA_FILE}")
+            replayed = self.journal.replay(self.repository)
         except Exception as e:
-            messagebox.showerror("Error Loading Data", f"Failed to load employee data: {e}")
-            self.update_status("Error: Could not load data.")
+            messagebox.showerror("Error Loading Data", f"Failed to replay the change journal: {e}")
+            self.update_status("Error: Could not replay recent changes.")
+            return
+        # Changes not yet saved are not in the journal, so apply them again.
+        self.pending.apply(self.repository)
+        self.fully_loaded = True
+        self.watcher.mark(self.loader.end_offset)
+        self._schedule_watch()
+        self.show_rows()
+        self.refresh_summary()
+        elapsed = self.loader.elapsed()
+        if instrumentation.ENABLED:
+            metrics.record("EmployeeApp.load_employees", elapsed, self.loader.rows_loaded)
+        self.update_status(f"Loaded {len(self.repository)} employees from {DATA_FILE}"
+                           + (f" and {replayed} recent changes" if replayed else "")
+                           + f" in {elapsed:.1f}s ({self.loader.rows_per_second():,.0f} rows/sec)")
+        self.compact_journal_if_needed()
+
+    def compact_journal_if_needed(self):
+        """
+        Folds the journal back into DATA_FILE once it has grown past its threshold.
+
+        The new snapshot is written on a background thread. Compaction only runs
+        after a complete load, since a partial roster must never replace the file,
+        and only while DATA_FILE holds nothing the roster lacks: rows another
+        program appends are read first, and if DATA_FILE changes while the
+        snapshot is written, the snapshot is discarded rather than moved over it.
+        """
+        if not self.fully_loaded or not self.journal.needs_compaction():
+            return
+        if any(task is not None and not task.finished for task in (self.compactor, self.append_reader)):
+            return
+        if self.watcher.check() != UNCHANGED:
+            # check_data_file() reads the changes first; compaction is retried afterwards.
+            return
+        if self.journal_writer is not None and not self.journal_writer.finished:
+            # Checked again when the write finishes; the journal cannot be
+            # rotated while it is being appended to.
+            return
+        self.journal.begin_compaction()
+        expected_key = file_key(DATA_FILE)
+        self.compactor = BackgroundExporter(self, DATA_FILE, self.repository.snapshot(),
+                                            precondition=lambda: file_key(DATA_FILE) == expected_key,
+                                            on_done=self._on_compaction_done, on_error=self._on_compaction_error)
+        self.compactor.start()
+
+    def _on_compaction_done(self, cancelled: bool):
+        # An abandoned compaction keeps the rotated journal, so no changes are
+        # lost; it is retried the next time the journal is checked.
+        if self.compactor.completed:
+            self.journal.finish_compaction()
+            # The file up to bytes_written holds exactly the roster shown; rows
+            # appended after the replace are past that offset and still read.
+            self.watcher.mark(self.compactor.bytes_written)
+
+    def _on_compaction_error(self, error: Exception):
+        # The rotated journal is kept, so no changes are lost; compaction is
+        # simply retried the next time the journal is full.
+        self.update_status(f"Warning: could not compact {DATA_FILE}: {error}")
+
+    def _schedule_autosave(self):
+        """
+        Saves pending changes once edits pause for AUTOSAVE_DELAY_MS, so a
+        burst of changes is written once. Steady editing still saves every
+        AUTOSAVE_MAX_DELAY_MS.
+        """
+        now = time.monotonic()
+        if self._autosave_job is None:
+            self._autosave_deadline = now + AUTOSAVE_MAX_DELAY_MS / 1000
+        else:
+            self.after_cancel(self._autosave_job)
+        delay_ms = min(AUTOSAVE_DELAY_MS, max(0, int((self._autosave_deadline - now) * 1000)))
+        self._autosave_job = self.after(delay_ms, self.autosave)
+
+    def autosave(self):
+        """
+        Writes the pending changes to the journal on a background thread.
+        """
+        self._autosave_job = None
+        if not self.pending:
+            return
+        if self.journal_writer is not None and not self.journal_writer.finished:
+            # Saved when the write in progress finishes.
+            return
+        self.journal_writer = BackgroundJournalWriter(self, self.journal, self.pending.take(),
+                                                      on_done=self._on_autosave_done,
+                                                      on_error=self._on_autosave_error)
+        self.journal_writer.start()
+
+    def _on_autosave_done(self, cancelled: bool):
+        if self.pending and self._autosave_job is None:
+            self._schedule_autosave()
+        self.compact_journal_if_needed()
+
+    def _on_autosave_error(self, error: Exception):
+        self.pending.restore(self.journal_writer.records)
+        self.update_status(f"Warning: could not save {len(self.pending)} changes to "
+                           f"{self.journal.journal_path}: {error}")
+        if self._autosave_job is None:
+            self._autosave_job = self.after(AUTOSAVE_MAX_DELAY_MS, self.autosave)
+
+    def flush_pending_changes(self) -> bool:
+        """
+        Waits for a save in progress and writes any remaining changes, on the
+        calling thread.
+
+        Returns:
+            bool: Whether every change is on disk.
+        """
+        if self._autosave_job is not None:
+            self.after_cancel(self._autosave_job)
+            self._autosave_job = None
+        writer = self.journal_writer
+        if writer is not None and not writer.finished:
+            writer.wait()
+            if not writer.written:
+                self.pending.restore(writer.records)
+        records = self.pending.take()
+        try:
+            self.journal.append_records(records)
+        except OSError as e:
+            self.pending.restore(records)
+            messagebox.showerror("Save Error", f"Could not save {len(records)} changes: {e}")
+            return False
+        return True
+
+    def _schedule_watch(self):
+        if self._watch_job is None:
+            self._watch_job = self.after(WATCH_INTERVAL_MS, self.check_data_file)
+
+    def check_data_file(self):
+        """
+        Picks up changes other programs made to DATA_FILE.
+
+        Appended rows are read from where the last read stopped and added to
+        the table; a file that was truncated or rewritten is loaded again.
+        Runs every WATCH_INTERVAL_MS while the roster is fully loaded.
+        """
+        self._watch_job = None
+        busy = (self.loading() or not self.fully_loaded
+                or any(task is not None and not task.finished
+                       for task in (self.append_reader, self.compactor, self.journal_writer)))
+        if busy:
+            self._schedule_watch()
+            return
+        change = self.watcher.check()
+        if change == REWRITTEN:
+            self.load_employees()
+            return
+        if change == APPENDED:
+            self.append_reader = BackgroundAppendReader(self, self.watcher, on_batch=self._on_append_batch,
+                                                        on_done=self._on_append_done,
+                                                        on_error=self._on_append_error)
+            self.append_reader.start()
+        self._schedule_watch()
+
+    def _on_append_batch(self, batch: list[Employee]):
+        start = len(self.repository)
+        self.repository.load(batch)
+        if self.table.source is self.repository:
+            self.table.rows_appended(start)
+        self._schedule_summary()
+
+    def _on_append_done(self, cancelled: bool):
+        self.compact_journal_if_needed()
+        if cancelled or not self.append_reader.rows_loaded:
+            return
+        if instrumentation.ENABLED:
+            metrics.record("EmployeeApp.read_appended", self.append_reader.elapsed(),
+                           self.append_reader.rows_loaded)
+        if self.table.source is not self.repository:
+            # Place the new rows in the current search results and sort order.
+            self.show_rows()
+        self.update_status(f"Added {self.append_reader.rows_loaded:,} employees appended to {DATA_FILE}; "
+                           f"{len(self.repository):,} in total.")
+
+    def _on_append_error(self, error: Exception):
+        # The offset only moves past rows that were read, so the next check retries.
+        self.update_status(f"Warning: could not read new rows from {DATA_FILE}: {error}")
+
+    def _on_load_error(self, error: Exception):
+        self._task_finished()
+        messagebox.showerror("Error Loading Data", f"Failed to load employee data: {error}")
+        self.update_status("Error: Could not load data.")
+
+    def on_close(self):
+        """
+        Saves pending changes, stops any background work and closes the window.
 
+        If the changes cannot be saved, the user may keep the window open.
+        """
+        if not self.flush_pending_changes() and not messagebox.askyesno(
+                "Unsaved Changes", f"{len(self.pending)} changes could not be saved. Close anyway?"):
+            return
+        self.cancel_background_tasks()
+        # Worker threads are daemons and die with the window, which would leave
+        # a half-written temporary file next to DATA_FILE or the export target.
+        # Cancelled writers remove their own temporary file, so wait for them.
+        for task in (self.exporter, self.compactor):
+            if task is not None and not task.finished:
+                task.wait()
+        if self.compactor is not None and not self.compactor.finished and self.compactor.completed:
+            self.journal.finish_compaction()
+        if self._watch_job is not None:
+            self.after_cancel(self._watch_job)
+        if self.append_reader is not None:
+            self.append_reader.cancel()
+        if self._summary_job is not None:
+            self.after_cancel(self._summary_job)
+        self.journal.close()
+        self.destroy()
+
+    @timed("EmployeeApp.refresh_treeview")
     def refresh_treeview(self):
         """
-        Clears and repopulates the treeview with current employee data.
+        Redraws the treeview from the current employee data.
         """
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add new items
-        for emp in self.employees:
-            self.tree.insert("", tk.END, values=emp.to_list())
+        self.table.refresh()
+
+    def searching(self) -> bool:
+        """
+        Returns True if the search box is filtering the table.
+        """
+        return bool(self.search_var.get().strip())
+
+    def _on_search_changed(self, *args):
+        # Wait for a pause in typing rather than searching on every keystroke.
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DEBOUNCE_MS, self.apply_search)
+
+    def apply_search(self):
+        """
+        Filters the table to the employees matching the search box.
+        """
+        self._search_job = None
+        self.show_rows()
+
+    def sort_by(self, column: int):
+        """
+        Sorts the table by a column; sorting by the same column again reverses it.
+
+        Args:
+            column (int): The index of the column in FIELDNAMES.
+        """
+        if column == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = False
+        self.table.show_sort_indicator(column, self.sort_descending)
+        self.show_rows()
+
+    def loading(self) -> bool:
+        """
+        Returns True while employees are being loaded in the background.
+        """
+        return self.loader is not None and not self.loader.finished
+
+    @timed("EmployeeApp.show_rows")
+    def show_rows(self):
+        """
+        Shows the employees matching the search box, in the chosen sort order.
+
+        Without a search or sort the table reads the repository directly.
+        Sorting waits until loading finishes: keeping an order up to date
+        while thousands of rows arrive would cost more than sorting once.
+        """
+        start = time.perf_counter()
+        field = None
+        if self.sort_column is not None and not self.loading():
+            field = FIELDNAMES[self.sort_column]
+        if self.searching():
+            matches = self.search_index.search(self.search_var.get())
+            if field is None:
+                ids = self.repository.in_row_order(matches)
+            else:
+                ids = self.sort_orders.sort(matches, field, self.sort_descending)
+            self.table.set_source(EmployeeSubset(self.repository, ids))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.update_status(f"{len(ids):,} matching employees ({elapsed_ms:.0f} ms)")
+        elif field is not None:
+            self.table.set_source(EmployeeSubset(self.repository, self.sort_orders.order(field, self.sort_descending)))
+        else:
+            self.table.set_source(self.repository)
 
     def add_employee(self):
         """
         Validates input and adds a new employee to the list.
         Includes input validation and exception handling.
         """
+        if self.loading():
+            messagebox.showwarning("Loading", "Please wait for the employee data to finish loading.")
+            return
+        if not self.fully_loaded:
+            # The ID check below only sees the rows loaded so far, and the
+            # journal would let a repeated ID replace the employee on disk.
+            messagebox.showwarning("Partial Roster", "Employees cannot be added because the employee data "
+                                                     "was not fully loaded. Restart to load it again.")
+            return
+
         # --- Input Validation --- #
         emp_id = self.entries["Employee ID"].get()
         if not is_valid_employee_id(emp_id):
@@ -130,7 +556,7 @@ class EmployeeApp(tk.Tk):
             return
         
         # Check if employee ID already exists
-        if any(emp.employee_id == emp_id for emp in self.employees):
+        if emp_id in self.repository:
             messagebox.showerror("Invalid Input", f"Employee ID {emp_id} already exists.")
             return
 
@@ -145,9 +571,16 @@ class EmployeeApp(tk.Tk):
 
         # --- Add Employee --- #
         try:
-            new_employee = Employee(emp_id, first_name, last_name, department, job_title)
-            self.employees.append(new_employee)
-            self.refresh_treeview()
+            with span("EmployeeApp.add_employee", rows=1):
+                new_employee = Employee(emp_id, first_name, last_name, department, job_title)
+                self.repository.add(new_employee)
+                self.pending.add(new_employee)
+                self._schedule_autosave()
+                self._schedule_summary()
+                if self.table.source is self.repository:
+                    self.table.row_added(len(self.repository) - 1)
+                else:
+                    self.show_rows()
             self.clear_form()
             self.update_status(f"Successfully added employee: {first_name} {last_name}")
         except Exception as e:
@@ -158,27 +591,115 @@ class EmployeeApp(tk.Tk):
         """
         Exports the current list of employees to a new CSV file.
         Asks the user for a file location to save to.
+
+        The file is written on a background thread from a snapshot of the
+        roster. It is written to a temporary file first and moved into place
+        only once complete, so cancelling or a crash never leaves a partial file.
         """
-        if not self.employees:
+        if not self.repository:
             messagebox.showwarning("No Data", "There is no employee data to export.")
             return
+        if self.exporter is not None and not self.exporter.finished:
+            messagebox.showwarning("Export In Progress", "Please wait for the current export to finish.")
+            return
 
-        try:
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                title="Save Employee Data As"
-            )
-            if not file_path:
-                self.update_status("Export cancelled.")
-                return
-
-            FileHandler.write_employees(file_path, self.employees)
-            messagebox.showinfo("Export Successful", f"Data successfully exported to {file_path}")
-            self.update_status(f"Exported {len(self.employees)} records to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export data: {e}")
-            self.update_status("Error: Export failed.")
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Save Employee Data As"
+        )
+        if not file_path:
+            self.update_status("Export cancelled.")
+            return
+
+        self.exporter = BackgroundExporter(self, file_path, self.repository.snapshot(),
+                                           on_progress=self._on_export_progress,
+                                           on_done=self._on_export_done, on_error=self._on_export_error)
+        self.foreground_task = self.exporter
+        self.cancel_button.configure(state=tk.NORMAL)
+        self.update_status(f"Exporting {self.exporter.total_rows} records to {file_path}...")
+        self.exporter.start()
+
+    def _on_export_progress(self):
+        self.progress["value"] = self.exporter.percent_written()
+        self.update_status(f"Exporting... {self.exporter.rows_written:,} of {self.exporter.total_rows:,} records")
+
+    def _on_export_done(self, cancelled: bool):
+        self._task_finished()
+        # A Cancel that arrives after the file was moved into place is too late.
+        if not self.exporter.completed:
+            self.update_status("Export cancelled.")
+            return
+        file_path = self.exporter.file_path
+        messagebox.showinfo("Export Successful", f"Data successfully exported to {file_path}")
+        self.update_status(f"Exported {self.exporter.total_rows} records to {file_path}")
+
+    def _on_export_error(self, error: Exception):
+        self._task_finished()
+        messagebox.showerror("Export Error", f"Failed to export data: {error}")
+        self.update_status("Error: Export failed.")
+
+    def _schedule_summary(self):
+        if self._summary_job is None:
+            self._summary_job = self.after(SUMMARY_REFRESH_MS, self.refresh_summary)
+
+    def refresh_summary(self):
+        """
+        Redraws the headcount panel from the maintained counts.
+        """
+        if self._summary_job is not None:
+            self.after_cancel(self._summary_job)
+            self._summary_job = None
+        expanded = {self.summary.item(item, "text") for item in self.summary.get_children()
+                    if self.summary.item(item, "open")}
+        self.summary.delete(*self.summary.get_children())
+        parents = {}
+        for department, job_title, count in self.headcounts.rows():
+            parent = parents.get(department)
+            if parent is None:
+                parent = parents[department] = self.summary.insert(
+                    "", tk.END, text=department, values=(f"{self.headcounts.departments[department]:,}",),
+                    open=department in expanded)
+            self.summary.insert(parent, tk.END, text=job_title, values=(f"{count:,}",))
+        self.summary.insert("", tk.END, text="Total", values=(f"{self.headcounts.total():,}",))
+
+    def show_diagnostics(self):
+        """
+        Opens a window listing how long each instrumented step has taken.
+        """
+        window = tk.Toplevel(self)
+        window.title("Diagnostics")
+        window.geometry("760x320")
+        if not instrumentation.ENABLED:
+            ttk.Label(window, text=f"Instrumentation is turned off ({instrumentation.METRICS_ENV}=0).",
+                      padding="10").pack()
+            return
+
+        columns = ("Span", "Calls", "Last ms", "Avg ms", "Max ms", "Rows/sec")
+        tree = ttk.Treeview(window, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=260 if col == "Span" else 90, anchor=tk.W if col == "Span" else tk.E)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        def refresh():
+            tree.delete(*tree.get_children())
+            for name, stats in metrics.snapshot().items():
+                rate = stats.rows_per_second()
+                tree.insert("", tk.END, values=(
+                    name, stats.calls, f"{stats.last_seconds * 1000:.1f}",
+                    f"{stats.average_seconds() * 1000:.1f}", f"{stats.max_seconds * 1000:.1f}",
+                    "" if rate is None else f"{rate:,.0f}"))
+
+        def reset():
+            metrics.reset()
+            refresh()
+
+        buttons = ttk.Frame(window)
+        buttons.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(buttons, text="Refresh", command=refresh).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Reset", command=reset).pack(side=tk.LEFT, padx=5)
+        refresh()
 
     def clear_form(self):
         """
@@ -197,5 +718,10 @@ class EmployeeApp(tk.Tk):
         self.status_var.set(message)
 
 if __name__ == "__main__":
-    app = EmployeeApp()
-    app.mainloop()
+    # Profiling is off unless EMPLOYEE_APP_PROFILE is set; see instrumentation.py.
+    instrumentation.start_profiling()
+    try:
+        app = EmployeeApp()
+        app.mainloop()
+    finally:
+        instrumentation.stop_profiling()
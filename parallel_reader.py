@@ -0,0 +1,222 @@
+"""
+Parses large CSV files on several CPU cores at once.
+
+The file is split into byte ranges that each start and end on a record
+boundary, and each range is parsed into an EmployeeStore by a separate process
+in a ProcessPoolExecutor. Each worker also checks its rows as
+FileHandler.iter_employees does. The stores are then merged in file order,
+dropping IDs an earlier row already used, so the result is the same as
+FileHandler.read_store.
+
+Quoted fields may contain newlines, so a newline is only a record boundary if
+every quote before it has been closed. Finding the split points therefore
+counts the quotes in the file, but that pass runs at C speed and is much
+cheaper than parsing.
+"""
+
+import csv
+import io
+import mmap
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+import compression
+from csv_index import parse_record, record_spans
+from employee_store import EmployeeStore
+from file_handler import FIELDNAMES, ErrorCallback, FileHandler, _log_bad_row
+from validator import DUPLICATE_ID, BatchValidator, ValidationError, ValidationIssue
+
+# Chunks smaller than this are not worth the cost of another process.
+MIN_CHUNK_BYTES = 4 * 1024 * 1024
+# Quotes are counted in blocks of this size, to bound the memory used.
+SCAN_BLOCK_BYTES = 16 * 1024 * 1024
+
+
+def default_worker_count(file_size: int) -> int:
+    """
+    Chooses how many processes to use for a file of the given size: one per
+    CPU, but never so many that a chunk is smaller than MIN_CHUNK_BYTES.
+    """
+    return max(1, min(os.cpu_count() or 1, file_size // MIN_CHUNK_BYTES))
+
+
+def split_chunks(data, start: int, chunks: int) -> list[tuple[int, int, int]]:
+    """
+    Splits data[start:] into about `chunks` ranges that begin on record boundaries.
+
+    Args:
+        data: A bytes-like object that supports find(), such as an mmap.
+        start (int): The offset of the first data record (just after the header).
+        chunks (int): The number of ranges wanted.
+
+    Returns:
+        list[tuple[int, int, int]]: (start, end, lines_before) for each range,
+        where lines_before is the number of newlines before start. Ranges
+        may be fewer than requested if records are very long.
+    """
+    size = len(data)
+    targets = [start + (size - start) * i // chunks for i in range(1, chunks)]
+    boundaries = [start]
+    position = start
+    quotes = 0
+    newlines = data[:start].count(b"\n")
+    lines_before = [newlines]
+    for target in targets:
+        if target <= position:
+            continue
+        # Count the quotes up to the target to know whether it is inside a quoted field.
+        while position < target:
+            block_end = min(target, position + SCAN_BLOCK_BYTES)
+            block = data[position:block_end]
+            quotes += block.count(b'"')
+            newlines += block.count(b"\n")
+            position = block_end
+        # Move forward to the end of the record that contains the target.
+        while position < size:
+            newline = data.find(b"\n", position)
+            line_end = size if newline == -1 else newline + 1
+            line = data[position:line_end]
+            quotes += line.count(b'"')
+            newlines += line.count(b"\n")
+            position = line_end
+            if quotes % 2 == 0:
+                break
+        if position >= size:
+            break
+        boundaries.append(position)
+        lines_before.append(newlines)
+    boundaries.append(size)
+    return [(boundaries[i], boundaries[i + 1], lines_before[i])
+            for i in range(len(boundaries) - 1) if boundaries[i] < boundaries[i + 1]]
+
+
+def parse_chunk(file_path: str, columns: list[str], start: int, end: int,
+                lines_before: int) -> tuple[EmployeeStore, list[tuple[int, dict, Exception]], array]:
+    """
+    Parses one byte range of a CSV file. Runs in a worker process.
+
+    Rows with missing columns, blank fields or invalid IDs are skipped, as in
+    FileHandler.iter_employees. Repeated IDs can span chunks, so they are
+    left for read_store_parallel() to drop while merging.
+
+    Args:
+        file_path (str): The CSV file.
+        columns (list[str]): The header row of the file.
+        start (int): The offset of the range's first record.
+        end (int): The offset just past the range's last record.
+        lines_before (int): The number of lines before start, for error reports.
+
+    Returns:
+        tuple: The parsed EmployeeStore, a list of (line_number, row, error)
+        for every row that was skipped, in line order, and the line number of
+        each row in the store.
+    """
+    with open(file_path, mode='rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    positions = {name: index for index, name in enumerate(columns)}
+    store = EmployeeStore()
+    errors = []
+    missing = [field for field in FIELDNAMES if field not in positions]
+    indexes = [positions.get(field) for field in FIELDNAMES]
+    needed = max((index for index in indexes if index is not None), default=-1) + 1
+    rows = []
+    parsed = []
+    reader = csv.reader(io.StringIO(text, newline=''))
+    for fields in reader:
+        if not fields:
+            continue
+        if missing or len(fields) < needed:
+            row = dict(zip(columns, fields))
+            field = missing[0] if missing else next(name for name, index in zip(FIELDNAMES, indexes)
+                                                    if index >= len(fields))
+            errors.append((lines_before + reader.line_num, row, KeyError(field)))
+            continue
+        rows.append([fields[index] for index in indexes])
+        parsed.append((lines_before + reader.line_num, fields))
+
+    line_numbers = array("Q", map(itemgetter(0), parsed))
+    report = BatchValidator(check_duplicates=False).validate_columns(
+        [list(map(itemgetter(index), rows)) for index in range(len(FIELDNAMES))], line_numbers)
+    if report.ok:
+        for row in rows:
+            store.append_row(row)
+        return store, errors, line_numbers
+    invalid = report.invalid_rows()
+    kept = array("Q")
+    for row, (line_number, fields) in zip(rows, parsed):
+        if line_number in invalid:
+            errors.append((line_number, dict(zip(columns, fields)), ValidationError(report.issues_for(line_number))))
+        else:
+            store.append_row(row)
+            kept.append(line_number)
+    errors.sort(key=itemgetter(0))
+    return store, errors, kept
+
+
+def read_store_parallel(file_path: str, workers: int | None = None,
+                        on_error: ErrorCallback | None = None) -> EmployeeStore:
+    """
+    Reads a CSV file into an EmployeeStore using several processes.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        workers (int | None): The number of processes; chosen from the file size
+                              and CPU count if omitted. With one worker the file
+                              is parsed in this process.
+        on_error (ErrorCallback | None): Called as on_error(line_number, row, error)
+                                         for each skipped row, in file order.
+                                         Defaults to logging a warning.
+
+    Returns:
+        EmployeeStore: The employees, in file order, as FileHandler.read_store
+                       would return them. Empty if the file does not exist.
+    """
+    try:
+        file_size = os.path.getsize(file_path)
+    except FileNotFoundError:
+        return EmployeeStore()
+    if file_size == 0:
+        return EmployeeStore()
+    if compression.is_compressed(file_path):
+        # A compressed stream cannot be split at byte offsets; read it in one pass.
+        return EmployeeStore(FileHandler.iter_employees(file_path, on_error=on_error, validator=BatchValidator()))
+    if workers is None:
+        workers = default_worker_count(file_size)
+
+    with open(file_path, mode='rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        header_start, header_end = next(record_spans(data))
+        columns = parse_record(data[header_start:header_end])
+        chunks = split_chunks(data, header_end, max(1, workers))
+
+    if len(chunks) <= 1:
+        results = [parse_chunk(file_path, columns, *chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = list(executor.map(parse_chunk, *zip(*((file_path, columns, *chunk) for chunk in chunks))))
+
+    if on_error is None:
+        on_error = _log_bad_row
+    store = EmployeeStore()
+    seen_ids: set[str] = set()
+    for chunk_store, errors, line_numbers in results:
+        ids = chunk_store.columns()[0]
+        if seen_ids.isdisjoint(ids) and len(set(ids)) == len(ids):
+            store.extend_store(chunk_store)
+            seen_ids.update(ids)
+        else:
+            # Like EmployeeRepository.load(), the first row with an ID wins.
+            for index, employee_id in enumerate(ids):
+                if employee_id in seen_ids:
+                    row = chunk_store.row(index)
+                    issue = ValidationIssue(line_numbers[index], FIELDNAMES[0], DUPLICATE_ID, employee_id)
+                    errors.append((line_numbers[index], dict(zip(FIELDNAMES, row)), ValidationError([issue])))
+                else:
+                    seen_ids.add(employee_id)
+                    store.append_row(chunk_store.row(index))
+            errors.sort(key=itemgetter(0))
+        for line_number, row, error in errors:
+            on_error(line_number, row, error)
+    return store
@@ -0,0 +1,300 @@
+"""
+Stores the roster as one shard file per department plus a small manifest.
+
+With a single employees.csv every load reads everyone. In a partitioned
+directory a screen that needs one department reads one shard, a full load
+reads the shards in parallel, and a save rewrites only the shards whose
+contents changed:
+
+    employees.d/
+        manifest.json
+        engineering-1a2b3c4d5e6f7a8b.csv
+        marketing-9c0d1e2f3a4b5c6d.csv
+
+The manifest lists each department's shard file, row count and a digest of
+its rows. A save groups the employees by department, compares each group's
+digest with the manifest, writes the changed shards, and then replaces the
+manifest. A shard's file name includes its digest, so a changed shard is
+written to a new file and never overwrites one the current manifest names:
+until the manifest is replaced, readers (and a crash) see the old shards. Shard files are written through FileHandler, so a
+shard extension such as ".csv.gz" or ".snap" stores them compressed or as
+binary snapshots.
+
+The single-file format still works for interchange: import_file() splits an
+employees.csv into shards and export_file() joins them back into one file.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator, NamedTuple
+
+from employee import Employee
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+DEFAULT_SHARD_EXTENSION = ".csv"
+# Loading many small shards is I/O bound, so threads beyond the CPU count
+# still help on a network share.
+DEFAULT_THREADS = min(32, (os.cpu_count() or 1) + 4)
+
+_DEPARTMENT = 3
+
+
+class ShardInfo(NamedTuple):
+    """
+    One department's entry in the manifest.
+
+    Attributes:
+        department (str): The department.
+        file (str): The shard's file name, relative to the directory.
+        rows (int): The number of employees in the shard.
+        digest (str): A hash of the shard's rows, used to skip unchanged shards.
+    """
+    department: str
+    file: str
+    rows: int
+    digest: str
+
+
+class SaveResult(NamedTuple):
+    """
+    What a save did, by department.
+
+    Attributes:
+        written (list[str]): Departments whose shard was (re)written.
+        unchanged (list[str]): Departments whose shard was left as it was.
+        removed (list[str]): Departments whose shard was deleted because
+                             they have no employees any more.
+    """
+    written: list[str]
+    unchanged: list[str]
+    removed: list[str]
+
+
+def shard_file_name(department: str, digest: str, extension: str = DEFAULT_SHARD_EXTENSION) -> str:
+    """
+    Returns a file name for a version of a department's shard that is safe on
+    any file system.
+
+    The readable part is lower-cased and stripped of punctuation. The rest is
+    taken from the digest of the shard's rows (see rows_digest()), which also
+    keeps departments such as "R&D" and "R-D" apart, since their rows differ.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", department.lower()).strip("-")[:40] or "department"
+    return f"{slug}-{digest[:16]}{extension}"
+
+
+def rows_digest(store: EmployeeStore) -> str:
+    """
+    Returns a hash of a store's rows, in order.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for row in store.rows():
+        digest.update("\x1f".join(row).encode('utf-8'))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def _group_by_department(employees: Iterable[Employee] | EmployeeStore) -> dict[str, EmployeeStore]:
+    """
+    Splits employees into one store per department.
+
+    Raises:
+        ValueError: If two employees share an ID.
+    """
+    rows = employees.rows() if isinstance(employees, EmployeeStore) else (e.to_list() for e in employees)
+    groups: dict[str, EmployeeStore] = {}
+    seen_ids: set[str] = set()
+    for row in rows:
+        if row[0] in seen_ids:
+            raise ValueError(f"Employee ID {row[0]} appears more than once.")
+        seen_ids.add(row[0])
+        store = groups.get(row[_DEPARTMENT])
+        if store is None:
+            store = groups[row[_DEPARTMENT]] = EmployeeStore()
+        store.append_row(row)
+    return groups
+
+
+class PartitionedStorage:
+    """
+    A directory holding the roster as one shard file per department.
+
+        storage = PartitionedStorage("employees.d")
+        storage.save(repository.snapshot())
+        engineering = storage.load(departments=["Engineering"])
+
+    Attributes:
+        directory (str): The directory holding the manifest and shards.
+        shard_extension (str): The extension given to new shard files, which
+                               decides their format (see FileHandler).
+    """
+
+    def __init__(self, directory: str, shard_extension: str = DEFAULT_SHARD_EXTENSION):
+        self.directory = directory
+        self.shard_extension = shard_extension
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.manifest_path)
+
+    def read_manifest(self) -> dict[str, ShardInfo]:
+        """
+        Returns the shards by department, in manifest order; empty if there is no manifest.
+
+        Raises:
+            ValueError: If the manifest is from an unknown version of the format.
+        """
+        try:
+            with open(self.manifest_path, encoding='utf-8') as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"{self.manifest_path} has unsupported version {manifest.get('version')!r}.")
+        return {shard["department"]: ShardInfo(**shard) for shard in manifest["shards"]}
+
+    def departments(self) -> list[str]:
+        return list(self.read_manifest())
+
+    def iter_shards(self, departments: Iterable[str] | None = None, workers: int | None = None,
+                    processes: bool = False) -> Iterator[tuple[str, EmployeeStore]]:
+        """
+        Reads shards in parallel and yields them in manifest order as they complete.
+
+        Args:
+            departments (Iterable[str] | None): Only read these departments;
+                                                every department by default.
+                                                Unknown departments are skipped.
+            workers (int | None): The pool size; DEFAULT_THREADS threads, or one
+                                  process per CPU, by default.
+            processes (bool): Parse in a process pool instead of threads. This
+                              pays off for large CSV shards on a local disk,
+                              where parsing rather than I/O is the bottleneck.
+
+        Yields:
+            tuple[str, EmployeeStore]: Each department and its employees.
+        """
+        shards = list(self.read_manifest().values())
+        if departments is not None:
+            wanted = set(departments)
+            shards = [shard for shard in shards if shard.department in wanted]
+        if not shards:
+            return
+        paths = [os.path.join(self.directory, shard.file) for shard in shards]
+        if len(paths) == 1:
+            yield shards[0].department, FileHandler.read_store(paths[0])
+            return
+        with self._executor(workers, processes, len(paths)) as executor:
+            for shard, store in zip(shards, executor.map(FileHandler.read_store, paths)):
+                yield shard.department, store
+
+    def load(self, departments: Iterable[str] | None = None, workers: int | None = None,
+             processes: bool = False) -> EmployeeStore:
+        """
+        Reads the chosen departments (every department by default) into one
+        store, department by department. See iter_shards() for the arguments.
+        """
+        store = EmployeeStore()
+        for _, shard in self.iter_shards(departments, workers, processes):
+            store.extend_store(shard)
+        return store
+
+    def save(self, employees: Iterable[Employee] | EmployeeStore,
+             departments: Iterable[str] | None = None, workers: int | None = None) -> SaveResult:
+        """
+        Writes the employees, rewriting only the shards that changed.
+
+        Args:
+            employees (Iterable[Employee] | EmployeeStore): The employees of the
+                departments being saved.
+            departments (Iterable[str] | None): The departments the employees
+                cover, e.g. those passed to load(). Shards of other departments
+                are left alone. By default the employees are the whole roster,
+                and shards of departments without employees are deleted.
+            workers (int | None): Threads used to write shards.
+
+        Returns:
+            SaveResult: Which shards were written, left alone or removed.
+
+        Raises:
+            ValueError: If an employee belongs to a department outside
+                        `departments`, or two employees share an ID.
+        """
+        groups = _group_by_department(employees)
+        manifest = self.read_manifest()
+        covered = set(manifest) | set(groups) if departments is None else set(departments)
+        outside = set(groups) - covered
+        if outside:
+            raise ValueError(f"Employees in departments not being saved: {', '.join(sorted(outside))}.")
+
+        os.makedirs(self.directory, exist_ok=True)
+        old_files = {shard.file for shard in manifest.values()}
+        written, unchanged, removed, writes = [], [], [], []
+        for department in sorted(covered):
+            store = groups.get(department)
+            old = manifest.get(department)
+            if store is None:
+                if old is not None:
+                    removed.append(department)
+                    del manifest[department]
+                continue
+            digest = rows_digest(store)
+            if old is not None and old.digest == digest and os.path.exists(os.path.join(self.directory, old.file)):
+                unchanged.append(department)
+                continue
+            file_name = shard_file_name(department, digest, self.shard_extension)
+            manifest[department] = ShardInfo(department, file_name, len(store), digest)
+            writes.append((os.path.join(self.directory, file_name), store))
+            written.append(department)
+
+        if writes:
+            with ThreadPoolExecutor(max_workers=min(workers or DEFAULT_THREADS, len(writes))) as executor:
+                list(executor.map(lambda write: FileHandler.write_employees_atomic(*write), writes))
+        # New shards have new names, so the manifest is replaced only once every
+        # shard it names is in place, and shards it no longer names are
+        # deleted only after that.
+        self._write_manifest(manifest)
+        for file_name in old_files - {shard.file for shard in manifest.values()}:
+            try:
+                os.remove(os.path.join(self.directory, file_name))
+            except FileNotFoundError:
+                pass
+        return SaveResult(written, unchanged, removed)
+
+    def import_file(self, file_path: str, workers: int | None = None) -> SaveResult:
+        """
+        Replaces the partitioned roster with the contents of a single CSV or snapshot file.
+        """
+        return self.save(FileHandler.read_store(file_path), workers=workers)
+
+    def export_file(self, file_path: str, departments: Iterable[str] | None = None,
+                    workers: int | None = None) -> int:
+        """
+        Writes the chosen departments (every department by default) to a
+        single CSV or snapshot file, and returns the number of employees written.
+        """
+        return FileHandler.write_employees_atomic(file_path, self.load(departments, workers))
+
+    def _executor(self, workers: int | None, processes: bool, tasks: int) -> Executor:
+        if processes:
+            return ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, tasks))
+        return ThreadPoolExecutor(max_workers=min(workers or DEFAULT_THREADS, tasks))
+
+    def _write_manifest(self, manifest: dict[str, ShardInfo]):
+        temp_path = f"{self.manifest_path}.tmp"
+        document = {"version": MANIFEST_VERSION,
+                    "shards": [shard._asdict() for _, shard in sorted(manifest.items())]}
+        with open(temp_path, mode='w', encoding='utf-8') as file:
+            json.dump(document, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.manifest_path)
@@ -0,0 +1,380 @@
+"""
+Serves read-only lookups over the roster as JSON on a local HTTP port.
+
+Tools that would each re-parse employees.csv can instead ask one process that
+loaded it once through FileHandler. Every endpoint answers GET:
+
+    /employees/<id>     One employee, or 404.
+    /employees          A page of employees in roster order, optionally
+                        filtered with ?department= and ?job_title=, paged
+                        with ?offset= and ?limit= (DEFAULT_LIMIT by default,
+                        at most MAX_LIMIT). "total" counts every match.
+    /departments        The number of employees in each department.
+    /status             The data version and the number of employees.
+
+Responses carry an ETag naming the version of the data they were computed
+from. A client that sends it back in If-None-Match gets 304 Not Modified, with
+no body, until the data changes.
+
+A watcher thread polls the file with DataFileWatcher every CHECK_INTERVAL
+seconds: appended rows are added, and a rewritten file is read again. Each
+change builds a new Roster and swaps it in, so requests never wait for a
+reload and a request in flight keeps the version it started with.
+
+Pages of more than STREAM_ROWS employees are sent with chunked transfer
+encoding, a batch of rows at a time, rather than encoded as one string first.
+
+Like cli.py, this never imports tkinter. Changes the GUI has recorded in its
+journal but not yet compacted into the file are not seen.
+
+Usage:
+    python -m cli serve --port 8765
+    curl 'http://127.0.0.1:8765/employees?department=Engineering&limit=50'
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from array import array
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator, Sequence
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from employee_repository import EmployeeRepository
+from employee_store import EmployeeStore
+from file_handler import FIELDNAMES, FileHandler
+from file_watcher import APPENDED, UNCHANGED, DataFileWatcher
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Seconds between checks of the data file for changes.
+CHECK_INTERVAL = 2.0
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 10_000
+# Pages longer than this are streamed, this many rows per chunk.
+STREAM_ROWS = 1000
+# Rows per batch when reading the data file.
+LOAD_BATCH_ROWS = 10_000
+
+_EMPTY = array('l')
+
+
+class BadRequest(ValueError):
+    """
+    Raised for a request the service cannot answer; reported as 400 Bad Request.
+    """
+
+
+def _positions_by_value(values: list[str], codes: array) -> dict[str, array]:
+    buckets = [array('l') for _ in values]
+    for position, code in enumerate(codes):
+        buckets[code].append(position)
+    return {value: positions for value, positions in zip(values, buckets) if positions}
+
+
+def _encode_rows(rows: Iterator[list[str]]) -> str:
+    # One dumps() call per batch keeps the work in the C encoder.
+    return json.dumps([dict(zip(FIELDNAMES, row)) for row in rows])[1:-1]
+
+
+class Roster:
+    """
+    One version of the roster, indexed for the queries the service answers.
+
+    A Roster is never changed once built, so request threads share it
+    without locking.
+
+    Attributes:
+        repository (EmployeeRepository): The employees, looked up by ID.
+        version (int): Increases by one whenever the data file changes.
+        departments (dict[str, array]): Row positions of each department's employees.
+        job_titles (dict[str, array]): Row positions of each job title's employees.
+    """
+
+    def __init__(self, repository: EmployeeRepository, version: int):
+        self.repository = repository
+        self.version = version
+        _, _, _, (departments, department_codes), (job_titles, job_title_codes) = repository.store.columns()
+        self.departments = _positions_by_value(departments, department_codes)
+        self.job_titles = _positions_by_value(job_titles, job_title_codes)
+        self._job_title_codes = job_title_codes
+        self._job_title_lookup = {job_title: code for code, job_title in enumerate(job_titles)}
+
+    def get(self, employee_id: str) -> list[str] | None:
+        """
+        Returns the row of the employee with the given ID, or None.
+        """
+        if employee_id not in self.repository:
+            return None
+        return self.repository.row(self.repository.position(employee_id))
+
+    def matching(self, department: str | None = None, job_title: str | None = None) -> Sequence[int]:
+        """
+        Returns the row positions of the employees matching both filters, in row order.
+        """
+        if department is None:
+            return range(len(self.repository)) if job_title is None else self.job_titles.get(job_title, _EMPTY)
+        positions = self.departments.get(department, _EMPTY)
+        if job_title is None:
+            return positions
+        code = self._job_title_lookup.get(job_title)
+        codes = self._job_title_codes
+        return array('l', (position for position in positions if codes[position] == code))
+
+    def headcounts(self) -> dict[str, int]:
+        return {department: len(positions) for department, positions in sorted(self.departments.items())}
+
+
+class RosterService:
+    """
+    Holds the current Roster of a data file and replaces it when the file changes.
+
+        service = RosterService("employees.csv")
+        service.start()
+        roster = service.roster
+
+    Attributes:
+        file_path (str): The CSV or snapshot file served.
+        roster (Roster): The current version. Read it once per request.
+        check_interval (float): Seconds between checks of the file.
+        instance (str): A random token put in ETags, so that versions of
+                        different runs of the service never collide.
+    """
+
+    def __init__(self, file_path: str, check_interval: float = CHECK_INTERVAL):
+        self.file_path = file_path
+        self.check_interval = check_interval
+        self.instance = os.urandom(4).hex()
+        self._watcher = DataFileWatcher(file_path)
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.roster = self._load(1)
+
+    def etag(self, roster: Roster) -> str:
+        return f'"{self.instance}-{roster.version}"'
+
+    def refresh(self) -> bool:
+        """
+        Checks the data file and swaps in a new Roster if it changed.
+
+        Returns:
+            bool: Whether the roster changed.
+        """
+        change = self._watcher.check()
+        if change == UNCHANGED:
+            return False
+        roster = self.roster
+        if change == APPENDED:
+            repository = EmployeeRepository.from_store(roster.repository.snapshot())
+            added = sum(repository.load(batch) for batch in self._watcher.read_appended())
+            if not added:
+                return False
+            self.roster = Roster(repository, roster.version + 1)
+        else:
+            self.roster = self._load(roster.version + 1)
+        logging.info(f"Serving version {self.roster.version} of {self.file_path} "
+                     f"({len(self.roster.repository)} employees).")
+        return True
+
+    def start(self):
+        """
+        Starts the thread that checks the file every check_interval seconds.
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._watch, name="roster-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self):
+        while not self._stopped.wait(self.check_interval):
+            try:
+                self.refresh()
+            except (OSError, ValueError) as e:
+                logging.error(f"Could not reload {self.file_path}: {e}")
+
+    def _load(self, version: int) -> Roster:
+        end_offset = 0
+
+        def record_progress(bytes_read: int):
+            nonlocal end_offset
+            end_offset = bytes_read
+
+        store = EmployeeStore()
+        for batch in FileHandler.iter_employees(self.file_path, batch_size=LOAD_BATCH_ROWS,
+                                                on_progress=record_progress):
+            store.extend(batch)
+        # At the end of the file the reported position is exact.
+        self._watcher.mark(end_offset)
+        return Roster(EmployeeRepository.from_store(store), version)
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """
+    Answers the endpoints listed in the module docstring.
+    """
+
+    # Keep-alive connections, which chunked responses need.
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle's algorithm the body
+    # waits for the client's delayed ACK of the headers, about 40 ms.
+    disable_nagle_algorithm = True
+    server: "QueryServer"
+
+    def do_GET(self):
+        service = self.server.service
+        roster = service.roster
+        url = urlsplit(self.path)
+        try:
+            params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            if url.path == "/employees":
+                respond = self._page(roster, params)
+            elif url.path.startswith("/employees/"):
+                self._check_params(params, ())
+                row = roster.get(unquote(url.path[len("/employees/"):]))
+                if row is None:
+                    self._send_json(HTTPStatus.NOT_FOUND, {"error": "No employee with that ID."})
+                    return
+                respond = lambda etag: self._send_json(HTTPStatus.OK, dict(zip(FIELDNAMES, row)), etag)
+            elif url.path == "/departments":
+                self._check_params(params, ())
+                respond = lambda etag: self._send_json(HTTPStatus.OK, {"version": roster.version,
+                                                                       "departments": roster.headcounts()}, etag)
+            elif url.path == "/status":
+                self._check_params(params, ())
+                respond = lambda etag: self._send_json(HTTPStatus.OK, {"version": roster.version,
+                                                                       "employees": len(roster.repository)}, etag)
+            else:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {url.path}."})
+                return
+        except BadRequest as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+
+        etag = service.etag(roster)
+        if self._not_modified(etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        respond(etag)
+
+    def _page(self, roster: Roster, params: dict[str, str]) -> Callable[[str], None]:
+        """
+        Validates a listing request and returns the function that sends the page.
+        """
+        self._check_params(params, ("department", "job_title", "offset", "limit"))
+        offset = self._int_param(params, "offset", 0)
+        limit = self._int_param(params, "limit", DEFAULT_LIMIT)
+        if limit > MAX_LIMIT:
+            raise BadRequest(f"limit must be at most {MAX_LIMIT}.")
+        matching = roster.matching(params.get("department"), params.get("job_title"))
+        page = matching[offset:offset + limit]
+        head = {"version": roster.version, "total": len(matching), "offset": offset, "limit": limit}
+
+        def respond(etag: str):
+            rows = map(roster.repository.row, page)
+            if len(page) <= STREAM_ROWS:
+                head["employees"] = [dict(zip(FIELDNAMES, row)) for row in rows]
+                self._send_json(HTTPStatus.OK, head, etag)
+                return
+            # The head is written as JSON and the closing "}" dropped, so the
+            # rows can follow in chunks.
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self._write_chunk(json.dumps(head)[:-1] + ', "employees": [')
+            for start in range(0, len(page), STREAM_ROWS):
+                separator = "," if start else ""
+                self._write_chunk(separator + _encode_rows(map(roster.repository.row,
+                                                               page[start:start + STREAM_ROWS])))
+            self._write_chunk("]}")
+            self.wfile.write(b"0\r\n\r\n")
+        return respond
+
+    def _send_json(self, status: HTTPStatus, document: dict, etag: str | None = None):
+        body = json.dumps(document).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, text: str):
+        data = text.encode('utf-8')
+        self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+
+    def _not_modified(self, etag: str) -> bool:
+        header = self.headers.get("If-None-Match")
+        if header is None:
+            return False
+        # Weak comparison, as RFC 9110 asks for If-None-Match.
+        tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+        return "*" in tags or etag in tags
+
+    @staticmethod
+    def _check_params(params: dict[str, str], allowed: Sequence[str]):
+        unknown = sorted(set(params) - set(allowed))
+        if unknown:
+            raise BadRequest(f"Unknown parameter {unknown[0]!r}.")
+
+    @staticmethod
+    def _int_param(params: dict[str, str], name: str, default: int) -> int:
+        value = params.get(name)
+        if value is None:
+            return default
+        # isdigit() alone accepts digits such as "²" that int() rejects.
+        if not (value.isascii() and value.isdigit()):
+            raise BadRequest(f"{name} must be a non-negative integer.")
+        return int(value)
+
+    def log_message(self, format: str, *args):
+        logging.debug(f"{self.address_string()} {format % args}")
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    A ThreadingHTTPServer answering QueryHandler requests from a RosterService.
+    """
+
+    def __init__(self, address: tuple[str, int], service: RosterService):
+        super().__init__(address, QueryHandler)
+        self.service = service
+
+
+def serve(file_path: str, host: str | None = None, port: int | None = None,
+          check_interval: float | None = None):
+    """
+    Loads the data file and serves it until interrupted.
+
+    A host, port or check_interval of None means DEFAULT_HOST, DEFAULT_PORT
+    or CHECK_INTERVAL.
+    """
+    host = DEFAULT_HOST if host is None else host
+    port = DEFAULT_PORT if port is None else port
+    check_interval = CHECK_INTERVAL if check_interval is None else check_interval
+    service = RosterService(file_path, check_interval)
+    with QueryServer((host, port), service) as server:
+        service.start()
+        host, port = server.server_address[:2]
+        print(f"Serving {len(service.roster.repository)} employees from {file_path} "
+              f"on http://{host}:{port}/", file=sys.stderr, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.stop()
@@ -0,0 +1,130 @@
+"""
+Finds employees by the start of any word in their name, department or job title.
+
+SearchIndex keeps a sorted list of the distinct words it has seen and, for
+each word, the set of IDs of the employees whose details contain it. The words
+beginning with a prefix form one run of the sorted list, found with two bisect
+calls, so a query costs about log(distinct words) plus the size of the result,
+whatever the size of the roster. Rosters repeat the same names, departments
+and job titles many times, so the word list stays small even for millions of
+employees.
+
+A query of several words, such as "jan eng", matches the employees that have a
+word starting with each of them. Matching ignores case.
+
+The index is updated incrementally; attach it to an EmployeeRepository to keep
+it in step with adds, updates and deletes.
+"""
+
+import bisect
+from typing import Iterable
+
+from employee import Employee
+
+# Sorts after any character a word can contain, so every word starting with
+# `prefix` lies between prefix and prefix + _AFTER_ALL.
+_AFTER_ALL = "\U0010ffff"
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits text into lower-case words for indexing or searching.
+    """
+    return text.casefold().split()
+
+
+class SearchIndex:
+    """
+    A prefix index over first name, last name, department and job title.
+    """
+
+    def __init__(self, employees: Iterable[Employee] = ()):
+        """
+        Initialises the index, optionally filling it with employees.
+        """
+        # Distinct words, kept sorted for bisect.
+        self._words: list[str] = []
+        # word -> IDs of the employees containing it.
+        self._postings: dict[str, set[str]] = {}
+        for employee in employees:
+            self.add(employee)
+
+    @staticmethod
+    def words_of(employee: Employee) -> set[str]:
+        """
+        Returns the words an employee can be found by.
+        """
+        return set(tokenize(" ".join((employee.first_name, employee.last_name,
+                                      employee.department, employee.job_title))))
+
+    def add(self, employee: Employee):
+        """
+        Indexes an employee.
+        """
+        for word in self.words_of(employee):
+            ids = self._postings.get(word)
+            if ids is None:
+                ids = self._postings[word] = set()
+                bisect.insort(self._words, word)
+            ids.add(employee.employee_id)
+
+    def remove(self, employee: Employee):
+        """
+        Removes an employee, given the details they were indexed with.
+        """
+        for word in self.words_of(employee):
+            ids = self._postings.get(word)
+            if ids is None:
+                continue
+            ids.discard(employee.employee_id)
+            if not ids:
+                del self._postings[word]
+                del self._words[bisect.bisect_left(self._words, word)]
+
+    def search(self, query: str) -> set[str]:
+        """
+        Returns the IDs of the employees matching every word of the query.
+
+        Args:
+            query (str): Word prefixes separated by spaces, e.g. "jan eng".
+
+        Returns:
+            set[str]: The matching employee IDs; empty if the query has no words.
+        """
+        matches = [self._words_with_prefix(prefix) for prefix in set(tokenize(query))]
+        if not matches:
+            return set()
+        # Start from the prefix with the fewest matching employees and narrow it down.
+        matches.sort(key=self._posting_count)
+        result = self._union(matches[0])
+        for words in matches[1:]:
+            if not result:
+                break
+            postings = [self._postings[word] for word in words]
+            if len(result) * len(postings) <= self._posting_count(words):
+                # Cheaper to probe the candidates than to build the union;
+                # set intersection iterates over the smaller operand.
+                result = set().union(*(result & ids for ids in postings))
+            else:
+                result &= self._union(words)
+        return result
+
+    def _words_with_prefix(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self._words, prefix)
+        stop = bisect.bisect_left(self._words, prefix + _AFTER_ALL, start)
+        return self._words[start:stop]
+
+    def _posting_count(self, words: list[str]) -> int:
+        return sum(len(self._postings[word]) for word in words)
+
+    def _union(self, words: list[str]) -> set[str]:
+        result = set()
+        for word in words:
+            result |= self._postings[word]
+        return result
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct words in the index.
+        """
+        return len(self._words)
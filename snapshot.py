@@ -0,0 +1,198 @@
+"""
+Reads and writes the binary employee snapshot format.
+
+CSV stays the interchange format, but parsing it builds a dict for every row.
+The snapshot stores the same data column by column, so loading it takes a few
+bulk decode calls instead of per-row parsing. Departments and job titles are
+stored once each in a string table, with a small integer code per row.
+
+Layout (all integers little-endian):
+
+    magic          8 bytes  b"EMPSNAP" followed by the format version
+    row count      u64
+    7 sections, each a u64 byte length followed by the payload:
+        employee IDs        UTF-8 strings, each terminated by a NUL byte
+        first names         "
+        last names          "
+        department table    distinct departments, NUL-terminated
+        department codes    1 byte typecode ("H" or "I"), then one code per row
+        job title table     distinct job titles, NUL-terminated
+        job title codes     as department codes
+
+Files are read through mmap, and string sections are decoded straight from
+the mapping without copying them first.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable
+
+from employee import Employee
+from employee_store import EmployeeStore
+
+MAGIC = b"EMPSNAP\x01"
+SNAPSHOT_EXTENSION = ".snap"
+TERMINATOR = "\0"
+
+_LENGTH = struct.Struct("<Q")
+
+
+class SnapshotFormatError(ValueError):
+    """
+    Raised when a file is not a valid employee snapshot.
+    """
+
+
+def is_snapshot_header(header: bytes) -> bool:
+    """
+    Returns True if the first bytes of a file are the snapshot magic.
+    """
+    return header[:len(MAGIC)] == MAGIC
+
+
+def write_snapshot(file: BinaryIO, employees: Iterable[Employee] | EmployeeStore):
+    """
+    Writes employees to an open binary file in snapshot format.
+
+    Args:
+        file (BinaryIO): The file to write to.
+        employees (Iterable[Employee] | EmployeeStore): The employees to write.
+            An EmployeeStore is written directly from its columns.
+
+    Raises:
+        ValueError: If any field contains a NUL character.
+    """
+    store = employees if isinstance(employees, EmployeeStore) else EmployeeStore(employees)
+    employee_ids, first_names, last_names, departments, job_titles = store.columns()
+
+    file.write(MAGIC)
+    file.write(_LENGTH.pack(len(store)))
+    for column in (employee_ids, first_names, last_names):
+        _write_section(file, encode_strings(column))
+    for values, codes in (departments, job_titles):
+        _write_section(file, encode_strings(values))
+        _write_section(file, _encode_codes(codes))
+
+
+def read_snapshot(file_path: str) -> EmployeeStore:
+    """
+    Loads a snapshot file into an EmployeeStore.
+
+    Args:
+        file_path (str): The path to the snapshot.
+
+    Returns:
+        EmployeeStore: The employees in the snapshot.
+
+    Raises:
+        SnapshotFormatError: If the file is not a valid snapshot.
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(file_path, mode='rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise SnapshotFormatError(f"{file_path} is empty.") from None
+    with mapped:
+        view = memoryview(mapped)
+        try:
+            return _decode(view, file_path)
+        finally:
+            view.release()
+
+
+def _decode(view: memoryview, file_path: str) -> EmployeeStore:
+    if not is_snapshot_header(view[:len(MAGIC)].tobytes()):
+        raise SnapshotFormatError(f"{file_path} is not an employee snapshot.")
+    if len(view) < len(MAGIC) + _LENGTH.size:
+        raise SnapshotFormatError(f"{file_path} is truncated.")
+    offset = len(MAGIC)
+    (row_count,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+
+    # Sections are slices of the mapping; they must all be released before
+    # the mapping can be closed.
+    sections = []
+    try:
+        for _ in range(7):
+            if offset + _LENGTH.size > len(view):
+                raise SnapshotFormatError(f"{file_path} is truncated.")
+            (length,) = _LENGTH.unpack_from(view, offset)
+            offset += _LENGTH.size
+            if offset + length > len(view):
+                raise SnapshotFormatError(f"{file_path} is truncated.")
+            sections.append(view[offset:offset + length])
+            offset += length
+
+        try:
+            employee_ids, first_names, last_names = (decode_strings(section) for section in sections[:3])
+            departments = (decode_strings(sections[3]), _decode_codes(sections[4]))
+            job_titles = (decode_strings(sections[5]), _decode_codes(sections[6]))
+            for values, codes in (departments, job_titles):
+                if codes and max(codes) >= len(values):
+                    raise ValueError("a row refers to a missing string table entry")
+            store = EmployeeStore.from_columns(employee_ids, first_names, last_names, departments, job_titles)
+        except ValueError as e:
+            raise SnapshotFormatError(f"{file_path} is corrupt: {e}") from None
+        if len(store) != row_count:
+            raise SnapshotFormatError(f"{file_path} is corrupt: expected {row_count} rows, found {len(store)}")
+        return store
+    finally:
+        for section in sections:
+            section.release()
+
+
+def _write_section(file: BinaryIO, payload: bytes):
+    file.write(_LENGTH.pack(len(payload)))
+    file.write(payload)
+
+
+def encode_strings(values: list[str]) -> bytes:
+    """
+    Encodes a list of strings as UTF-8, each terminated by a NUL byte.
+
+    Terminating (rather than separating) every string means an empty list and
+    a list holding one empty string encode differently.
+
+    Raises:
+        ValueError: If a string contains a NUL character.
+    """
+    encoded = (TERMINATOR.join(values) + TERMINATOR) if values else ""
+    if encoded.count(TERMINATOR) != len(values):
+        raise ValueError("Employee fields may not contain NUL characters.")
+    return encoded.encode('utf-8')
+
+
+def decode_strings(section: memoryview | bytes) -> list[str]:
+    """
+    Decodes a section written by encode_strings().
+
+    Raises:
+        ValueError: If the section is not valid.
+    """
+    if not section:
+        return []
+    values = str(section, 'utf-8').split(TERMINATOR)
+    if values.pop() != "":
+        raise ValueError("string section is not NUL-terminated")
+    return values
+
+
+def _encode_codes(codes: array) -> bytes:
+    if sys.byteorder == "big":
+        codes = array(codes.typecode, codes)
+        codes.byteswap()
+    return codes.typecode.encode('ascii') + codes.tobytes()
+
+
+def _decode_codes(section: memoryview) -> array:
+    typecode = section[:1].tobytes().decode('ascii')
+    if typecode not in ("H", "I"):
+        raise ValueError(f"unknown code type {typecode!r}")
+    codes = array(typecode)
+    codes.frombytes(section[1:])
+    if sys.byteorder == "big":
+        codes.byteswap()
+    return codes
@@ -0,0 +1,170 @@
+"""
+Keeps the roster sorted by each column, for click-to-sort in the table.
+
+SortOrders builds the order for a column the first time it is asked for and
+then keeps it: employees added later are placed with bisect.insort instead of
+sorting the roster again, so switching back and forth between columns costs
+nothing after the first sort. An order is a list of employee IDs, which stay
+valid when a delete moves rows around in the repository.
+
+Employee IDs are ordered numerically when they are plain numbers. Other
+columns are ordered by their text. Employees with equal values keep the order
+in which they were added.
+"""
+
+import bisect
+from typing import Sequence
+
+from employee import Employee
+from file_handler import FIELDNAMES
+
+
+def id_sort_key(employee_id: str) -> tuple[int, str]:
+    """
+    Orders numeric IDs by value ("99" before "100") without converting them.
+    """
+    return len(employee_id), employee_id
+
+
+class Descending(Sequence[str]):
+    """
+    A read-only reversed view of a list, which follows changes to the list.
+    """
+
+    def __init__(self, items: list[str]):
+        self.items = items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self.items)
+        if not 0 <= index < len(self.items):
+            raise IndexError("index out of range")
+        return self.items[len(self.items) - 1 - index]
+
+
+class SortOrders:
+    """
+    Cached sort orders for the columns of an EmployeeRepository.
+
+    Attach it to the repository so the cached orders follow adds, updates and
+    deletes:
+
+        orders = SortOrders(repository)
+        repository.attach(orders)
+        ids = orders.order("last_name")
+    """
+
+    def __init__(self, repository):
+        """
+        Args:
+            repository (EmployeeRepository): The roster to sort.
+        """
+        self.repository = repository
+        # field -> sort keys in ascending order, and the employee IDs in the same order.
+        self._keys: dict[str, list] = {}
+        self._ids: dict[str, list[str]] = {}
+
+    def order(self, field: str, descending: bool = False) -> Sequence[str]:
+        """
+        Returns every employee ID, ordered by a field.
+
+        The result is a live view: it reflects later changes to the repository.
+        Do not modify it.
+
+        Args:
+            field (str): One of FIELDNAMES.
+            descending (bool): Whether to reverse the order.
+
+        Raises:
+            ValueError: If the field is not an employee field.
+        """
+        if field not in FIELDNAMES:
+            raise ValueError(f"Unknown field {field!r}.")
+        if field not in self._ids:
+            self._build(field)
+        ids = self._ids[field]
+        return Descending(ids) if descending else ids
+
+    def sort(self, employee_ids: set[str], field: str, descending: bool = False) -> list[str]:
+        """
+        Orders some of the employees, such as search results, by a field.
+
+        Args:
+            employee_ids (set[str]): IDs of employees in the repository.
+            field (str): One of FIELDNAMES.
+            descending (bool): Whether to reverse the order.
+
+        Returns:
+            list[str]: The IDs, ordered as in order(field, descending).
+        """
+        order = self.order(field, descending)
+        # Sorting a few IDs directly beats walking the whole cached order.
+        if len(employee_ids) * 16 < len(order):
+            column = FIELDNAMES.index(field)
+            key = self._key_function(field)
+            positions = [self.repository.position(employee_id) for employee_id in employee_ids]
+            # Ties are broken by roster position, which is the order the
+            # cached orders keep unless rows have been deleted.
+            ranked = sorted((key(self.repository.row(position)[column]), position) for position in positions)
+            ids = [self.repository.row(position)[0] for _, position in ranked]
+            return ids[::-1] if descending else ids
+        return [employee_id for employee_id in order if employee_id in employee_ids]
+
+    def add(self, employee: Employee):
+        """
+        Places a new employee in every cached order.
+        """
+        for field, keys in self._keys.items():
+            key = self._key_function(field)(getattr(employee, field))
+            index = bisect.bisect_right(keys, key)
+            keys.insert(index, key)
+            self._ids[field].insert(index, employee.employee_id)
+
+    def remove(self, employee: Employee):
+        """
+        Removes an employee from every cached order, given the details they had.
+        """
+        for field, keys in self._keys.items():
+            key = self._key_function(field)(getattr(employee, field))
+            start = bisect.bisect_left(keys, key)
+            stop = bisect.bisect_right(keys, key, start)
+            ids = self._ids[field]
+            index = ids.index(employee.employee_id, start, stop)
+            del keys[index]
+            del ids[index]
+
+    def clear(self):
+        """
+        Drops every cached order; they are rebuilt when next asked for.
+        """
+        self._keys.clear()
+        self._ids.clear()
+
+    @staticmethod
+    def _key_function(field: str):
+        return id_sort_key if field == "employee_id" else str
+
+    def _build(self, field: str):
+        """
+        Sorts the repository by a field, working on the store's columns.
+        """
+        employee_ids, first_names, last_names, departments, job_titles = self.repository.store.columns()
+        if field in ("department", "job_title"):
+            # Sort the few distinct values once and then sort rows by the
+            # rank of their code, which compares integers instead of strings.
+            values, codes = departments if field == "department" else job_titles
+            ranks = [0] * len(values)
+            for rank, code in enumerate(sorted(range(len(values)), key=values.__getitem__)):
+                ranks[code] = rank
+            positions = sorted(range(len(codes)), key=lambda position: ranks[codes[position]])
+            keys = [values[codes[position]] for position in positions]
+        else:
+            column = {"employee_id": employee_ids, "first_name": first_names, "last_name": last_names}[field]
+            keys = [self._key_function(field)(value) for value in column]
+            positions = sorted(range(len(keys)), key=keys.__getitem__)
+            keys = [keys[position] for position in positions]
+        self._keys[field] = keys
+        self._ids[field] = [employee_ids[position] for position in positions]
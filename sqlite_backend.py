@@ -0,0 +1,238 @@
+"""
+Stores employee records in an SQLite database instead of a flat CSV file.
+
+SQLiteHandler is its own instance API rather than a stand-in for FileHandler:
+it is opened on one database and its methods take no file paths. Besides
+reading and writing the whole roster, it answers indexed queries that read
+only the rows they need. CSV remains the exchange format: import_csv and
+export_csv stream between the two without loading the whole roster into
+memory. The command-line tools read a database given as --source x.db.
+
+A handler holds one connection for its lifetime, so the PRAGMAs and the schema
+are set up once rather than on every call; a point lookup is then a single
+indexed query. A handler opened with read_only=True opens the database with
+SQLite's mode=ro: it never creates a missing database and cannot write.
+
+The database uses write-ahead logging (WAL), so readers are not blocked while
+a bulk import is running, and every bulk write happens in one transaction with
+executemany().
+"""
+
+import logging
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from employee import Employee
+from file_handler import FileHandler
+
+# Rows per executemany() call / fetchmany() call when streaming.
+BULK_BATCH_ROWS = 10000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    employee_id TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    job_title TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_employees_department ON employees (department);
+CREATE INDEX IF NOT EXISTS idx_employees_job_title ON employees (job_title);
+"""
+
+_COLUMNS = "employee_id, first_name, last_name, department, job_title"
+# Rows come back in insertion order, matching the order of the source CSV file.
+_SELECT = f"SELECT {_COLUMNS} FROM employees"
+# Like EmployeeRepository.load(), the first row for each employee ID wins.
+_INSERT = f"INSERT OR IGNORE INTO employees ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)"
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """
+    Opens an employee database, creating the table and indexes if needed.
+
+    Args:
+        db_path (str): The path to the database file.
+
+    Returns:
+        sqlite3.Connection: A connection in WAL mode.
+    """
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode NORMAL is still safe against corruption and avoids an fsync per commit.
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def _insert_all(connection: sqlite3.Connection, rows: Iterable[list[str]]) -> int:
+    """
+    Inserts rows in batches with executemany() and returns how many were added.
+    """
+    inserted = 0
+    rows = iter(rows)
+    while batch := list(islice(rows, BULK_BATCH_ROWS)):
+        inserted += connection.executemany(_INSERT, batch).rowcount
+    return inserted
+
+
+class SQLiteHandler:
+    """
+    Manages the employee records in one SQLite database over a single connection.
+
+        with SQLiteHandler("employees.db", read_only=True) as database:
+            employee = database.get("1042")
+
+    Attributes:
+        db_path (str): The path to the database file.
+        read_only (bool): Whether the database was opened read-only.
+        connection (sqlite3.Connection): The open connection.
+    """
+
+    def __init__(self, db_path: str, read_only: bool = False):
+        """
+        Opens the database.
+
+        Args:
+            db_path (str): The path to the database file.
+            read_only (bool): Open an existing database for reading only,
+                              without creating it or its schema.
+
+        Raises:
+            sqlite3.OperationalError: If read_only and the database does not exist.
+        """
+        self.db_path = db_path
+        self.read_only = read_only
+        if read_only:
+            self.connection = sqlite3.connect(f"{Path(db_path).absolute().as_uri()}?mode=ro", uri=True)
+        else:
+            self.connection = connect(db_path)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self) -> "SQLiteHandler":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def iter_employees(self, batch_size: int | None = None) -> Iterator[Employee] | Iterator[list[Employee]]:
+        """
+        Lazily reads every employee from the database, in insertion order.
+
+        Args:
+            batch_size (int | None): If given, yield lists of up to this many employees.
+
+        Yields:
+            Employee | list[Employee]: Employees, or batches of employees.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        cursor = self.connection.execute(f"{_SELECT} ORDER BY rowid")
+        try:
+            while rows := cursor.fetchmany(batch_size or BULK_BATCH_ROWS):
+                employees = [Employee(*row) for row in rows]
+                if batch_size is None:
+                    yield from employees
+                else:
+                    yield employees
+        finally:
+            cursor.close()
+
+    def read_employees(self) -> list[Employee]:
+        """
+        Reads every employee from the database.
+
+        Returns:
+            list[Employee]: A list of Employee objects.
+        """
+        return list(self.iter_employees())
+
+    def write_employees(self, employees: Iterable[Employee]):
+        """
+        Replaces the contents of the database with the given employees.
+
+        The replacement happens in a single transaction, so readers see either
+        the old roster or the new one.
+
+        Args:
+            employees (Iterable[Employee]): The employees to write.
+
+        Raises:
+            Exception: For potential database errors.
+        """
+        try:
+            with self.connection:
+                self.connection.execute("DELETE FROM employees")
+                _insert_all(self.connection, (employee.to_list() for employee in employees))
+        except Exception as e:
+            logging.error(f"An error occurred while writing to the database: {e}")
+            raise
+
+    def add_employees(self, employees: Iterable[Employee]) -> int:
+        """
+        Adds employees in one transaction, skipping IDs that already exist.
+
+        Returns:
+            int: The number of employees added.
+        """
+        with self.connection:
+            return _insert_all(self.connection, (employee.to_list() for employee in employees))
+
+    def import_csv(self, csv_path: str, replace: bool = False) -> int:
+        """
+        Streams a CSV file into the database in one transaction.
+
+        Args:
+            csv_path (str): The CSV file to import.
+            replace (bool): If True, remove existing employees first; otherwise
+                            rows whose ID already exists are skipped.
+
+        Returns:
+            int: The number of employees added.
+        """
+        with self.connection:
+            if replace:
+                self.connection.execute("DELETE FROM employees")
+            return _insert_all(self.connection, (employee.to_list()
+                                                 for employee in FileHandler.iter_employees(csv_path)))
+
+    def export_csv(self, csv_path: str) -> int:
+        """
+        Streams the database out to a CSV file, replacing the file atomically.
+
+        Returns:
+            int: The number of employees written.
+        """
+        return FileHandler.write_employees_atomic(csv_path, self.iter_employees())
+
+    def get(self, employee_id: str) -> Employee | None:
+        """
+        Returns the employee with the given ID, or None. Uses the primary key index.
+        """
+        row = self.connection.execute(f"{_SELECT} WHERE employee_id = ?", (employee_id,)).fetchone()
+        return None if row is None else Employee(*row)
+
+    def by_department(self, department: str) -> list[Employee]:
+        """
+        Returns every employee in a department. Uses the department index.
+        """
+        return self._query("WHERE department = ? ORDER BY rowid", (department,))
+
+    def by_job_title(self, job_title: str) -> list[Employee]:
+        """
+        Returns every employee with a job title. Uses the job title index.
+        """
+        return self._query("WHERE job_title = ? ORDER BY rowid", (job_title,))
+
+    def count(self) -> int:
+        """
+        Returns the number of employees in the database.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    def _query(self, clause: str, parameters: tuple) -> list[Employee]:
+        return [Employee(*row) for row in self.connection.execute(f"{_SELECT} {clause}", parameters)]
@@ -0,0 +1,80 @@
+"""
+Unit tests for the Headcounts class in aggregates.py.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from aggregates import Headcounts
+from employee import Employee
+from employee_repository import EmployeeRepository
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+
+class TestHeadcounts(unittest.TestCase):
+    """
+    Contains tests for maintaining and building headcounts.
+    """
+
+    def setUp(self):
+        """
+        Set up a small roster.
+        """
+        self.employees = [
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager"),
+            Employee("103", "Mary", "Jones", "Engineering", "Manager"),
+            Employee("104", "Tom", "Lee", "Engineering", "Developer"),
+        ]
+
+    def test_counts(self):
+        """
+        Test the counts per department, job title and pair.
+        """
+        headcounts = Headcounts(self.employees)
+        self.assertEqual(headcounts.departments, {"Engineering": 3, "Marketing": 1})
+        self.assertEqual(headcounts.job_titles, {"Developer": 2, "Manager": 2})
+        self.assertEqual(list(headcounts.rows()), [("Engineering", "Developer", 2), ("Engineering", "Manager", 1),
+                                                   ("Marketing", "Manager", 1)])
+        self.assertEqual(headcounts.total(), 4)
+
+    def test_follows_repository_changes(self):
+        """
+        Test that an attached Headcounts follows adds, updates and deletes.
+        """
+        repository = EmployeeRepository(self.employees[:2])
+        headcounts = Headcounts()
+        repository.attach(headcounts)
+        repository.add(self.employees[2])
+        repository.update(Employee("102", "John", "Smith", "Sales", "Manager"))
+        repository.delete("101")
+        self.assertEqual(headcounts.departments, {"Engineering": 1, "Sales": 1})
+        self.assertEqual(headcounts.pairs, Headcounts(repository).pairs)
+        self.assertNotIn("Marketing", headcounts.departments)
+
+    def test_from_store_and_file(self):
+        """
+        Test that building from a store or streaming a file gives the same counts.
+        """
+        expected = Headcounts(self.employees).pairs
+        self.assertEqual(Headcounts.from_store(EmployeeStore(self.employees)).pairs, expected)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("employees.csv", "employees.snap"):
+                file_path = os.path.join(temp_dir, name)
+                FileHandler.write_employees(file_path, self.employees)
+                if name.endswith(".csv"):
+                    with open(file_path, mode='a', encoding='utf-8') as file:
+                        # An invalid ID and a blank field, which a load skips too.
+                        file.write("10x,Jane,Doe,Sales,Developer\n105,Ann,Bell,,Developer\n")
+                errors = []
+                headcounts = Headcounts.from_file(file_path, on_error=lambda *args: errors.append(args[0]))
+                self.assertEqual(headcounts.pairs, expected)
+                self.assertEqual(errors, [6, 7] if name.endswith(".csv") else [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,239 @@
+"""
+Unit tests for the background task classes in background_tasks.py.
+
+A fake widget stands in for Tk: it records after() callbacks so the tests can
+run the main-loop side of a task by hand, without a display.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from background_tasks import BackgroundExporter, BackgroundJournalWriter, BackgroundLoader
+from employee import Employee
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+from journal import EmployeeJournal
+
+class FakeWidget:
+    """
+    Collects callbacks scheduled with after() instead of running a Tk main loop.
+    """
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def run_until(self, condition, timeout=5.0):
+        """
+        Runs scheduled callbacks until condition() is true or the timeout expires.
+        """
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            if self.callbacks:
+                self.callbacks.pop(0)()
+            else:
+                time.sleep(0.001)
+
+class TestBackgroundLoader(unittest.TestCase):
+    """
+    Contains tests for loading a CSV file on a worker thread.
+    """
+
+    def setUp(self):
+        """
+        Write a temporary CSV file with 25 employees.
+        """
+        handle, self.file_path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", newline="", encoding="utf-8") as file:
+            file.write("employee_id,first_name,last_name,department,job_title\n")
+            for i in range(25):
+                file.write(f"{i},First{i},Last{i},Engineering,Developer\n")
+        self.widget = FakeWidget()
+        self.batches = []
+        self.done = []
+        self.errors = []
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def make_loader(self, file_path):
+        return BackgroundLoader(self.widget, file_path, on_batch=self.batches.append, batch_size=10,
+                                on_done=self.done.append, on_error=self.errors.append)
+
+    def test_loads_all_batches(self):
+        """
+        Tests that every row arrives in order and progress reaches 100%.
+        """
+        loader = self.make_loader(self.file_path)
+        loader.start()
+        self.widget.run_until(lambda: loader.finished)
+
+        self.assertEqual([len(batch) for batch in self.batches], [10, 10, 5])
+        self.assertEqual(self.batches[2][-1].employee_id, "24")
+        self.assertEqual(self.done, [False])
+        self.assertEqual(loader.rows_loaded, 25)
+        self.assertEqual(loader.percent_read(), 100.0)
+        self.assertEqual(loader.end_offset, os.path.getsize(self.file_path))
+
+    def test_cancel_discards_remaining_batches(self):
+        """
+        Tests that cancelling before polling delivers no batches and reports cancellation.
+        """
+        loader = self.make_loader(self.file_path)
+        loader.start()
+        loader.cancel()
+        self.widget.run_until(lambda: loader.finished)
+
+        self.assertEqual(self.batches, [])
+        self.assertEqual(self.done, [True])
+
+    def test_error_is_reported(self):
+        """
+        Tests that an exception in the worker reaches the error callback.
+        """
+        loader = self.make_loader(os.path.dirname(self.file_path))
+        loader.start()
+        self.widget.run_until(lambda: loader.finished)
+
+        self.assertEqual(len(self.errors), 1)
+        self.assertEqual(self.done, [])
+
+class TestBackgroundExporter(unittest.TestCase):
+    """
+    Contains tests for exporting a roster snapshot on a worker thread.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory and a small roster to export.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "export.csv")
+        self.store = EmployeeStore(Employee(str(i), "First", "Last", "Dept", "Title") for i in range(30))
+        self.widget = FakeWidget()
+        self.done = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_export_writes_file(self):
+        """
+        Tests that the export completes and writes every row.
+        """
+        exporter = BackgroundExporter(self.widget, self.file_path, self.store, on_done=self.done.append)
+        exporter.start()
+        self.widget.run_until(lambda: exporter.finished)
+
+        self.assertEqual(self.done, [False])
+        self.assertTrue(exporter.completed)
+        self.assertEqual(exporter.bytes_written, os.path.getsize(self.file_path))
+        self.assertEqual(exporter.rows_written, 30)
+        self.assertEqual(exporter.percent_written(), 100.0)
+        self.assertEqual(len(FileHandler.read_employees(self.file_path)), 30)
+
+    def test_failed_precondition_keeps_file(self):
+        """
+        Tests that an export whose precondition fails before the replace leaves the file alone.
+        """
+        with open(self.file_path, mode='w', encoding='utf-8') as file:
+            file.write("original")
+        checks = []
+        # Pass every check except the last one, made just before the replace.
+        exporter = BackgroundExporter(self.widget, self.file_path, self.store, on_done=self.done.append,
+                                      precondition=lambda: checks.append(None) or len(checks) < 3)
+        exporter.start()
+        self.widget.run_until(lambda: exporter.finished)
+
+        self.assertEqual(self.done, [False])
+        self.assertFalse(exporter.completed)
+        self.assertEqual(len(checks), 3)
+        with open(self.file_path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), "original")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["export.csv"])
+
+    def test_cancelled_export_writes_nothing(self):
+        """
+        Tests that cancelling before the worker runs leaves no file behind.
+        """
+        exporter = BackgroundExporter(self.widget, self.file_path, self.store, on_done=self.done.append)
+        exporter.cancel()
+        exporter.start()
+        self.widget.run_until(lambda: exporter.finished)
+
+        self.assertEqual(self.done, [True])
+        self.assertFalse(exporter.completed)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_cancel_after_replace_still_completes(self):
+        """
+        Tests that a cancel arriving once the file is in place leaves completed set.
+        """
+        exporter = BackgroundExporter(self.widget, self.file_path, self.store, on_done=self.done.append)
+        exporter.start()
+        exporter.wait()
+        exporter.cancel()
+        self.widget.run_until(lambda: exporter.finished)
+
+        self.assertEqual(self.done, [True])
+        self.assertTrue(exporter.completed)
+        self.assertEqual(len(FileHandler.read_employees(self.file_path)), 30)
+
+class TestBackgroundJournalWriter(unittest.TestCase):
+    """
+    Contains tests for writing pending changes to the journal on a worker thread.
+    """
+
+    def setUp(self):
+        """
+        Create a journal in a temporary directory.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal = EmployeeJournal(os.path.join(self.temp_dir.name, "employees.csv"))
+        self.widget = FakeWidget()
+        self.done = []
+        self.errors = []
+
+    def tearDown(self):
+        self.journal.close()
+        self.temp_dir.cleanup()
+
+    def test_writes_records(self):
+        """
+        Tests that every record is appended and the task reports success.
+        """
+        records = [["add", str(i), "First", "Last", "Dept", "Title"] for i in range(50)]
+        writer = BackgroundJournalWriter(self.widget, self.journal, records, on_done=self.done.append)
+        writer.start()
+        writer.wait()
+        self.assertTrue(writer.written)
+        self.widget.run_until(lambda: writer.finished)
+
+        self.assertEqual(self.done, [False])
+        self.assertEqual(self.journal.entries, 50)
+        with open(self.journal.journal_path, encoding='utf-8') as file:
+            self.assertEqual(len(file.readlines()), 50)
+
+    def test_error_is_reported(self):
+        """
+        Tests that a failed write reaches the error callback and is not marked written.
+        """
+        self.journal.journal_path = self.temp_dir.name
+        writer = BackgroundJournalWriter(self.widget, self.journal, [["delete", "1"]],
+                                         on_done=self.done.append, on_error=self.errors.append)
+        writer.start()
+        self.widget.run_until(lambda: writer.finished)
+
+        self.assertFalse(writer.written)
+        self.assertEqual(len(self.errors), 1)
+        self.assertEqual(self.done, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the multi-file merge in bulk_import.py.
+"""
+
+import unittest
+import unittest.mock
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bulk_import import merge_csv_files, FIRST_WINS, LAST_WINS
+from file_handler import FileHandler
+
+HEADER = "employee_id,first_name,last_name,department,job_title\n"
+
+class TestMergeCsvFiles(unittest.TestCase):
+    """
+    Contains tests for the deduplicating external merge.
+    """
+
+    def setUp(self):
+        """
+        Set up an existing roster and two overlapping extracts.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.destination = self.write("employees.csv", "101,Jane,Doe,Engineering,Developer\n"
+                                                       "102,John,Smith,Marketing,Manager\n")
+        self.first = self.write("first.csv", "103,Mary,Jones,Engineering,Manager\n"
+                                             "102,John,Smith,Sales,Manager\n"
+                                             "10,Tom,Lee,HR,Recruiter\n")
+        self.second = self.write("second.csv", "103,Mary,Jones,IT,Administrator\n"
+                                               "abc,Bad,Row,HR,Recruiter\n"
+                                               "103,Mary,Jones,Finance,Accountant\n")
+
+    def write(self, name, rows):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(HEADER + rows)
+        return path
+
+    def departments(self):
+        return {emp.employee_id: emp.department for emp in FileHandler.iter_employees(self.destination)}
+
+    def test_last_writer_wins(self):
+        """
+        Tests that later rows replace earlier ones and the result is in ID order.
+        """
+        errors = []
+        result = merge_csv_files([self.first, self.second], self.destination, conflict=LAST_WINS,
+                                 on_error=lambda path, line, row, error: errors.append((path, line)),
+                                 run_rows=2)
+        self.assertEqual(self.departments(), {"10": "HR", "101": "Engineering", "102": "Sales", "103": "Finance"})
+        self.assertEqual([emp.employee_id for emp in FileHandler.iter_employees(self.destination)],
+                         ["10", "101", "102", "103"])
+        self.assertEqual(result.rows_read, 7)
+        self.assertEqual(result.rows_written, 4)
+        self.assertEqual(result.duplicates, 3)
+        self.assertEqual(result.rows_rejected, 1)
+        self.assertEqual(errors, [(self.second, 3)])
+
+    def test_first_writer_wins(self):
+        """
+        Tests that the existing roster and earlier extracts take precedence.
+        """
+        with self.assertLogs(level="WARNING"):
+            merge_csv_files([self.first, self.second], self.destination, conflict=FIRST_WINS)
+        self.assertEqual(self.departments(), {"10": "HR", "101": "Engineering", "102": "Marketing",
+                                              "103": "Engineering"})
+
+    def test_many_runs_merge_in_passes(self):
+        """
+        Tests that more runs than the merge fan-in are merged over several passes.
+        """
+        rows = "".join(f"{number},First{number},Last,Sales,Clerk\n" for number in range(300, 0, -1))
+        source = self.write("big.csv", rows + "150,Dup,Last,Sales,Clerk\n")
+        with unittest.mock.patch("bulk_import.MERGE_FAN_IN", 3):
+            result = merge_csv_files([source], self.destination, include_destination=False, run_rows=10)
+        employees = list(FileHandler.iter_employees(self.destination))
+        self.assertEqual([emp.employee_id for emp in employees], [str(number) for number in range(1, 301)])
+        self.assertEqual(employees[149].first_name, "Dup")
+        self.assertEqual(result.duplicates, 1)
+
+    def test_rejects_unknown_rule_and_missing_source(self):
+        """
+        Tests argument checking before anything is written.
+        """
+        with self.assertRaises(ValueError):
+            merge_csv_files([self.first], self.destination, conflict="newest")
+        with self.assertRaises(FileNotFoundError):
+            merge_csv_files([os.path.join(self.temp_dir.name, "missing.csv")], self.destination)
+        self.assertEqual(len(self.departments()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
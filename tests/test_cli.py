@@ -0,0 +1,180 @@
+"""
+Unit tests for the command-line interface in cli.py.
+"""
+
+import unittest
+import unittest.mock
+import io
+import json
+import sys
+import os
+import subprocess
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cli
+from file_handler import FileHandler
+
+HEADER = "employee_id,first_name,last_name,department,job_title\n"
+
+class TestCli(unittest.TestCase):
+    """
+    Contains tests for the count, headcount, query, export, import and partition commands.
+    """
+
+    def setUp(self):
+        """
+        Set up a small roster in a temporary directory.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.source = self.write("employees.csv", "101,Jane,Doe,Engineering,Developer\n"
+                                                  "102,John,Smith,Marketing,Manager\n"
+                                                  "103,Mary,Jones,Engineering,Manager\n")
+
+    def write(self, name, rows):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, mode='w', newline='', encoding='utf-8') as file:
+            file.write(HEADER + rows)
+        return path
+
+    def run_cli(self, *argv):
+        """
+        Runs the CLI and returns its exit status and stdout.
+        """
+        output = io.StringIO()
+        with unittest.mock.patch("sys.stdout", output):
+            status = cli.main(list(argv))
+        return status, output.getvalue()
+
+    def test_count(self):
+        """
+        Test that count prints the number of employees.
+        """
+        self.assertEqual(self.run_cli("count", self.source), (0, "3\n"))
+
+    def test_headcount(self):
+        """
+        Test that headcount prints counts per department or per pair.
+        """
+        status, output = self.run_cli("headcount", self.source, "--by", "department")
+        self.assertEqual(status, 0)
+        self.assertEqual(output.splitlines(), ["department,count", "Engineering,2", "Marketing,1"])
+        self.assertIn("Engineering,Manager,1", self.run_cli("headcount", self.source)[1].splitlines())
+
+    def test_query_filters(self):
+        """
+        Test that query prints only the rows matching every filter.
+        """
+        status, output = self.run_cli("query", "--source", self.source, "--department", "Engineering",
+                                      "--job-title", "Manager")
+        self.assertEqual(status, 0)
+        self.assertEqual(output, "103,Mary,Jones,Engineering,Manager\n")
+
+    def test_query_search_and_limit(self):
+        """
+        Test that query matches word prefixes like the search box and stops at the limit.
+        """
+        status, output = self.run_cli("query", "--source", self.source, "--search", "eng", "--limit", "1",
+                                      "--format", "tsv", "--header")
+        self.assertEqual(status, 0)
+        self.assertEqual(output.splitlines(), [HEADER.strip().replace(",", "\t"),
+                                               "101\tJane\tDoe\tEngineering\tDeveloper"])
+
+    def test_query_by_id(self):
+        """
+        Test that an ID lookup prints the employee and exits 1 for an unknown ID.
+        """
+        status, output = self.run_cli("query", "--source", self.source, "--id", "102", "--format", "jsonl")
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(output)["last_name"], "Smith")
+        self.assertEqual(self.run_cli("query", "--source", self.source, "--id", "999"), (1, ""))
+        self.assertFalse(os.path.exists(self.source + ".idx"))
+        self.assertEqual(self.run_cli("query", "--source", self.source, "--id", "101", "--index")[0], 0)
+        self.assertTrue(os.path.exists(self.source + ".idx"))
+
+    def test_query_by_id_skips_invalid_rows(self):
+        """
+        Test that an ID lookup skips an invalid row like the streaming queries do.
+        """
+        source = self.write("invalid.csv", "104,Ian,,Engineering,QA Tester\n"
+                                           "104,Ian,Martinez,Engineering,QA Tester\n"
+                                           "105,Ann,Lee,,Developer\n")
+        with self.assertLogs(level="WARNING"):
+            status, output = self.run_cli("query", "--source", source, "--id", "104")
+        self.assertEqual((status, output), (0, "104,Ian,Martinez,Engineering,QA Tester\n"))
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.run_cli("query", "--source", source, "--id", "105"), (1, ""))
+
+    def test_export(self):
+        """
+        Test that export writes a file, or CSV to stdout with '-'.
+        """
+        destination = os.path.join(self.temp_dir.name, "backup.csv")
+        self.assertEqual(self.run_cli("export", destination, "--source", self.source)[0], 0)
+        self.assertEqual(len(FileHandler.read_employees(destination)), 3)
+
+        status, output = self.run_cli("export", "-", "--source", self.source)
+        self.assertEqual(status, 0)
+        self.assertEqual(output.splitlines()[0], HEADER.strip())
+        self.assertEqual(len(output.splitlines()), 4)
+
+    def test_import(self):
+        """
+        Test that import merges extracts into the data file.
+        """
+        extract = self.write("extract.csv", "104,Tom,Lee,HR,Recruiter\n"
+                                            "101,Jane,Doe,Sales,Developer\n")
+        with unittest.mock.patch("sys.stderr", io.StringIO()):
+            status, _ = self.run_cli("import", extract, "--into", self.source)
+        self.assertEqual(status, 0)
+        employees = {employee.employee_id: employee for employee in FileHandler.read_employees(self.source)}
+        self.assertEqual(sorted(employees), ["101", "102", "103", "104"])
+        self.assertEqual(employees["101"].department, "Sales")
+
+    def test_partition(self):
+        """
+        Test that partition splits the data file and that commands read the directory.
+        """
+        directory = os.path.join(self.temp_dir.name, "employees.d")
+        with unittest.mock.patch("sys.stderr", io.StringIO()):
+            self.assertEqual(self.run_cli("partition", directory, "--from", self.source)[0], 0)
+        self.assertEqual(self.run_cli("count", directory), (0, "3\n"))
+        status, output = self.run_cli("query", "--source", directory, "--department", "Marketing")
+        self.assertEqual((status, output), (0, "102,John,Smith,Marketing,Manager\n"))
+        status, output = self.run_cli("headcount", directory, "--by", "department")
+        self.assertEqual(output.splitlines(), ["department,count", "Engineering,2", "Marketing,1"])
+
+    def test_sqlite_source(self):
+        """
+        Test that commands read an SQLite database given as the source.
+        """
+        from sqlite_backend import SQLiteHandler
+        database_path = os.path.join(self.temp_dir.name, "employees.db")
+        with SQLiteHandler(database_path) as database:
+            database.import_csv(self.source)
+        self.assertEqual(self.run_cli("count", database_path), (0, "3\n"))
+        status, output = self.run_cli("query", "--source", database_path, "--id", "103")
+        self.assertEqual((status, output), (0, "103,Mary,Jones,Engineering,Manager\n"))
+        self.assertEqual(self.run_cli("query", "--source", database_path, "--id", "999"), (1, ""))
+        status, output = self.run_cli("query", "--source", database_path, "--job-title", "Manager")
+        self.assertEqual(output.splitlines(), ["102,John,Smith,Marketing,Manager",
+                                               "103,Mary,Jones,Engineering,Manager"])
+        missing = os.path.join(self.temp_dir.name, "missing.db")
+        self.assertEqual(self.run_cli("count", missing), (0, "0\n"))
+        self.assertFalse(os.path.exists(missing))
+
+    def test_does_not_import_tkinter(self):
+        """
+        Test that running a command never loads the GUI toolkit.
+        """
+        script = ("import sys, cli; cli.main(['count', sys.argv[1]]); "
+                  "sys.exit('tkinter' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", script, self.source], capture_output=True,
+                                cwd=os.path.dirname(os.path.abspath(cli.__file__)))
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for reading and writing compressed CSV files.
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import compression
+from employee import Employee
+from file_handler import FileHandler
+
+class TestCompressedFiles(unittest.TestCase):
+    """
+    Contains tests for compressed CSV through FileHandler.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary directory and a few employees.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.employees = [Employee(str(100 + i), f"First{i}", "Last", "Engineering", "Developer")
+                          for i in range(50)]
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def read_rows(self, file_path):
+        return [employee.to_list() for employee in FileHandler.read_employees(file_path)]
+
+    def test_round_trip(self):
+        """
+        Test that every codec writes a compressed file that reads back the same.
+        """
+        for name, magic in (("e.csv.gz", b"\x1f\x8b"), ("e.csv.bz2", b"BZh"), ("e.csv.xz", b"\xfd7zXZ\x00"),
+                            ("e.csv.lzma", b"\xfd7zXZ\x00")):
+            with self.subTest(name=name):
+                file_path = self.path(name)
+                FileHandler.write_employees(file_path, self.employees)
+                with open(file_path, mode='rb') as file:
+                    self.assertTrue(file.read().startswith(magic))
+                self.assertEqual(self.read_rows(file_path), [employee.to_list() for employee in self.employees])
+
+                self.assertEqual(FileHandler.write_employees_atomic(file_path, self.employees[:10]), 10)
+                self.assertEqual(self.read_rows(file_path), [employee.to_list() for employee in self.employees[:10]])
+                self.assertEqual(os.listdir(self.temp_dir.name).count(name), 1)
+
+    def test_detected_by_magic_bytes(self):
+        """
+        Test that a compressed file without a codec extension is still recognised.
+        """
+        FileHandler.write_employees(self.path("e.csv.gz"), self.employees)
+        shutil.copy(self.path("e.csv.gz"), self.path("e.dat"))
+        self.assertEqual(compression.codec_for_file(self.path("e.dat")), compression.GZIP)
+        self.assertEqual(len(self.read_rows(self.path("e.dat"))), 50)
+        self.assertIsNone(compression.codec_for_file(self.path("missing.dat")))
+
+    def test_progress_counts_stored_bytes(self):
+        """
+        Test that progress is reported against the compressed size.
+        """
+        file_path = self.path("e.csv.bz2")
+        FileHandler.write_employees(file_path, self.employees)
+        progress = []
+        batches = list(FileHandler.iter_employees(file_path, batch_size=20, on_progress=progress.append))
+        self.assertEqual(sum(map(len, batches)), 50)
+        self.assertEqual(progress[-1], os.path.getsize(file_path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the CsvOffsetIndex class and helpers in csv_index.py.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from csv_index import CsvOffsetIndex, record_spans
+
+CSV_DATA = (
+    'employee_id,first_name,last_name,department,job_title\n'
+    '101,Jane,Doe,Engineering,Developer\n'
+    '102,"John\nJr",Smith,"Sales, EMEA",Manager\n'
+    '103,Mary,Jones,HR,Recruiter\n'
+)
+
+class TestRecordSpans(unittest.TestCase):
+    """
+    Contains tests for finding CSV record boundaries.
+    """
+
+    def test_quoted_newline_stays_in_record(self):
+        """
+        Tests that a newline inside quotes does not end the record.
+        """
+        data = CSV_DATA.encode('utf-8')
+        records = [data[start:end] for start, end in record_spans(data)]
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[2], b'102,"John\nJr",Smith,"Sales, EMEA",Manager\n')
+
+    def test_missing_final_newline(self):
+        """
+        Tests that the last record is returned even without a trailing newline.
+        """
+        self.assertEqual(list(record_spans(b"a,b\nc,d")), [(0, 4), (4, 7)])
+
+class TestCsvOffsetIndex(unittest.TestCase):
+    """
+    Contains tests for looking up employees through the offset index.
+    """
+
+    def setUp(self):
+        """
+        Write a temporary CSV file to index.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, "employees.csv")
+        with open(self.csv_path, "w", newline="", encoding="utf-8") as file:
+            file.write(CSV_DATA)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get(self):
+        """
+        Tests lookups of present and missing IDs, including a multi-line row.
+        """
+        with CsvOffsetIndex(self.csv_path) as index:
+            self.assertEqual(len(index), 3)
+            self.assertEqual(index.get("103").to_list(), ["103", "Mary", "Jones", "HR", "Recruiter"])
+            self.assertEqual(index.get("102").first_name, "John\nJr")
+            self.assertEqual(index.get("102").department, "Sales, EMEA")
+            self.assertIsNone(index.get("999"))
+            self.assertNotIn("999", index)
+
+    def test_sidecar_is_reused(self):
+        """
+        Tests that a second index over an unchanged file loads the sidecar instead of scanning.
+        """
+        with CsvOffsetIndex(self.csv_path) as index:
+            index.refresh()
+        self.assertTrue(os.path.exists(self.csv_path + ".idx"))
+
+        with patch.object(CsvOffsetIndex, "_build") as mock_build:
+            with CsvOffsetIndex(self.csv_path) as index:
+                self.assertEqual(index.get("101").last_name, "Doe")
+            mock_build.assert_not_called()
+
+    def test_unsaved_index_writes_no_sidecar(self):
+        """
+        Tests that an index created with save=False is kept in memory only.
+        """
+        with CsvOffsetIndex(self.csv_path, save=False) as index:
+            self.assertEqual(index.get("101").last_name, "Doe")
+        self.assertFalse(os.path.exists(self.csv_path + ".idx"))
+
+    def test_rebuilds_when_file_changes(self):
+        """
+        Tests that appending to the CSV file is picked up by the next lookup.
+        """
+        with CsvOffsetIndex(self.csv_path) as index:
+            self.assertIsNone(index.get("104"))
+            with open(self.csv_path, "a", newline="", encoding="utf-8") as file:
+                file.write("104,Ian,Martinez,Engineering,QA Tester\n")
+            self.assertEqual(index.get("104").job_title, "QA Tester")
+
+if __name__ == '__main__':
+    unittest.main()
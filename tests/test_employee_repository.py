@@ -0,0 +1,122 @@
+"""
+Unit tests for the EmployeeRepository class in employee_repository.py.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from employee_repository import EmployeeRepository, DuplicateEmployeeError
+
+class TestEmployeeRepository(unittest.TestCase):
+    """
+    Contains tests for the indexed employee repository.
+    """
+
+    def setUp(self):
+        """
+        Set up a repository holding a few sample employees.
+        """
+        self.repository = EmployeeRepository([
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager"),
+            Employee("103", "Mary", "Jones", "Engineering", "Manager")
+        ])
+
+    def ids(self, employees):
+        return [emp.employee_id for emp in employees]
+
+    def test_lookup_by_id(self):
+        """
+        Tests membership checks and lookups on the ID index.
+        """
+        self.assertIn("102", self.repository)
+        self.assertNotIn("999", self.repository)
+        self.assertEqual(self.repository.get("102").last_name, "Smith")
+        self.assertIsNone(self.repository.get("999"))
+
+    def test_add_rejects_duplicate_id(self):
+        """
+        Tests that adding an existing ID raises and leaves the repository unchanged.
+        """
+        with self.assertRaises(DuplicateEmployeeError):
+            self.repository.add(Employee("101", "X", "Y", "HR", "Recruiter"))
+        self.assertEqual(len(self.repository), 3)
+        self.assertEqual(self.repository.by_department("HR"), [])
+
+    def test_secondary_indexes(self):
+        """
+        Tests lookups by department and job title.
+        """
+        self.assertEqual(self.ids(self.repository.by_department("Engineering")), ["101", "103"])
+        self.assertEqual(self.ids(self.repository.by_job_title("Manager")), ["102", "103"])
+
+    def test_update_moves_between_indexes(self):
+        """
+        Tests that updating an employee moves them between secondary index entries.
+        """
+        self.repository.update(Employee("101", "Jane", "Doe", "Marketing", "Developer"))
+        self.assertEqual(self.ids(self.repository.by_department("Engineering")), ["103"])
+        self.assertEqual(self.ids(self.repository.by_department("Marketing")), ["102", "101"])
+        with self.assertRaises(KeyError):
+            self.repository.update(Employee("999", "A", "B", "C", "D"))
+
+    def test_delete_keeps_indexes_consistent(self):
+        """
+        Tests that deleting an employee updates every index, including the moved row.
+        """
+        removed = self.repository.delete("101")
+        self.assertEqual(removed.first_name, "Jane")
+        self.assertNotIn("101", self.repository)
+        self.assertEqual(len(self.repository), 2)
+        self.assertEqual(self.repository.get("103").last_name, "Jones")
+        self.assertEqual(self.ids(self.repository.by_department("Engineering")), ["103"])
+        self.repository.delete("103")
+        self.assertEqual(self.repository.by_department("Engineering"), [])
+        with self.assertRaises(KeyError):
+            self.repository.delete("101")
+
+    def test_in_row_order(self):
+        """
+        Tests that both small and large sets of IDs come back in row order.
+        """
+        repository = EmployeeRepository(
+            [Employee(str(100 + i), "A", "B", "HR", "Clerk") for i in range(40)])
+        repository.delete("100")
+        rows = [emp.employee_id for emp in repository]
+        self.assertEqual(repository.in_row_order({"105", "139"}), [id_ for id_ in rows if id_ in ("105", "139")])
+        self.assertEqual(repository.in_row_order(set(rows[5:])), rows[5:])
+        self.assertEqual(repository.in_row_order(set(rows)), rows)
+
+    def test_from_store_builds_indexes(self):
+        """
+        Tests that a repository built from a store answers every kind of lookup.
+        """
+        repository = EmployeeRepository.from_store(self.repository.snapshot())
+        self.assertEqual(repository.get("103").first_name, "Mary")
+        self.assertEqual(self.ids(repository.by_department("Engineering")), ["101", "103"])
+        self.assertEqual(self.ids(repository.by_job_title("Developer")), ["101"])
+        repository.delete("101")
+        self.assertEqual(self.ids(repository.by_department("Engineering")), ["103"])
+
+    @patch("employee_repository.FileHandler.iter_employees")
+    def test_from_file_skips_duplicates(self, mock_iter):
+        """
+        Tests that from_file keeps the first of several rows sharing an ID.
+        """
+        mock_iter.return_value = iter([
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("101", "Copy", "Doe", "Engineering", "Developer")
+        ])
+        with self.assertLogs(level="WARNING"):
+            repository = EmployeeRepository.from_file("dummy/path/employees.csv")
+        self.assertEqual(len(repository), 1)
+        self.assertEqual(repository.get("101").first_name, "Jane")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Unit tests for the EmployeeStore class in employee_store.py.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from employee_store import EmployeeStore
+
+class TestEmployeeStore(unittest.TestCase):
+    """
+    Contains tests for the columnar employee store.
+    """
+
+    def setUp(self):
+        """
+        Set up a store holding a few sample employees.
+        """
+        self.employees = [
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager"),
+            Employee("103", "Mary", "Jones", "Engineering", "Developer")
+        ]
+        self.store = EmployeeStore(self.employees)
+
+    def test_len_and_iteration(self):
+        """
+        Tests that the store reports its size and iterates in insertion order.
+        """
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual([emp.to_list() for emp in self.store],
+                         [emp.to_list() for emp in self.employees])
+
+    def test_getitem_returns_employee(self):
+        """
+        Tests that indexing hands out Employee objects, including negative indexes.
+        """
+        employee = self.store[1]
+        self.assertIsInstance(employee, Employee)
+        self.assertEqual(employee.to_list(), ["102", "John", "Smith", "Marketing", "Manager"])
+        self.assertEqual(self.store[-1].employee_id, "103")
+        with self.assertRaises(IndexError):
+            self.store[3]
+
+    def test_dictionary_encoding(self):
+        """
+        Tests that repeated departments and job titles are stored only once.
+        """
+        self.assertEqual(self.store.departments(), ["Engineering", "Marketing"])
+        self.assertEqual(self.store.job_titles(), ["Developer", "Manager"])
+
+    def test_setitem_updates_row(self):
+        """
+        Tests that assigning to an index replaces every field of that row.
+        """
+        self.store[0] = Employee("101", "Jane", "Doe", "Finance", "Accountant")
+        self.assertEqual(self.store.row(0), ["101", "Jane", "Doe", "Finance", "Accountant"])
+        self.assertIn("Finance", self.store.departments())
+
+    def test_copy_is_independent(self):
+        """
+        Tests that changes to a copy do not affect the original store.
+        """
+        clone = self.store.copy()
+        clone.append(Employee("104", "New", "Person", "HR", "Recruiter"))
+        clone[0] = Employee("101", "Jane", "Doe", "Finance", "Accountant")
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store[0].department, "Engineering")
+        self.assertNotIn("HR", self.store.departments())
+
+    def test_codes_widen_past_short_range(self):
+        """
+        Tests that a column with more than 65536 distinct values still round-trips.
+        """
+        store = EmployeeStore()
+        for i in range(70000):
+            store.append(Employee(str(i), "A", "B", f"Dept {i}", "Title"))
+        self.assertEqual(store[69999].department, "Dept 69999")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,12 +7,14 @@ from unittest.mock import patch, mock_open, MagicMock
 import sys
 import os
 import csv
+import tempfile
 
 # Add the parent directory to the Python path to allow module imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from file_handler import FileHandler
+from file_handler import FileHandler, WriteCancelled
 from employee import Employee
+from validator import BatchValidator, ValidationError
 
 class TestFileHandler(unittest.TestCase):
     """
@@ -61,6 +63,61 @@ class TestFileHandler(unittest.TestCase):
         # Assert that the function returns an empty list as expected
         self.assertEqual(employees, [])
 
+    @patch("builtins.open", new_callable=mock_open, read_data='employee_id,first_name,last_name,department,job_title\n101,Jane,Doe,Engineering,Developer\n102,John,Smith,Marketing,Manager\n103,Mary,Jones,Engineering,Developer\n')
+    def test_iter_employees_batches(self, mock_file):
+        """
+        Tests that iter_employees yields fixed-size batches, with a shorter final batch.
+        """
+        batches = list(FileHandler.iter_employees("dummy/path/employees.csv", batch_size=2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(batches[1][0].employee_id, "103")
+
+    @patch("builtins.open", new_callable=mock_open, read_data='employee_id,first_name,last_name,department,job_title\n101,Jane,Doe\n102,John,Smith,Marketing,Manager\n')
+    def test_iter_employees_reports_bad_rows(self, mock_file):
+        """
+        Tests that rows with missing columns are skipped and passed to the error callback.
+        """
+        errors = []
+        employees = list(FileHandler.iter_employees(
+            "dummy/path/employees.csv",
+            on_error=lambda line, row, error: errors.append((line, error))
+        ))
+
+        self.assertEqual([emp.employee_id for emp in employees], ["102"])
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], 2)
+        self.assertIsInstance(errors[0][1], KeyError)
+
+    @patch("builtins.open", new_callable=mock_open, read_data='employee_id,first_name,last_name,department,job_title\n101,Jane,Doe,Engineering,Developer\nabc,John,Smith,Marketing,Manager\n101,Copy,Doe,Engineering,Developer\n102,Mary,,Engineering,Developer\n')
+    def test_iter_employees_validates_rows(self, mock_file):
+        """
+        Tests that invalid IDs and blank fields are reported and skipped, and
+        repeated IDs too when the validator checks duplicates.
+        """
+        errors = []
+        employees = list(FileHandler.iter_employees(
+            "dummy/path/employees.csv",
+            on_error=lambda line, row, error: errors.append((line, error))
+        ))
+        self.assertEqual([emp.first_name for emp in employees], ["Jane", "Copy"])
+        self.assertEqual([line for line, _ in errors], [3, 5])
+
+        errors = []
+        employees = list(FileHandler.iter_employees(
+            "dummy/path/employees.csv",
+            on_error=lambda line, row, error: errors.append((line, error)),
+            validator=BatchValidator()
+        ))
+
+        self.assertEqual([emp.first_name for emp in employees], ["Jane"])
+        self.assertEqual([line for line, _ in errors], [3, 4, 5])
+        self.assertIsInstance(errors[0][1], ValidationError)
+        self.assertEqual(errors[2][1].issues[0].field, "last_name")
+
+        unchecked = list(FileHandler.iter_employees("dummy/path/employees.csv", validate=False))
+        self.assertEqual(len(unchecked), 4)
+
     @patch("builtins.open", new_callable=mock_open)
     def test_write_employees(self, mock_file):
         """
@@ -87,5 +144,47 @@ class TestFileHandler(unittest.TestCase):
             # Ensure writerow was called 3 times (1 for header, 2 for employees)
             self.assertEqual(mock_writer.writerow.call_count, 3)
 
+class TestAtomicWrite(unittest.TestCase):
+    """
+    Contains tests for FileHandler.write_employees_atomic, using a real temporary directory.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory holding an existing employees file.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "employees.csv")
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            file.write("original contents\n")
+        self.employees = [Employee(str(i), "First", "Last", "Dept", "Title") for i in range(25)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_replaces_file_and_reports_progress(self):
+        """
+        Tests that the new file replaces the old one and no temporary file is left behind.
+        """
+        progress = []
+        with patch("file_handler.WRITE_CHUNK_ROWS", 10):
+            written = FileHandler.write_employees_atomic(self.file_path, self.employees, on_progress=progress.append)
+
+        self.assertEqual(written, 25)
+        self.assertEqual(progress, [10, 20, 25])
+        self.assertEqual(len(FileHandler.read_employees(self.file_path)), 25)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["employees.csv"])
+
+    def test_cancel_leaves_original_file(self):
+        """
+        Tests that a cancelled write keeps the original file and removes the temporary one.
+        """
+        with self.assertRaises(WriteCancelled):
+            FileHandler.write_employees_atomic(self.file_path, self.employees, should_cancel=lambda: True)
+
+        with open(self.file_path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "original contents\n")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["employees.csv"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+"""
+Unit tests for the DataFileWatcher class in file_watcher.py.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from file_handler import FileHandler
+from file_watcher import APPENDED, REWRITTEN, UNCHANGED, DataFileWatcher, complete_records_end
+
+HEADER = "employee_id,first_name,last_name,department,job_title\n"
+
+class TestDataFileWatcher(unittest.TestCase):
+    """
+    Contains tests for telling appends from rewrites and reading appended rows.
+    """
+
+    def setUp(self):
+        """
+        Set up a CSV file that has been read once.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.file_path = os.path.join(self.temp_dir.name, "employees.csv")
+        self.write(HEADER + "101,Jane,Doe,Engineering,Developer\n")
+        self.watcher = DataFileWatcher(self.file_path)
+        self.watcher.mark()
+
+    def write(self, text, mode='w'):
+        with open(self.file_path, mode=mode, newline='', encoding='utf-8') as file:
+            file.write(text)
+
+    def read_appended(self, errors=None):
+        on_error = None if errors is None else lambda line, row, error: errors.append(line)
+        return [employee for batch in self.watcher.read_appended(on_error=on_error) for employee in batch]
+
+    def test_unchanged(self):
+        """
+        Test that an untouched file reports no change.
+        """
+        self.assertEqual(self.watcher.check(), UNCHANGED)
+
+    def test_reads_only_appended_rows(self):
+        """
+        Test that appended rows are read once, with their line numbers.
+        """
+        self.write("102,John,Smith,Marketing,Manager\nabc,Bad,Row,HR,Recruiter\n", mode='a')
+        self.assertEqual(self.watcher.check(), APPENDED)
+        errors = []
+        employees = self.read_appended(errors)
+        self.assertEqual([employee.employee_id for employee in employees], ["102"])
+        self.assertEqual(errors, [4])
+        self.assertEqual(self.watcher.offset, os.path.getsize(self.file_path))
+        self.assertEqual(self.watcher.check(), UNCHANGED)
+
+        self.write("103,Mary,Jones,HR,Recruiter\n", mode='a')
+        self.assertEqual(self.watcher.check(), APPENDED)
+        self.assertEqual([employee.employee_id for employee in self.read_appended()], ["103"])
+
+    def test_waits_for_an_unfinished_row(self):
+        """
+        Test that a row without its newline is left until it is completed.
+        """
+        self.write('102,John,Smith,"Sales\nand Marketing",Man', mode='a')
+        self.assertEqual(self.watcher.check(), APPENDED)
+        self.assertEqual(self.read_appended(), [])
+        self.assertEqual(self.watcher.check(), UNCHANGED)
+
+        self.write("ager\n", mode='a')
+        self.assertEqual(self.watcher.check(), APPENDED)
+        employees = self.read_appended()
+        self.assertEqual([employee.department for employee in employees], ["Sales\nand Marketing"])
+
+    def test_rewrite_and_truncation(self):
+        """
+        Test that a replaced, truncated or edited file must be reloaded.
+        """
+        FileHandler.write_employees_atomic(self.file_path, FileHandler.read_employees(self.file_path))
+        self.assertEqual(self.watcher.check(), REWRITTEN)
+
+        self.watcher.mark()
+        self.write(HEADER)
+        self.assertEqual(self.watcher.check(), REWRITTEN)
+
+        self.write(HEADER + "101,Jane,Doe,Engineering,Developer\n")
+        self.watcher.mark()
+        with open(self.file_path, mode='r+b') as file:
+            file.write(b"999")
+            file.seek(0, os.SEEK_END)
+            file.write(b"102,John,Smith,Marketing,Manager\n")
+        self.assertEqual(self.watcher.check(), REWRITTEN)
+
+    def test_mark_at_offset(self):
+        """
+        Test that rows written after the marked offset count as appended.
+        """
+        offset = os.path.getsize(self.file_path)
+        self.write("102,John,Smith,Marketing,Manager\n", mode='a')
+        self.watcher.mark(offset)
+        self.assertEqual(self.watcher.check(), APPENDED)
+        self.assertEqual([employee.employee_id for employee in self.read_appended()], ["102"])
+
+    def test_complete_records_end(self):
+        """
+        Test that a newline inside quotes does not end a record.
+        """
+        self.assertEqual(complete_records_end(b'1,a\n2,"b\nc'), 4)
+        self.assertEqual(complete_records_end(b'1,a\n2,"b\nc"\n'), 12)
+        self.assertEqual(complete_records_end(b'1,a'), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for the spans and profiling helpers in instrumentation.py.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import pstats
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import instrumentation
+from instrumentation import metrics, span, timed
+
+class TestSpans(unittest.TestCase):
+    """
+    Contains tests for timing spans and row counters.
+    """
+
+    def setUp(self):
+        """
+        Start each test with no recorded spans.
+        """
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_span_records_calls_and_rows(self):
+        """
+        Tests that a span records each completed block and the rows it reports.
+        """
+        with span("work") as timing:
+            timing.rows = 100
+        with span("work", rows=50):
+            pass
+        stats = metrics.get("work")
+        self.assertEqual(stats.calls, 2)
+        self.assertEqual(stats.rows, 150)
+        self.assertGreaterEqual(stats.max_seconds, stats.last_seconds)
+        self.assertIn("work", metrics.report())
+
+    def test_failed_block_is_not_recorded(self):
+        """
+        Tests that a block that raises does not count as a completed call.
+        """
+        with self.assertRaises(RuntimeError):
+            with span("failing"):
+                raise RuntimeError("boom")
+        self.assertIsNone(metrics.get("failing"))
+
+    def test_timed_decorator_counts_rows(self):
+        """
+        Tests that timed() records the call and derives the row count from the result.
+        """
+        @timed("load", rows=len)
+        def load():
+            return [1, 2, 3]
+
+        self.assertEqual(load(), [1, 2, 3])
+        stats = metrics.get("load")
+        self.assertEqual((stats.calls, stats.rows), (1, 3))
+        self.assertIsNotNone(stats.rows_per_second())
+
+    def test_disabled_instrumentation_is_a_no_op(self):
+        """
+        Tests that, when disabled, functions are left undecorated and spans record nothing.
+        """
+        def function():
+            return 1
+
+        with patch("instrumentation.ENABLED", False):
+            self.assertIs(timed("x")(function), function)
+            with span("disabled") as timing:
+                timing.rows = 10
+        self.assertEqual(metrics.snapshot(), {})
+
+class TestProfiling(unittest.TestCase):
+    """
+    Contains tests for the opt-in profilers.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary directory for profile output.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(instrumentation.stop_profiling)
+
+    def test_cprofile_writes_stats(self):
+        """
+        Tests that the cProfile mode writes a file pstats can read.
+        """
+        output = os.path.join(self.temp_dir.name, "app.prof")
+        self.assertEqual(instrumentation.start_profiling("cprofile", output), "cprofile")
+        sum(range(1000))
+        self.assertEqual(instrumentation.stop_profiling(), output)
+        self.assertGreater(pstats.Stats(output).total_calls, 0)
+
+    def test_tracemalloc_from_environment(self):
+        """
+        Tests that the environment variables choose tracemalloc and the output file.
+        """
+        output = os.path.join(self.temp_dir.name, "memory.txt")
+        environment = {instrumentation.PROFILE_ENV: "tracemalloc", instrumentation.PROFILE_FILE_ENV: output}
+        with patch.dict(os.environ, environment):
+            self.assertEqual(instrumentation.start_profiling(), "tracemalloc")
+        data = [str(number) for number in range(1000)]
+        self.assertEqual(instrumentation.stop_profiling(), output)
+        with open(output, encoding="utf-8") as file:
+            self.assertIn("allocation sites", file.read())
+        del data
+
+    def test_off_by_default_and_rejects_unknown_modes(self):
+        """
+        Tests that nothing starts without the environment variable and bad modes raise.
+        """
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(instrumentation.start_profiling())
+        self.assertIsNone(instrumentation.stop_profiling())
+        with self.assertRaises(ValueError):
+            instrumentation.start_profiling("perf")
+
+if __name__ == '__main__':
+    unittest.main()
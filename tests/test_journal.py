@@ -0,0 +1,181 @@
+"""
+Unit tests for the EmployeeJournal class in journal.py.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from employee_repository import EmployeeRepository
+from file_handler import FileHandler
+from journal import ADD, DELETE, UPDATE, EmployeeJournal, PendingChanges
+
+class TestEmployeeJournal(unittest.TestCase):
+    """
+    Contains tests for journaling, replaying and compacting roster changes.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary snapshot with two employees and a journal for it.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.temp_dir.name, "employees.csv")
+        FileHandler.write_employees(self.snapshot_path, [
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager")
+        ])
+        self.journal = EmployeeJournal(self.snapshot_path, compact_threshold=3)
+
+    def tearDown(self):
+        self.journal.close()
+        self.temp_dir.cleanup()
+
+    def reload(self):
+        """
+        Simulates a restart: loads the snapshot and replays the journal.
+        """
+        self.journal.close()
+        repository = EmployeeRepository.from_file(self.snapshot_path)
+        journal = EmployeeJournal(self.snapshot_path, compact_threshold=3)
+        journal.replay(repository)
+        return repository, journal
+
+    def test_replay_applies_changes(self):
+        """
+        Tests that adds, updates and deletes survive a restart.
+        """
+        self.journal.append_records([[ADD, "103", "Mary", "Jones", "HR", "Recruiter"],
+                                     [UPDATE, "101", "Jane", "Doe", "Finance", "Accountant"],
+                                     [DELETE, "102"]])
+
+        repository, journal = self.reload()
+        self.assertEqual(sorted(emp.employee_id for emp in repository), ["101", "103"])
+        self.assertEqual(repository.get("101").department, "Finance")
+        self.assertEqual(journal.entries, 3)
+        self.assertTrue(journal.needs_compaction())
+
+    def test_pending_changes_keep_latest_per_employee(self):
+        """
+        Tests that a burst of changes is written once, with the same effect on replay.
+        """
+        pending = PendingChanges()
+        pending.add(Employee("103", "Mary", "Jones", "HR", "Recruiter"))
+        pending.add(Employee("103", "Mary", "Jones", "HR", "HR Manager"))
+        pending.add(Employee("104", "Tom", "Lee", "IT", "Developer"))
+        self.assertEqual(len(pending), 2)
+
+        records = pending.take()
+        self.assertEqual(len(pending), 0)
+        self.journal.append_records(records)
+        self.assertEqual(self.journal.entries, 2)
+
+        repository, _ = self.reload()
+        self.assertEqual(sorted(emp.employee_id for emp in repository), ["101", "102", "103", "104"])
+        self.assertEqual(repository.get("103").job_title, "HR Manager")
+
+    def test_pending_changes_apply_after_reload(self):
+        """
+        Tests that unsaved changes can be applied again to a freshly loaded roster.
+        """
+        pending = PendingChanges()
+        pending.add(Employee("103", "Mary", "Jones", "HR", "Recruiter"))
+        repository, _ = self.reload()
+        pending.apply(repository)
+        self.assertEqual(sorted(emp.employee_id for emp in repository), ["101", "102", "103"])
+        self.assertEqual(len(pending), 1)
+
+    def test_add_after_cancelled_load_is_rejected(self):
+        """
+        Tests that an add of an ID the partially loaded roster lacked does not
+        replace the employee already in the snapshot.
+        """
+        # A load cancelled after the first row has not seen employee 102.
+        partial = EmployeeRepository([Employee("101", "Jane", "Doe", "Engineering", "Developer")])
+        impostor = Employee("102", "Ian", "Martinez", "Engineering", "QA Tester")
+        partial.add(impostor)
+        pending = PendingChanges()
+        pending.add(impostor)
+        self.journal.append_records(pending.take())
+
+        with self.assertLogs(level="WARNING"):
+            repository, journal = self.reload()
+        self.assertEqual(repository.get("102").last_name, "Smith")
+        self.assertEqual(journal.entries, 0)
+
+        pending.add(impostor)
+        with self.assertLogs(level="WARNING"):
+            pending.apply(repository)
+        self.assertEqual(repository.get("102").last_name, "Smith")
+        self.assertEqual(len(pending), 0)
+
+    def test_restore_keeps_newer_changes(self):
+        """
+        Tests that restoring unwritten entries does not overwrite later changes.
+        """
+        pending = PendingChanges()
+        pending.add(Employee("103", "Mary", "Jones", "HR", "Recruiter"))
+        pending.add(Employee("104", "Tom", "Lee", "IT", "Developer"))
+        records = pending.take()
+        pending.add(Employee("103", "Mary", "Jones", "HR", "HR Manager"))
+        pending.restore(records)
+        self.assertEqual(sorted(pending.take()), [["add", "103", "Mary", "Jones", "HR", "HR Manager"],
+                                                  ["add", "104", "Tom", "Lee", "IT", "Developer"]])
+
+    def test_torn_final_entry_is_discarded(self):
+        """
+        Tests that an entry cut short by a crash is skipped and removed from the file.
+        """
+        self.journal.append_records([[ADD, "103", "Mary", "Jones", "HR", "Recruiter"]])
+        self.journal.close()
+        with open(self.journal.journal_path, "a", encoding="utf-8") as file:
+            file.write("add,104,Torn")
+
+        with self.assertLogs(level="WARNING"):
+            repository, journal = self.reload()
+        self.assertIn("103", repository)
+        self.assertNotIn("104", repository)
+        journal.append_records([[DELETE, "103"]])
+        journal.close()
+        repository, _ = self.reload()
+        self.assertNotIn("103", repository)
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        """
+        Tests that compaction rewrites the snapshot and removes the journal files.
+        """
+        repository = EmployeeRepository.from_file(self.snapshot_path)
+        employee = Employee("103", "Mary", "Jones", "HR", "Recruiter")
+        self.journal.append_records([[ADD, *employee.to_list()]])
+        repository.add(employee)
+
+        self.journal.begin_compaction()
+        FileHandler.write_employees_atomic(self.snapshot_path, repository)
+        self.journal.finish_compaction()
+        self.assertFalse(os.path.exists(self.journal.journal_path))
+        self.assertFalse(os.path.exists(self.journal.rotated_path))
+        self.assertEqual(len(FileHandler.read_employees(self.snapshot_path)), 3)
+
+    def test_unfinished_compaction_replays_idempotently(self):
+        """
+        Tests that a crash after the snapshot is written, but before the rotated
+        journal is removed, does not duplicate or lose changes.
+        """
+        repository = EmployeeRepository.from_file(self.snapshot_path)
+        employee = Employee("103", "Mary", "Jones", "HR", "Recruiter")
+        self.journal.append_records([[ADD, *employee.to_list()]])
+        repository.add(employee)
+        self.journal.begin_compaction()
+        self.journal.append_records([[DELETE, "101"]])
+        FileHandler.write_employees(self.snapshot_path, repository)
+
+        repository, _ = self.reload()
+        self.assertEqual(sorted(emp.employee_id for emp in repository), ["102", "103"])
+
+if __name__ == '__main__':
+    unittest.main()
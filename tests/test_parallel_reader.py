@@ -0,0 +1,105 @@
+"""
+Unit tests for the multi-process CSV reader in parallel_reader.py.
+"""
+
+import gzip
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from file_handler import FileHandler
+from validator import BatchValidator
+from parallel_reader import read_store_parallel, split_chunks
+
+class TestParallelReader(unittest.TestCase):
+    """
+    Contains tests for splitting and parsing a CSV file in parallel.
+    """
+
+    def setUp(self):
+        """
+        Write a CSV file with quoted newlines, bad rows and a repeated ID.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "employees.csv")
+        with open(self.file_path, "w", newline="", encoding="utf-8") as file:
+            file.write("employee_id,first_name,last_name,department,job_title\n")
+            for i in range(200):
+                if i % 7 == 0:
+                    file.write(f'{i},"Multi\nLine {i}",Last,"Dept, ""{i % 3}""",Title\n')
+                elif i == 150:
+                    file.write(f"{i},Short,Row\n")
+                elif i == 160:
+                    file.write(f"abc,First{i},Last{i},Dept{i % 3},Title{i % 5}\n")
+                elif i == 170:
+                    file.write(f"{i}, ,Last{i},Dept{i % 3},Title{i % 5}\n")
+                elif i == 180:
+                    file.write(f"5,First{i},Last{i},Dept{i % 3},Title{i % 5}\n")
+                else:
+                    file.write(f"{i},First{i},Last{i},Dept{i % 3},Title{i % 5}\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_chunks_start_on_record_boundaries(self):
+        """
+        Tests that every chunk boundary falls between records, never inside quotes.
+        """
+        with open(self.file_path, "rb") as file:
+            data = file.read()
+        header_end = data.index(b"\n") + 1
+        chunks = split_chunks(data, header_end, 8)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(chunks[0][0], header_end)
+        self.assertEqual(chunks[-1][1], len(data))
+        for (_, end, _), (start, _, lines_before) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[:start].count(b'"') % 2, 0)
+            self.assertEqual(data[start - 1:start], b"\n")
+            self.assertEqual(data[:start].count(b"\n"), lines_before)
+
+    def test_matches_sequential_reader(self):
+        """
+        Tests that parallel and sequential reads keep the same rows and skip the same ones.
+        """
+        sequential_errors = []
+        expected = [emp.to_list() for emp in FileHandler.iter_employees(
+            self.file_path, validator=BatchValidator(),
+            on_error=lambda line, row, error: sequential_errors.append((line, str(error))))]
+        self.assertEqual(len(sequential_errors), 4)
+
+        for workers in (1, 3):
+            errors = []
+            store = read_store_parallel(self.file_path, workers=workers,
+                                        on_error=lambda line, row, error: errors.append((line, str(error))))
+            self.assertEqual([emp.to_list() for emp in store], expected)
+            self.assertEqual(errors, sorted(sequential_errors))
+
+    def test_same_columns_as_read_store(self):
+        """
+        Tests that the parallel reader and its compressed fallback keep exactly
+        the rows read_store keeps from a file with bad and repeated rows.
+        """
+        compressed_path = self.file_path + ".gz"
+        with open(self.file_path, "rb") as source, gzip.open(compressed_path, "wb") as target:
+            target.write(source.read())
+        with self.assertLogs(level="WARNING"):
+            expected = FileHandler.read_store(self.file_path).columns()
+        for file_path, workers in ((self.file_path, 1), (self.file_path, 3), (compressed_path, 3)):
+            with self.assertLogs(level="WARNING"):
+                store = read_store_parallel(file_path, workers=workers)
+            self.assertEqual(store.columns(), expected)
+
+    def test_missing_file(self):
+        """
+        Tests that a missing file gives an empty store, like FileHandler.
+        """
+        self.assertEqual(len(read_store_parallel(os.path.join(self.temp_dir.name, "none.csv"))), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Unit tests for the PartitionedStorage class in partitioned_store.py.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+from partitioned_store import MANIFEST_NAME, PartitionedStorage
+
+class TestPartitionedStorage(unittest.TestCase):
+    """
+    Contains tests for saving, loading, importing and exporting shards.
+    """
+
+    def setUp(self):
+        """
+        Set up a roster spread over three departments and an empty directory.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.directory = os.path.join(self.temp_dir.name, "employees.d")
+        self.storage = PartitionedStorage(self.directory)
+        self.employees = [
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager"),
+            Employee("103", "Mary", "Jones", "Engineering", "Manager"),
+            Employee("104", "Tom", "Lee", "R&D", "Researcher"),
+        ]
+
+    def rows(self, store):
+        return sorted(store.rows())
+
+    def test_save_and_load(self):
+        """
+        Test that a save writes one shard per department that loads back.
+        """
+        result = self.storage.save(self.employees)
+        self.assertEqual(result.written, ["Engineering", "Marketing", "R&D"])
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         sorted([MANIFEST_NAME] + [shard.file for shard in self.storage.read_manifest().values()]))
+        self.assertEqual(self.rows(self.storage.load()), sorted(e.to_list() for e in self.employees))
+        self.assertEqual(self.storage.read_manifest()["Engineering"].rows, 2)
+
+    def test_load_selected_departments(self):
+        """
+        Test that loading chosen departments reads only their employees.
+        """
+        self.storage.save(self.employees)
+        store = self.storage.load(departments=["Marketing", "Unknown"])
+        self.assertEqual([row[0] for row in store.rows()], ["102"])
+        self.assertEqual(len(self.storage.load(departments=[])), 0)
+
+    def test_load_with_processes(self):
+        """
+        Test that shards parsed in a process pool load the same employees.
+        """
+        self.storage.save(self.employees)
+        self.assertEqual(self.rows(self.storage.load(processes=True, workers=2)),
+                         self.rows(self.storage.load()))
+
+    def test_save_rewrites_only_changed_shards(self):
+        """
+        Test that a save leaves unchanged shards alone and removes emptied departments.
+        """
+        self.storage.save(self.employees)
+        before = self.storage.read_manifest()
+        marketing = os.path.join(self.directory, before["Marketing"].file)
+        modified = os.stat(marketing).st_mtime_ns
+
+        self.employees[0] = Employee("101", "Jane", "Doe", "Engineering", "Architect")
+        del self.employees[3]
+        result = self.storage.save(self.employees)
+        self.assertEqual((result.written, result.unchanged, result.removed),
+                         (["Engineering"], ["Marketing"], ["R&D"]))
+        self.assertEqual(os.stat(marketing).st_mtime_ns, modified)
+        after = self.storage.read_manifest()
+        # A changed shard goes to a new file; the old one is deleted after the manifest swap.
+        self.assertNotEqual(after["Engineering"].file, before["Engineering"].file)
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         sorted([MANIFEST_NAME, after["Engineering"].file, after["Marketing"].file]))
+        self.assertEqual(self.storage.departments(), ["Engineering", "Marketing"])
+
+    def test_save_selected_departments(self):
+        """
+        Test that saving some departments keeps the others and rejects outsiders.
+        """
+        self.storage.save(self.employees)
+        store = self.storage.load(departments=["Marketing"])
+        store.append_row(["105", "Ann", "Wu", "Marketing", "Analyst"])
+        result = self.storage.save(store, departments=["Marketing"])
+        self.assertEqual(result.written, ["Marketing"])
+        self.assertEqual(len(self.storage.load()), 5)
+        with self.assertRaises(ValueError):
+            self.storage.save(self.employees, departments=["Marketing"])
+
+    def test_save_rejects_repeated_ids(self):
+        """
+        Test that an ID used in two departments is rejected before anything is written.
+        """
+        self.employees.append(Employee("101", "Jane", "Doe", "Marketing", "Manager"))
+        with self.assertRaises(ValueError):
+            self.storage.save(self.employees)
+        self.assertFalse(self.storage.exists())
+
+    def test_import_and_export(self):
+        """
+        Test that a single file splits into shards and joins back together.
+        """
+        source = os.path.join(self.temp_dir.name, "employees.csv")
+        FileHandler.write_employees_atomic(source, EmployeeStore(self.employees))
+        compressed = PartitionedStorage(self.directory, ".csv.gz")
+        self.assertEqual(len(compressed.import_file(source).written), 3)
+        self.assertTrue(all(name.endswith(".csv.gz") for name in os.listdir(self.directory)
+                            if name != MANIFEST_NAME))
+
+        destination = os.path.join(self.temp_dir.name, "engineering.csv")
+        self.assertEqual(compressed.export_file(destination, departments=["Engineering"]), 2)
+        self.assertEqual([e.employee_id for e in FileHandler.read_employees(destination)], ["101", "103"])
+
+    def test_unsupported_manifest_version(self):
+        """
+        Test that a manifest from another version of the format is rejected.
+        """
+        os.makedirs(self.directory)
+        with open(os.path.join(self.directory, MANIFEST_NAME), mode='w', encoding='utf-8') as file:
+            file.write('{"version": 99, "shards": []}')
+        with self.assertRaises(ValueError):
+            self.storage.load()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Unit tests for the JSON query service in query_server.py.
+"""
+
+import unittest
+import unittest.mock
+import http.client
+import json
+import sys
+import os
+import tempfile
+import threading
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import query_server
+from employee import Employee
+from employee_store import EmployeeStore
+from file_handler import FileHandler
+from query_server import QueryServer, RosterService
+
+HEADER = "employee_id,first_name,last_name,department,job_title\n"
+
+class TestQueryServer(unittest.TestCase):
+    """
+    Contains tests for lookups, listings, caching and reloading.
+    """
+
+    def setUp(self):
+        """
+        Set up a server on a free port over a small roster.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.source = os.path.join(self.temp_dir.name, "employees.csv")
+        with open(self.source, mode='w', newline='', encoding='utf-8') as file:
+            file.write(HEADER + "101,Jane,Doe,Engineering,Developer\n"
+                                "102,John,Smith,Marketing,Manager\n"
+                                "103,Mary,Jones,Engineering,Manager\n")
+        self.service = RosterService(self.source)
+        self.server = QueryServer(("127.0.0.1", 0), self.service)
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.connection = http.client.HTTPConnection(*self.server.server_address[:2], timeout=10)
+        self.addCleanup(self.connection.close)
+
+    def get(self, path, headers=None):
+        """
+        Sends a GET over the kept-alive connection and returns the response and its body.
+        """
+        self.connection.request("GET", path, headers=headers or {})
+        response = self.connection.getresponse()
+        return response, response.read()
+
+    def test_lookup_by_id(self):
+        """
+        Test that an employee is found by ID and an unknown ID gets 404.
+        """
+        response, body = self.get("/employees/102")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(body)["last_name"], "Smith")
+        self.assertEqual(self.get("/employees/999")[0].status, 404)
+
+    def test_listing_filters_and_pages(self):
+        """
+        Test that listings filter by department and job title and page with offset and limit.
+        """
+        document = json.loads(self.get("/employees?department=Engineering&offset=1&limit=1")[1])
+        self.assertEqual((document["total"], document["offset"], document["limit"]), (2, 1, 1))
+        self.assertEqual([row["employee_id"] for row in document["employees"]], ["103"])
+
+        document = json.loads(self.get("/employees?department=Engineering&job_title=Manager")[1])
+        self.assertEqual([row["employee_id"] for row in document["employees"]], ["103"])
+        self.assertEqual(json.loads(self.get("/employees?job_title=Nobody")[1])["total"], 0)
+        self.assertEqual(json.loads(self.get("/departments")[1])["departments"],
+                         {"Engineering": 2, "Marketing": 1})
+
+    def test_bad_requests(self):
+        """
+        Test that bad parameters and unknown paths are rejected.
+        """
+        self.assertEqual(self.get("/employees?limit=-1")[0].status, 400)
+        # "²" passes str.isdigit() but is not a number int() accepts.
+        self.assertEqual(self.get("/employees?limit=%C2%B2")[0].status, 400)
+        self.assertEqual(self.get(f"/employees?limit={query_server.MAX_LIMIT + 1}")[0].status, 400)
+        self.assertEqual(self.get("/employees?dept=HR")[0].status, 400)
+        self.assertEqual(self.get("/nowhere")[0].status, 404)
+
+    def test_streamed_page(self):
+        """
+        Test that a page longer than STREAM_ROWS is sent chunked and decodes in full.
+        """
+        with unittest.mock.patch("query_server.STREAM_ROWS", 2):
+            response, body = self.get("/employees")
+        self.assertEqual(response.getheader("Transfer-Encoding"), "chunked")
+        document = json.loads(body)
+        self.assertEqual([row["employee_id"] for row in document["employees"]], ["101", "102", "103"])
+        self.assertEqual(document["total"], 3)
+        self.assertEqual(self.get("/status")[0].status, 200)
+
+    def test_etag_until_the_file_changes(self):
+        """
+        Test that If-None-Match gets 304 until rows are appended, and a new ETag after.
+        """
+        response, _ = self.get("/employees?department=Marketing")
+        etag = response.getheader("ETag")
+        response, body = self.get("/employees?department=Marketing", {"If-None-Match": etag})
+        self.assertEqual((response.status, body), (304, b""))
+
+        with open(self.source, mode='a', newline='', encoding='utf-8') as file:
+            file.write("104,Tom,Lee,Marketing,Analyst\n")
+        self.assertTrue(self.service.refresh())
+        response, body = self.get("/employees?department=Marketing", {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+        self.assertNotEqual(response.getheader("ETag"), etag)
+        self.assertEqual(json.loads(body)["total"], 2)
+        self.assertFalse(self.service.refresh())
+
+    def test_reload_after_rewrite(self):
+        """
+        Test that a rewritten file replaces the roster.
+        """
+        with open(self.source, mode='w', newline='', encoding='utf-8') as file:
+            file.write(HEADER + "201,Ann,Wu,HR,Recruiter\n")
+        self.assertTrue(self.service.refresh())
+        self.assertEqual(json.loads(self.get("/status")[1])["employees"], 1)
+        self.assertEqual(self.get("/employees/101")[0].status, 404)
+
+    def test_serves_snapshot(self):
+        """
+        Test that a binary snapshot is served and a rewrite of it is picked up.
+        """
+        snapshot_path = os.path.join(self.temp_dir.name, "employees.snap")
+        # 200 rows put a byte that is not valid UTF-8 into the snapshot's header.
+        store = EmployeeStore(Employee(str(i), "First", "Last", "Dept", "Title") for i in range(200))
+        FileHandler.write_employees_atomic(snapshot_path, store)
+        service = RosterService(snapshot_path)
+        self.assertEqual(service.roster.get("7")[0], "7")
+        self.assertFalse(service.refresh())
+
+        store.append_row(["200", "Tom", "Lee", "HR", "Recruiter"])
+        FileHandler.write_employees_atomic(snapshot_path, store)
+        self.assertTrue(service.refresh())
+        self.assertEqual(len(service.roster.repository), 201)
+
+if __name__ == '__main__':
+    unittest.main()
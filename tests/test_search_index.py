@@ -0,0 +1,74 @@
+"""
+Unit tests for the SearchIndex class in search_index.py.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from employee_repository import EmployeeRepository
+from search_index import SearchIndex
+
+class TestSearchIndex(unittest.TestCase):
+    """
+    Contains tests for prefix search over employee details.
+    """
+
+    def setUp(self):
+        """
+        Set up a repository with a search index attached.
+        """
+        self.repository = EmployeeRepository([
+            Employee("101", "Jane", "Doe", "Engineering", "Software Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager"),
+            Employee("103", "Mary", "Jones", "Engineering", "Manager")
+        ])
+        self.index = SearchIndex()
+        self.repository.attach(self.index)
+
+    def test_prefix_matches_any_field(self):
+        """
+        Tests that a prefix of any word in any field finds the employee, ignoring case.
+        """
+        self.assertEqual(self.index.search("j"), {"101", "102", "103"})
+        self.assertEqual(self.index.search("JA"), {"101"})
+        self.assertEqual(self.index.search("eng"), {"101", "103"})
+        self.assertEqual(self.index.search("dev"), {"101"})
+        self.assertEqual(self.index.search("xyz"), set())
+        self.assertEqual(self.index.search("   "), set())
+
+    def test_multiple_words_must_all_match(self):
+        """
+        Tests that every word of a query narrows the result.
+        """
+        self.assertEqual(self.index.search("man eng"), {"103"})
+        self.assertEqual(self.index.search("j m"), {"102", "103"})
+        self.assertEqual(self.index.search("jane marketing"), set())
+
+    def test_follows_repository_changes(self):
+        """
+        Tests that adds, updates and deletes are reflected without rebuilding.
+        """
+        self.repository.add(Employee("104", "Janet", "Brown", "Sales", "Clerk"))
+        self.assertEqual(self.index.search("jan"), {"101", "104"})
+        self.repository.update(Employee("102", "John", "Smith", "Sales", "Manager"))
+        self.assertEqual(self.index.search("sales"), {"102", "104"})
+        self.assertEqual(self.index.search("marketing"), set())
+        self.repository.delete("104")
+        self.assertEqual(self.index.search("jan"), {"101"})
+        self.assertEqual(self.index.search("clerk"), set())
+
+    def test_removing_last_user_drops_word(self):
+        """
+        Tests that words no employee uses any more leave the index.
+        """
+        words = len(self.index)
+        self.repository.delete("102")
+        self.assertEqual(len(self.index), words - 3)  # john, smith, marketing
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the binary snapshot format in snapshot.py.
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from file_handler import FileHandler
+from snapshot import SnapshotFormatError, read_snapshot, write_snapshot
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Contains tests for writing, reading and detecting snapshot files.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory and some sample employees.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.employees = [
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "Zoë", "", "Marketing", "Manager"),
+            Employee("103", "Mary", "Jones", "Engineering", "")
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def write(self, name, employees):
+        with open(self.path(name), "wb") as file:
+            write_snapshot(file, employees)
+        return self.path(name)
+
+    def test_round_trip(self):
+        """
+        Tests that every field, including empty and non-ASCII ones, survives a round trip.
+        """
+        store = read_snapshot(self.write("roster.snap", self.employees))
+        self.assertEqual([emp.to_list() for emp in store], [emp.to_list() for emp in self.employees])
+        self.assertEqual(store.departments(), ["Engineering", "Marketing"])
+
+    def test_empty_roster(self):
+        """
+        Tests that a snapshot with no employees round-trips.
+        """
+        self.assertEqual(len(read_snapshot(self.write("empty.snap", []))), 0)
+
+    def test_rejects_nul_in_fields(self):
+        """
+        Tests that a NUL character in a field is refused rather than corrupting the file.
+        """
+        with self.assertRaises(ValueError):
+            self.write("bad.snap", [Employee("1", "A\0B", "C", "D", "E")])
+
+    def test_rejects_corrupt_files(self):
+        """
+        Tests that non-snapshot and truncated files raise SnapshotFormatError.
+        """
+        with open(self.path("not.snap"), "w") as file:
+            file.write("employee_id,first_name\n")
+        with self.assertRaises(SnapshotFormatError):
+            read_snapshot(self.path("not.snap"))
+
+        path = self.write("full.snap", self.employees)
+        with open(path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(data[:-3])
+        with self.assertRaises(SnapshotFormatError):
+            read_snapshot(path)
+
+    def test_file_handler_detects_format(self):
+        """
+        Tests that FileHandler picks the snapshot format by extension and by magic bytes.
+        """
+        FileHandler.write_employees(self.path("roster.snap"), self.employees)
+        self.assertEqual(len(FileHandler.read_employees(self.path("roster.snap"))), 3)
+
+        shutil.copy(self.path("roster.snap"), self.path("roster.dat"))
+        self.assertEqual(FileHandler.read_employees(self.path("roster.dat"))[1].first_name, "Zoë")
+
+        batches = list(FileHandler.iter_employees(self.path("roster.snap"), batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    def test_atomic_write(self):
+        """
+        Tests that write_employees_atomic writes snapshots too.
+        """
+        written = FileHandler.write_employees_atomic(self.path("roster.snap"), self.employees)
+        self.assertEqual(written, 3)
+        self.assertEqual(len(FileHandler.read_store(self.path("roster.snap"))), 3)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["roster.snap"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Unit tests for the SortOrders class in sort_orders.py.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from employee_repository import EmployeeRepository
+from sort_orders import SortOrders
+
+class TestSortOrders(unittest.TestCase):
+    """
+    Contains tests for cached, incrementally maintained sort orders.
+    """
+
+    def setUp(self):
+        """
+        Set up a repository with sort orders attached.
+        """
+        self.repository = EmployeeRepository([
+            Employee("100", "Mary", "Jones", "Engineering", "Manager"),
+            Employee("99", "Jane", "Doe", "Marketing", "Developer"),
+            Employee("101", "John", "Smith", "Engineering", "Analyst")
+        ])
+        self.orders = SortOrders(self.repository)
+        self.repository.attach(self.orders)
+
+    def test_orders_each_column(self):
+        """
+        Tests ascending and descending orders, with numeric ordering of IDs.
+        """
+        self.assertEqual(list(self.orders.order("employee_id")), ["99", "100", "101"])
+        self.assertEqual(list(self.orders.order("last_name")), ["99", "100", "101"])
+        self.assertEqual(list(self.orders.order("first_name", descending=True)), ["100", "101", "99"])
+        # Equal departments keep roster order.
+        self.assertEqual(list(self.orders.order("department")), ["100", "101", "99"])
+        self.assertEqual(list(self.orders.order("job_title")), ["101", "99", "100"])
+        with self.assertRaises(ValueError):
+            self.orders.order("salary")
+
+    def test_cached_orders_follow_changes(self):
+        """
+        Tests that adds, updates and deletes are placed into a cached order.
+        """
+        by_last_name = self.orders.order("last_name")
+        descending = self.orders.order("department", descending=True)
+        self.repository.add(Employee("102", "Ann", "Brown", "Sales", "Clerk"))
+        self.assertEqual(list(by_last_name), ["102", "99", "100", "101"])
+        self.assertEqual(descending[0], "102")
+        self.repository.update(Employee("99", "Jane", "Young", "Marketing", "Developer"))
+        self.assertEqual(list(by_last_name), ["102", "100", "101", "99"])
+        self.repository.delete("100")
+        self.assertEqual(list(by_last_name), ["102", "101", "99"])
+        self.assertEqual(list(descending), ["102", "99", "101"])
+
+    def test_sort_subset(self):
+        """
+        Tests ordering a subset of IDs, such as search results.
+        """
+        self.assertEqual(self.orders.sort({"101", "99"}, "last_name"), ["99", "101"])
+        self.assertEqual(self.orders.sort({"101", "99"}, "last_name", descending=True), ["101", "99"])
+        for number in range(200, 260):
+            self.repository.add(Employee(str(number), "Ann", f"Name{number}", "Sales", "Clerk"))
+        # Few IDs relative to the roster are sorted directly rather than filtered.
+        self.assertEqual(self.orders.sort({"101", "99", "250"}, "last_name"), ["99", "250", "101"])
+
+if __name__ == '__main__':
+    unittest.main()
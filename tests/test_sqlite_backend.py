@@ -0,0 +1,127 @@
+"""
+Unit tests for the SQLiteHandler class in sqlite_backend.py.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from file_handler import FileHandler
+from sqlite_backend import SQLiteHandler, connect
+
+class TestSQLiteHandler(unittest.TestCase):
+    """
+    Contains tests for the SQLite storage backend, using a temporary database.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory with a database holding three employees.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "employees.db")
+        self.employees = [
+            Employee("103", "Mary", "Jones", "Engineering", "Manager"),
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager")
+        ]
+        self.database = SQLiteHandler(self.db_path)
+        self.database.write_employees(self.employees)
+
+    def tearDown(self):
+        self.database.close()
+        self.temp_dir.cleanup()
+
+    def ids(self, employees):
+        return [emp.employee_id for emp in employees]
+
+    def test_round_trip_keeps_order(self):
+        """
+        Tests that employees come back in the order they were written.
+        """
+        self.assertEqual([emp.to_list() for emp in self.database.read_employees()],
+                         [emp.to_list() for emp in self.employees])
+        batches = list(self.database.iter_employees(batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+
+    def test_write_replaces_contents(self):
+        """
+        Tests that write_employees replaces, rather than appends to, the roster.
+        """
+        self.database.write_employees(self.employees[:1])
+        self.assertEqual(self.database.count(), 1)
+
+    def test_queries(self):
+        """
+        Tests lookups by ID, department and job title.
+        """
+        self.assertEqual(self.database.get("101").first_name, "Jane")
+        self.assertIsNone(self.database.get("999"))
+        self.assertEqual(self.ids(self.database.by_department("Engineering")), ["103", "101"])
+        self.assertEqual(self.ids(self.database.by_job_title("Manager")), ["103", "102"])
+
+    def test_add_skips_existing_ids(self):
+        """
+        Tests that adding employees keeps the first row for each ID.
+        """
+        added = self.database.add_employees([
+            Employee("101", "Copy", "Doe", "HR", "Recruiter"),
+            Employee("104", "Ian", "Martinez", "HR", "Recruiter")
+        ])
+        self.assertEqual(added, 1)
+        self.assertEqual(self.database.get("101").first_name, "Jane")
+
+    def test_csv_import_and_export(self):
+        """
+        Tests streaming a CSV file in and back out.
+        """
+        csv_path = os.path.join(self.temp_dir.name, "in.csv")
+        FileHandler.write_employees(csv_path, [Employee("201", "Ann", "Lee", "Sales", "Rep")])
+        self.assertEqual(self.database.import_csv(csv_path), 1)
+        self.assertEqual(self.database.count(), 4)
+        self.assertEqual(self.database.import_csv(csv_path, replace=True), 1)
+        self.assertEqual(self.database.count(), 1)
+
+        out_path = os.path.join(self.temp_dir.name, "out.csv")
+        self.assertEqual(self.database.export_csv(out_path), 1)
+        self.assertEqual(FileHandler.read_employees(out_path)[0].to_list(), ["201", "Ann", "Lee", "Sales", "Rep"])
+
+    def test_schema(self):
+        """
+        Tests that the database runs in WAL mode with the expected indexes.
+        """
+        connection = connect(self.db_path)
+        try:
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            indexes = {row[1] for row in connection.execute("PRAGMA index_list(employees)")}
+            self.assertIn("idx_employees_department", indexes)
+            self.assertIn("idx_employees_job_title", indexes)
+            plan = connection.execute("EXPLAIN QUERY PLAN SELECT * FROM employees WHERE employee_id = '1'").fetchall()
+            self.assertIn("INDEX", str(plan))
+        finally:
+            connection.close()
+
+    def test_read_only(self):
+        """
+        Tests that a read-only handler reads an existing database, cannot write,
+        and never creates a missing one.
+        """
+        with SQLiteHandler(self.db_path, read_only=True) as database:
+            self.assertEqual(database.get("102").last_name, "Smith")
+            self.assertEqual(database.count(), 3)
+            with self.assertRaises(sqlite3.OperationalError):
+                database.add_employees([Employee("104", "Ian", "Martinez", "HR", "Recruiter")])
+
+        missing = os.path.join(self.temp_dir.name, "missing.db")
+        with self.assertRaises(sqlite3.OperationalError):
+            SQLiteHandler(missing, read_only=True)
+        self.assertFalse(os.path.exists(missing))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,8 @@ import os
 # Add the parent directory to the Python path to allow module imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from validator import is_valid_employee_id, is_present
+from validator import (is_valid_employee_id, is_present, BatchValidator, validate_rows,
+                       MISSING_FIELD, INVALID_ID, DUPLICATE_ID, EXISTING_ID)
 
 class TestValidator(unittest.TestCase):
     """
@@ -41,5 +42,65 @@ class TestValidator(unittest.TestCase):
         self.assertFalse(is_present("   "))
         self.assertFalse(is_present(None))
 
+class TestBatchValidator(unittest.TestCase):
+    """
+    Contains tests for validating batches of rows.
+    """
+
+    def test_clean_batch(self):
+        """
+        Tests that a clean batch produces an empty report.
+        """
+        report = validate_rows([["101", "Jane", "Doe", "Engineering", "Developer"],
+                                ["102", "John", "Smith", "Marketing", "Manager"]])
+        self.assertTrue(report.ok)
+        self.assertEqual(report.rows_checked, 2)
+        self.assertEqual(report.summary(), "All 2 rows are valid.")
+
+    def test_reports_each_problem_with_row_numbers(self):
+        """
+        Tests missing fields, bad IDs and duplicates, reported against the given row numbers.
+        """
+        rows = [
+            ["101", "Jane", "Doe", "Engineering", "Developer"],
+            ["10a", "John", "Smith", "Marketing", "Manager"],
+            ["103", "  ", "Jones", None, "Manager"],
+            ["101", "Copy", "Doe", "Engineering", "Developer"],
+            ["200", "Old", "Timer", "HR", "Recruiter"],
+        ]
+        report = validate_rows(rows, existing_ids={"200"}, row_numbers=[2, 3, 4, 5, 6])
+        self.assertFalse(report.ok)
+        self.assertEqual([(issue.row, issue.field, issue.problem) for issue in report.issues], [
+            (3, "employee_id", INVALID_ID),
+            (4, "first_name", MISSING_FIELD),
+            (4, "department", MISSING_FIELD),
+            (5, "employee_id", DUPLICATE_ID),
+            (6, "employee_id", EXISTING_ID),
+        ])
+        self.assertEqual(report.invalid_rows(), {3, 4, 5, 6})
+        self.assertEqual([issue.field for issue in report.issues_for(4)], ["first_name", "department"])
+        self.assertEqual(report.issues_for(2), [])
+        self.assertEqual(report.counts()[MISSING_FIELD], 2)
+        self.assertTrue(report.summary().startswith("4 of 5 rows are invalid"))
+
+    def test_ids_are_remembered_across_batches(self):
+        """
+        Tests that a later batch may not reuse an ID, unless its first use was invalid.
+        """
+        validator = BatchValidator()
+        validator.validate([["101", "Jane", "Doe", "Engineering", "Developer"],
+                            ["102", "", "Smith", "Marketing", "Manager"]])
+        report = validator.validate([["101", "A", "B", "C", "D"], ["102", "John", "Smith", "Marketing", "Manager"]])
+        self.assertEqual([issue.problem for issue in report.issues], [DUPLICATE_ID])
+        self.assertEqual(validator.seen_ids, {"101", "102"})
+
+    def test_validate_columns_checks_shape(self):
+        """
+        Tests that columnar input must have one column per field.
+        """
+        with self.assertRaises(ValueError):
+            BatchValidator().validate_columns([["101"]])
+        self.assertTrue(BatchValidator().validate([]).ok)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for the scrolling logic in virtual_treeview.py.
+
+The RowWindow class has no Tk dependency, so it can be tested without a display.
+"""
+
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path to allow module imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from employee import Employee
+from employee_repository import EmployeeRepository
+from virtual_treeview import EmployeeSubset, RowWindow
+
+class TestRowWindow(unittest.TestCase):
+    """
+    Contains tests for the virtual-scrolling window arithmetic.
+    """
+
+    def setUp(self):
+        """
+        Set up a window showing 10 rows out of 100.
+        """
+        self.window = RowWindow(total=100, size=10)
+
+    def test_initial_window(self):
+        """
+        Tests that the window starts at the top.
+        """
+        self.assertEqual(self.window.visible(), range(0, 10))
+        self.assertEqual(self.window.fractions(), (0.0, 0.1))
+
+    def test_scroll_is_clamped(self):
+        """
+        Tests scrolling by rows and pages never moves past either end.
+        """
+        self.window.scroll(5)
+        self.assertEqual(self.window.visible(), range(5, 15))
+        self.window.scroll_pages(20)
+        self.assertEqual(self.window.visible(), range(90, 100))
+        self.window.scroll(-1000)
+        self.assertEqual(self.window.first, 0)
+
+    def test_moveto(self):
+        """
+        Tests that dragging the scrollbar maps a fraction onto a row index.
+        """
+        self.window.moveto(0.5)
+        self.assertEqual(self.window.visible(), range(50, 60))
+        self.window.moveto(1.0)
+        self.assertEqual(self.window.visible(), range(90, 100))
+
+    def test_short_source(self):
+        """
+        Tests a source with fewer rows than fit in the window.
+        """
+        self.window.resize(total=3)
+        self.assertEqual(self.window.visible(), range(0, 3))
+        self.assertEqual(self.window.fractions(), (0.0, 1.0))
+        self.window.resize(total=0)
+        self.assertEqual(self.window.visible(), range(0, 0))
+
+class TestEmployeeSubset(unittest.TestCase):
+    """
+    Contains tests for showing a subset of a repository.
+    """
+
+    def test_rows_follow_ids_after_delete(self):
+        """
+        Tests that the subset shows the chosen employees even after rows move.
+        """
+        repository = EmployeeRepository([
+            Employee("101", "Jane", "Doe", "Engineering", "Developer"),
+            Employee("102", "John", "Smith", "Marketing", "Manager"),
+            Employee("103", "Mary", "Jones", "Engineering", "Manager")
+        ])
+        subset = EmployeeSubset(repository, ["103", "102"])
+        self.assertEqual(len(subset), 2)
+        self.assertEqual(subset.row(0)[1], "Mary")
+        repository.delete("101")
+        self.assertEqual([subset.row(0)[0], subset.row(1)[0]], ["103", "102"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,271 @@
+"""
+Defines the EmployeeTable widget, a Treeview that can display very large rosters.
+
+The table reads rows from a source object that supports len() and row(index),
+such as EmployeeRepository. It works in one of two modes:
+
+    Normal mode: every row is a Treeview item. Added rows are inserted as new
+    items instead of rebuilding the whole tree.
+
+    Virtual mode: only the rows that fit in the window exist as Treeview items.
+    Scrolling refills those items from the source, so the cost of a refresh
+    depends on the window height, not on the size of the roster.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Protocol, Sequence
+
+# Fallback sizes used before Tk has reported real ones.
+DEFAULT_ROW_HEIGHT = 20
+HEADING_HEIGHT = 25
+WHEEL_SCROLL_UNITS = 3
+
+
+class RowSource(Protocol):
+    """
+    Anything the table can display rows from.
+    """
+    def __len__(self) -> int: ...
+    def row(self, index: int) -> list[str]: ...
+
+
+class EmployeeSubset:
+    """
+    A RowSource showing chosen employees of a repository, such as search results.
+
+    Rows are looked up by employee ID, so the subset stays valid when deleting
+    another employee moves rows around in the repository.
+
+    Attributes:
+        repository: An EmployeeRepository, or anything with position() and row().
+        employee_ids (Sequence[str]): The IDs to show, in display order.
+    """
+
+    def __init__(self, repository, employee_ids: Sequence[str]):
+        self.repository = repository
+        self.employee_ids = employee_ids
+
+    def __len__(self) -> int:
+        return len(self.employee_ids)
+
+    def row(self, index: int) -> list[str]:
+        return self.repository.row(self.repository.position(self.employee_ids[index]))
+
+
+class RowWindow:
+    """
+    Tracks which slice of a long list of rows is visible.
+
+    This holds the scrolling arithmetic for virtual mode and has no Tk dependency.
+
+    Attributes:
+        first (int): Index of the first visible row.
+        total (int): Number of rows in the source.
+        size (int): Number of rows that fit in the window.
+    """
+
+    def __init__(self, total: int = 0, size: int = 1):
+        self.first = 0
+        self.total = total
+        self.size = max(1, size)
+
+    def resize(self, total: int | None = None, size: int | None = None):
+        """
+        Updates the row count and/or window size, keeping the window in range.
+        """
+        if total is not None:
+            self.total = total
+        if size is not None:
+            self.size = max(1, size)
+        self._clamp()
+
+    def scroll(self, rows: int):
+        """
+        Moves the window by a number of rows (negative scrolls up).
+        """
+        self.first += rows
+        self._clamp()
+
+    def scroll_pages(self, pages: int):
+        """
+        Moves the window by a number of whole windows.
+        """
+        self.scroll(pages * self.size)
+
+    def moveto(self, fraction: float):
+        """
+        Moves the window so it starts at a fraction of the total rows, as a
+        scrollbar drag does.
+        """
+        self.first = int(fraction * self.total)
+        self._clamp()
+
+    def visible(self) -> range:
+        """
+        Returns the indexes of the rows currently in the window.
+        """
+        return range(self.first, min(self.first + self.size, self.total))
+
+    def fractions(self) -> tuple[float, float]:
+        """
+        Returns the (top, bottom) fractions to pass to Scrollbar.set().
+        """
+        if self.total == 0:
+            return 0.0, 1.0
+        return self.first / self.total, min(1.0, (self.first + self.size) / self.total)
+
+    def _clamp(self):
+        self.first = max(0, min(self.first, self.total - self.size))
+
+
+class EmployeeTable(ttk.Frame):
+    """
+    A scrollable Treeview of employee rows with incremental and virtual rendering.
+
+    Attributes:
+        tree (ttk.Treeview): The underlying Treeview widget.
+        virtual (bool): Whether the table runs in virtual-scrolling mode.
+    """
+
+    def __init__(self, master, columns: tuple[str, ...], source: RowSource, virtual: bool = False,
+                 on_heading_click: Callable[[int], None] | None = None, **kwargs):
+        """
+        Initialises the table and its scrollbar.
+
+        Args:
+            master: The parent widget.
+            columns (tuple[str, ...]): The column headings.
+            source (RowSource): Where rows are read from.
+            virtual (bool): If True, only create Treeview items for visible rows.
+            on_heading_click (Callable[[int], None] | None): Called with the
+                column index when a heading is clicked, e.g. to sort by it.
+        """
+        super().__init__(master, **kwargs)
+        self.source = source
+        self.virtual = virtual
+        self.window = RowWindow()
+        self.columns = columns
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        for index, col in enumerate(columns):
+            self.tree.heading(col, text=col)
+            if on_heading_click is not None:
+                self.tree.heading(col, command=lambda index=index: on_heading_click(index))
+            self.tree.column(col, width=150)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL)
+        if virtual:
+            self.scrollbar.configure(command=self._on_scrollbar)
+            self.tree.bind("<Configure>", self._on_resize)
+            self.tree.bind("<MouseWheel>", self._on_mousewheel)
+            self.tree.bind("<Button-4>", lambda event: self._scroll(-WHEEL_SCROLL_UNITS))
+            self.tree.bind("<Button-5>", lambda event: self._scroll(WHEEL_SCROLL_UNITS))
+        else:
+            self.scrollbar.configure(command=self.tree.yview)
+            self.tree.configure(yscroll=self.scrollbar.set)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def set_source(self, source: RowSource):
+        """
+        Displays rows from a different source.
+        """
+        self.source = source
+        self.refresh()
+
+    def refresh(self):
+        """
+        Redraws the table from the source.
+
+        In normal mode this rebuilds every item; in virtual mode it only redraws
+        the visible window.
+        """
+        if self.virtual:
+            self.window.resize(total=len(self.source))
+            self._render_window()
+            return
+        self.tree.delete(*self.tree.get_children())
+        for index in range(len(self.source)):
+            values = self.source.row(index)
+            self.tree.insert("", tk.END, iid=values[0], values=values)
+
+    def show_sort_indicator(self, column: int | None, descending: bool = False):
+        """
+        Marks the heading of the column the rows are sorted by, or clears the mark.
+        """
+        for index, col in enumerate(self.columns):
+            arrow = (" \u25bc" if descending else " \u25b2") if index == column else ""
+            self.tree.heading(col, text=col + arrow)
+
+    def row_added(self, index: int):
+        """
+        Shows a row that was just added to the source at `index`.
+        """
+        if self.virtual:
+            self.window.resize(total=len(self.source))
+            if index in self.window.visible():
+                self._render_window()
+            else:
+                self.scrollbar.set(*self.window.fractions())
+            return
+        values = self.source.row(index)
+        self.tree.insert("", tk.END, iid=values[0], values=values)
+
+    def rows_appended(self, start: int):
+        """
+        Shows every row from `start` to the end of the source, after a bulk append.
+        """
+        if self.virtual:
+            self.window.resize(total=len(self.source))
+            if start < self.window.visible().stop:
+                self._render_window()
+            else:
+                self.scrollbar.set(*self.window.fractions())
+            return
+        for index in range(start, len(self.source)):
+            values = self.source.row(index)
+            self.tree.insert("", tk.END, iid=values[0], values=values)
+
+    def _render_window(self):
+        """
+        Fills the Treeview items for the visible window from the source.
+        """
+        visible = self.window.visible()
+        items = list(self.tree.get_children())
+        if len(items) > len(visible):
+            self.tree.delete(*items[len(visible):])
+            del items[len(visible):]
+        while len(items) < len(visible):
+            items.append(self.tree.insert("", tk.END))
+        for item, index in zip(items, visible):
+            self.tree.item(item, values=self.source.row(index))
+        self.scrollbar.set(*self.window.fractions())
+
+    def _visible_row_count(self) -> int:
+        row_height = ttk.Style(self).lookup("Treeview", "rowheight")
+        row_height = int(row_height) if row_height else DEFAULT_ROW_HEIGHT
+        return (self.tree.winfo_height() - HEADING_HEIGHT) // row_height
+
+    def _scroll(self, rows: int):
+        self.window.scroll(rows)
+        self._render_window()
+
+    def _on_resize(self, event):
+        self.window.resize(total=len(self.source), size=self._visible_row_count())
+        self._render_window()
+
+    def _on_mousewheel(self, event):
+        self._scroll(-WHEEL_SCROLL_UNITS if event.delta > 0 else WHEEL_SCROLL_UNITS)
+
+    def _on_scrollbar(self, action: str, amount: str, unit: str | None = None):
+        """
+        Handles the scrollbar's "moveto" and "scroll" commands.
+        """
+        if action == tk.MOVETO:
+            self.window.moveto(float(amount))
+        elif unit == tk.PAGES:
+            self.window.scroll_pages(int(amount))
+        else:
+            self.window.scroll(int(amount))
+        self._render_window()